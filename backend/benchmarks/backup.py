@@ -0,0 +1,177 @@
+"""backup_quiz / restore_quiz throughput against dumpdata on a seeded database.
+
+Run from backend/: python benchmarks/backup.py [--students 20000] [--questions 50]
+
+The defaults seed one exam with a million answers on a scratch SQLite
+database, then run each command in its own process and report wall time,
+rows per second, peak resident memory and output size. restore_quiz loads the
+archive into a second, freshly migrated database and the row counts of both
+are compared.
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+SCRATCH = Path(tempfile.mkdtemp(prefix="quiz-backup-bench-"))
+
+SQLITE = "{'ENGINE': 'django.db.backends.sqlite3', 'NAME': %r}"
+(SCRATCH / "bench_settings.py").write_text(
+    "from config.settings import *  # noqa\n"
+    f"DATABASES = {{'default': {SQLITE % str(SCRATCH / 'a.sqlite3')},\n"
+    f"    'restored': {SQLITE % str(SCRATCH / 'b.sqlite3')}}}\n"
+    "DATABASE_ROUTERS = []\n"
+    "QUIZ_SLOW_QUERY_MS = -1\n"
+)
+sys.path.insert(0, str(BACKEND))
+sys.path.insert(0, str(SCRATCH))
+os.environ["DJANGO_SETTINGS_MODULE"] = "bench_settings"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+for name in ("DJANGO_SUPERUSER_USERNAME", "DJANGO_SUPERUSER_PASSWORD"):
+    os.environ.pop(name, None)
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.contrib.auth.hashers import make_password  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+from django.utils import timezone  # noqa: E402
+
+from quiz.backup import backup_models  # noqa: E402
+from quiz.models import (  # noqa: E402
+    Exam,
+    Question,
+    Result,
+    StudentAnswer,
+    StudentExamAttempt,
+    UserProfile,
+    UserRole,
+)
+
+
+def seed(students: int, questions: int, batch: int = 5000) -> None:
+    User = get_user_model()
+    password = make_password("bench-password")
+    teacher = User.objects.create_user("teacher", password="bench-password")
+    UserProfile.objects.filter(user=teacher).update(role=UserRole.TEACHER)
+    exam = Exam.objects.create(title="Bench", exam_code="BENCH", created_by=teacher)
+    Question.objects.bulk_create(
+        Question(
+            exam=exam,
+            question_text=f"Question {number}",
+            option_a="a",
+            option_b="b",
+            option_c="c",
+            option_d="d",
+            correct_option="ABCD"[number % 4],
+        )
+        for number in range(questions)
+    )
+    question_ids = list(exam.questions.values_list("id", flat=True))
+    now = timezone.now()
+    for start in range(0, students, batch):
+        users = User.objects.bulk_create(
+            User(username=f"student-{number}", password=password)
+            for number in range(start, min(start + batch, students))
+        )
+        UserProfile.objects.bulk_create(UserProfile(user=user) for user in users)
+        attempts = StudentExamAttempt.objects.bulk_create(
+            StudentExamAttempt(exam=exam, student=user, submitted_at=now) for user in users
+        )
+        StudentAnswer.objects.bulk_create(
+            (
+                StudentAnswer(
+                    attempt=attempt,
+                    question_id=question_id,
+                    selected_option="ABCD"[(attempt.id + question_id) % 4],
+                )
+                for attempt in attempts
+                for question_id in question_ids
+            ),
+            batch_size=batch,
+        )
+        Result.objects.bulk_create(
+            Result(attempt=attempt, total_marks=questions, obtained_marks=attempt.id % questions)
+            for attempt in attempts
+        )
+
+
+def row_counts(using: str) -> dict:
+    return {
+        model._meta.label_lower: model._base_manager.using(using).count()
+        for model in backup_models()
+    }
+
+
+def run(*args: str) -> tuple[float, float]:
+    """Run a manage.py command; return wall seconds and peak RSS in MB.
+
+    The peak is polled from VmHWM because ru_maxrss carries over the
+    high-water mark of this (already large) process through fork and exec.
+    """
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join([str(SCRATCH), str(BACKEND)])}
+    started = time.perf_counter()
+    process = subprocess.Popen(
+        [sys.executable, "manage.py", *args],
+        cwd=BACKEND,
+        env=env,
+        stdout=subprocess.DEVNULL,
+    )
+    status = Path(f"/proc/{process.pid}/status")
+    peak_kb = 0
+    while process.poll() is None:
+        try:
+            for line in status.read_text().splitlines():
+                if line.startswith("VmHWM:"):
+                    peak_kb = max(peak_kb, int(line.split()[1]))
+        except (OSError, ValueError):
+            pass
+        time.sleep(0.05)
+    elapsed = time.perf_counter() - started
+    if process.returncode:
+        raise RuntimeError(f"manage.py {args[0]} failed")
+    return elapsed, peak_kb / 1024
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=20000)
+    parser.add_argument("--questions", type=int, default=50)
+    parser.add_argument("--skip-dumpdata", action="store_true")
+    options = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    call_command("migrate", database="restored", verbosity=0)
+    seed(options.students, options.questions)
+    counts = row_counts("default")
+    total = sum(counts.values())
+    print(f"seeded {total:,} rows ({counts['quiz.studentanswer']:,} answers)")
+
+    archive = SCRATCH / "quiz.ndjson.gz"
+    dump = SCRATCH / "dump.json.gz"
+    runs = [
+        ("backup_quiz", ("backup_quiz", str(archive)), archive),
+        ("restore_quiz", ("restore_quiz", str(archive), "--database", "restored"), None),
+    ]
+    if not options.skip_dumpdata:
+        models = [model._meta.label_lower for model in backup_models()]
+        runs.append(("dumpdata", ("dumpdata", *models, "-o", str(dump)), dump))
+
+    print(f"{'command':<14} {'seconds':>8} {'rows/s':>10} {'peak MB':>8} {'output MB':>10}")
+    for name, args, output in runs:
+        elapsed, peak = run(*args)
+        size = f"{output.stat().st_size / 2**20:>10.1f}" if output else f"{'':>10}"
+        print(f"{name:<14} {elapsed:>8.1f} {total / elapsed:>10,.0f} {peak:>8.0f} {size}")
+
+    restored = row_counts("restored")
+    print("restored row counts match" if restored == counts else f"MISMATCH: {restored}")
+
+
+if __name__ == "__main__":
+    main()
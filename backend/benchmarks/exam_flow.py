@@ -0,0 +1,233 @@
+"""Exam-flow throughput and memory of gunicorn configurations.
+
+Run from backend/: python benchmarks/exam_flow.py [--students 60] [--concurrency 12]
+
+Each configuration starts gunicorn with gunicorn.conf.py on a scratch SQLite
+database and drives every student through csrf, login, join, questions and
+submit. Passwords use the MD5 hasher and throttles are off, so the numbers
+reflect the server configuration rather than hashing cost (see
+login_throughput.py for that). Memory is the proportional set size of the
+master and its workers, which counts copy-on-write pages shared after preload
+once.
+"""
+import argparse
+import json
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+SCRATCH = Path(tempfile.mkdtemp(prefix="quiz-bench-"))
+PASSWORD = "bench-password"
+
+(SCRATCH / "bench_settings.py").write_text(
+    "from config.settings import *  # noqa\n"
+    "DATABASES = {'default': {'ENGINE': 'django.db.backends.sqlite3',\n"
+    f"    'NAME': {str(SCRATCH / 'db.sqlite3')!r}, 'OPTIONS': {{'timeout': 30}}}}}}\n"
+    "PASSWORD_HASHERS = ['django.contrib.auth.hashers.MD5PasswordHasher']\n"
+    "QUIZ_THROTTLE_RATES = {}\n"
+    "QUIZ_SLOW_QUERY_MS = -1\n"
+    "ALLOWED_HOSTS = ['127.0.0.1']\n"
+    "SESSION_COOKIE_SECURE = CSRF_COOKIE_SECURE = False\n"
+    "SESSION_COOKIE_DOMAIN = CSRF_COOKIE_DOMAIN = None\n"
+)
+sys.path.insert(0, str(BACKEND))
+sys.path.insert(0, str(SCRATCH))
+os.environ["DJANGO_SETTINGS_MODULE"] = "bench_settings"
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.contrib.auth import get_user_model  # noqa: E402
+from django.core.management import call_command  # noqa: E402
+
+from quiz.models import Exam, Question, UserProfile, UserRole  # noqa: E402
+
+CPUS = os.cpu_count() or 1
+DEFAULT_CONFIGS = [
+    f"sync:{CPUS + 1}:1:0",
+    f"gthread:{CPUS + 1}:4:0",
+    f"gthread-preload:{CPUS + 1}:4:1",
+]
+
+
+def seed(name: str, students: int, questions: int) -> tuple[str, list[str]]:
+    User = get_user_model()
+    teacher = User.objects.create_user(f"{name}-teacher", password=PASSWORD)
+    UserProfile.objects.filter(user=teacher).update(role=UserRole.TEACHER)
+    exam = Exam.objects.create(title=name, exam_code=name.upper(), created_by=teacher)
+    Question.objects.bulk_create(
+        Question(
+            exam=exam,
+            question_text=f"Question {number}",
+            option_a="a",
+            option_b="b",
+            option_c="c",
+            option_d="d",
+            correct_option="ABCD"[number % 4],
+        )
+        for number in range(questions)
+    )
+    usernames = [f"{name}-student-{number}" for number in range(students)]
+    for username in usernames:
+        User.objects.create_user(username, password=PASSWORD)
+    return exam.exam_code, usernames
+
+
+def free_port() -> int:
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def start_server(workers: int, threads: int, preload: bool, port: int) -> subprocess.Popen:
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join([str(SCRATCH), str(BACKEND)]),
+        "GUNICORN_BIND": f"127.0.0.1:{port}",
+        "GUNICORN_WORKERS": str(workers),
+        "GUNICORN_THREADS": str(threads),
+        "GUNICORN_PRELOAD": "1" if preload else "0",
+        "GUNICORN_ACCESS_LOG": "",
+        "GUNICORN_LOG_LEVEL": "warning",
+    }
+    server = subprocess.Popen(
+        [sys.executable, "-m", "gunicorn", "config.wsgi:application", "-c", "gunicorn.conf.py"],
+        cwd=BACKEND,
+        env=env,
+    )
+    deadline = time.monotonic() + 30
+    while time.monotonic() < deadline:
+        try:
+            urllib.request.urlopen(f"http://127.0.0.1:{port}/api/health/", timeout=1)
+            return server
+        except OSError:
+            time.sleep(0.2)
+    server.kill()
+    raise RuntimeError("gunicorn did not start")
+
+
+def memory_mb(pid: int) -> float:
+    pids = [pid]
+    children = Path(f"/proc/{pid}/task/{pid}/children")
+    if children.exists():
+        pids += [int(child) for child in children.read_text().split()]
+    total_kb = 0
+    for process in pids:
+        rollup = Path(f"/proc/{process}/smaps_rollup")
+        status = rollup if rollup.exists() else Path(f"/proc/{process}/status")
+        field = "Pss:" if rollup.exists() else "VmRSS:"
+        for line in status.read_text().splitlines():
+            if line.startswith(field):
+                total_kb += int(line.split()[1])
+                break
+    return total_kb / 1024
+
+
+class Client:
+    def __init__(self, base: str):
+        self.base = base
+        self.cookies = CookieJar()
+        self.opener = urllib.request.build_opener(urllib.request.HTTPCookieProcessor(self.cookies))
+        self.latencies = []
+
+    def csrf(self) -> str:
+        return next((cookie.value for cookie in self.cookies if cookie.name == "csrftoken"), "")
+
+    def call(self, method: str, path: str, payload=None):
+        data = json.dumps(payload).encode() if payload is not None else None
+        request = urllib.request.Request(self.base + path, data=data, method=method)
+        request.add_header("Content-Type", "application/json")
+        request.add_header("X-CSRFToken", self.csrf())
+        started = time.perf_counter()
+        try:
+            with self.opener.open(request, timeout=60) as response:
+                body = response.read()
+        finally:
+            self.latencies.append(time.perf_counter() - started)
+        return json.loads(body) if body else None
+
+
+def exam_flow(base: str, exam_code: str, username: str) -> tuple[list[float], bool]:
+    client = Client(base)
+    try:
+        client.call("GET", "/api/auth/csrf/")
+        client.call("POST", "/api/auth/login/", {"username": username, "password": PASSWORD})
+        attempt = client.call("POST", "/api/exams/join/", {"exam_code": exam_code})
+        questions = client.call("GET", f"/api/attempts/{attempt['id']}/questions/")
+        answers = [{"question": question["id"], "selected_option": "A"} for question in questions]
+        client.call("POST", f"/api/attempts/{attempt['id']}/submit/", {"answers": answers})
+    except (urllib.error.URLError, OSError):
+        return client.latencies, False
+    return client.latencies, True
+
+
+def run_config(spec: str, options) -> dict:
+    name, workers, threads, preload = spec.split(":")
+    exam_code, usernames = seed(name, options.students, options.questions)
+    port = free_port()
+    server = start_server(int(workers), int(threads), preload == "1", port)
+    base = f"http://127.0.0.1:{port}"
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options.concurrency) as pool:
+            outcomes = list(pool.map(lambda username: exam_flow(base, exam_code, username), usernames))
+        elapsed = time.perf_counter() - started
+        memory = memory_mb(server.pid)
+    finally:
+        server.terminate()
+        server.wait(timeout=30)
+    latencies = sorted(latency for flow, _ in outcomes for latency in flow)
+    completed = sum(ok for _, ok in outcomes)
+    return {
+        "name": name,
+        "workers": workers,
+        "threads": threads,
+        "flows_per_s": completed / elapsed,
+        "p50_ms": statistics.median(latencies) * 1000,
+        "p95_ms": latencies[int(len(latencies) * 0.95) - 1] * 1000,
+        "errors": len(outcomes) - completed,
+        "memory_mb": memory,
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--students", type=int, default=60)
+    parser.add_argument("--concurrency", type=int, default=12)
+    parser.add_argument("--questions", type=int, default=50)
+    parser.add_argument(
+        "--config",
+        action="append",
+        dest="configs",
+        help="name:workers:threads:preload (repeatable)",
+    )
+    options = parser.parse_args()
+
+    call_command("migrate", verbosity=0)
+    print(
+        f"{'config':<16} {'workers':>7} {'threads':>7} {'flows/s':>8} "
+        f"{'p50 ms':>7} {'p95 ms':>7} {'errors':>6} {'memory MB':>9}"
+    )
+    for spec in options.configs or DEFAULT_CONFIGS:
+        result = run_config(spec, options)
+        print(
+            f"{result['name']:<16} {result['workers']:>7} {result['threads']:>7} "
+            f"{result['flows_per_s']:>8.1f} {result['p50_ms']:>7.1f} {result['p95_ms']:>7.1f} "
+            f"{result['errors']:>6} {result['memory_mb']:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
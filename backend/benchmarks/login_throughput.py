@@ -0,0 +1,66 @@
+"""Password verifications per second per core for each hasher profile.
+
+Run from backend/: python benchmarks/login_throughput.py [--seconds 3] [--threads N]
+
+Verification is the CPU cost of a login, so this bounds the logins per second
+one worker core can serve. Profiles whose hasher library is not installed
+(argon2-cffi) are reported as skipped.
+"""
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
+os.environ.setdefault("SECRET_KEY", "benchmark")
+
+import django  # noqa: E402
+
+django.setup()
+
+from django.conf import settings  # noqa: E402
+from django.contrib.auth.hashers import check_password, make_password  # noqa: E402
+from django.test import override_settings  # noqa: E402
+
+
+def verifications_per_second(encoded: str, seconds: float, threads: int) -> float:
+    deadline = time.perf_counter() + seconds
+
+    def worker() -> int:
+        done = 0
+        while time.perf_counter() < deadline:
+            check_password("correct horse battery staple", encoded)
+            done += 1
+        return done
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=threads) as pool:
+        total = sum(pool.map(lambda _: worker(), range(threads)))
+    return total / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--seconds", type=float, default=3.0)
+    parser.add_argument("--threads", type=int, default=os.cpu_count() or 1)
+    options = parser.parse_args()
+
+    print(f"{'profile':<10} {'hash':<28} {'1 thread/s':>11} {options.threads:>3} threads/s")
+    for profile, hashers in settings.PASSWORD_HASHER_PROFILES.items():
+        with override_settings(PASSWORD_HASHERS=hashers):
+            try:
+                encoded = make_password("correct horse battery staple")
+            except ValueError as exc:
+                print(f"{profile:<10} skipped: {exc}")
+                continue
+            prefix = "$".join(encoded.split("$")[:2])
+            single = verifications_per_second(encoded, options.seconds, 1)
+            parallel = verifications_per_second(encoded, options.seconds, options.threads)
+        print(f"{profile:<10} {prefix:<28} {single:>11.1f} {parallel:>13.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+"""Cold-start cost of one worker: imports, django.setup() and the WSGI app.
+
+Run from backend/: python benchmarks/startup.py [--runs 10]
+
+Each run is a fresh interpreter, as a newly forked or restarted gunicorn
+worker would be, and reports how long it spends before it can serve its
+first request. The query count shows whether startup touches the database.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+BACKEND = Path(__file__).resolve().parent.parent
+
+PROBE = """
+import json, time
+started = time.perf_counter()
+import django
+from django.db import connections
+imported = time.perf_counter()
+queries = []
+
+def count(execute, sql, params, many, context):
+    queries.append(sql)
+    return execute(sql, params, many, context)
+
+for connection in connections.all():
+    connection.execute_wrappers.append(count)
+django.setup()
+setup = time.perf_counter()
+from config.wsgi import application
+wsgi = time.perf_counter()
+print(json.dumps({
+    "import_django_ms": (imported - started) * 1000,
+    "setup_ms": (setup - imported) * 1000,
+    "wsgi_ms": (wsgi - setup) * 1000,
+    "total_ms": (wsgi - started) * 1000,
+    "queries": len(queries),
+}))
+"""
+
+
+def run_once() -> dict:
+    env = {
+        **os.environ,
+        "DJANGO_SETTINGS_MODULE": "config.settings",
+        "SECRET_KEY": os.environ.get("SECRET_KEY", "benchmark"),
+    }
+    output = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=BACKEND,
+        env=env,
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=10)
+    options = parser.parse_args()
+
+    runs = [run_once() for _ in range(options.runs)]
+    print(f"{'phase':<18} {'median ms':>10} {'max ms':>8}")
+    for phase in ("import_django_ms", "setup_ms", "wsgi_ms", "total_ms"):
+        values = [run[phase] for run in runs]
+        print(f"{phase:<18} {statistics.median(values):>10.1f} {max(values):>8.1f}")
+    print(f"{'queries':<18} {max(run['queries'] for run in runs):>10}")
+
+
+if __name__ == "__main__":
+    main()
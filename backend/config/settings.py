@@ -5,6 +5,7 @@ Production-safe for Render + Netlify frontend
 
 import os
 from pathlib import Path
+from corsheaders.defaults import default_headers
 from dotenv import load_dotenv
 
 # --------------------------------------------------
@@ -70,6 +71,9 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "quiz.middleware.ReplicaStickinessMiddleware",
+    "quiz.middleware.SlowQueryLogMiddleware",
+    "quiz.middleware.ProfilingMiddleware",
 ]
 
 
@@ -115,6 +119,42 @@ DATABASES = {
     }
 }
 
+# Optional read replica for read endpoints marked quiz.routers.replica_reads.
+# A user's reads stay on the primary for QUIZ_REPLICA_STICKY_SECONDS after
+# each of their writes so replication lag never hides their own changes.
+DATABASE_REPLICA_NAME = os.getenv("DATABASE_REPLICA_NAME", "")
+if DATABASE_REPLICA_NAME:
+    DATABASES["replica"] = {
+        **DATABASES["default"],
+        "NAME": DATABASE_REPLICA_NAME,
+        "TEST": {"MIRROR": "default"},
+    }
+DATABASE_ROUTERS = ["quiz.routers.ReplicaRouter"]
+QUIZ_REPLICA_STICKY_SECONDS = int(os.getenv("QUIZ_REPLICA_STICKY_SECONDS", "10"))
+
+
+# --------------------------------------------------
+# Cache
+# --------------------------------------------------
+
+# LocMemCache is per-process, so gunicorn.conf.py runs a single worker unless
+# REDIS_URL points every worker at a shared instance and its invalidations.
+REDIS_URL = os.getenv("REDIS_URL", "")
+
+if REDIS_URL:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        }
+    }
+
 
 # --------------------------------------------------
 # Password validation
@@ -128,6 +168,28 @@ AUTH_PASSWORD_VALIDATORS = [
 ]
 
 
+# Hasher profiles: "default" is Django's PBKDF2, "tuned" is PBKDF2 with
+# QUIZ_PBKDF2_ITERATIONS (which can only raise Django's count; 0 keeps it),
+# "argon2" needs the argon2-cffi package. Hashes in any listed format keep
+# working and move to the first one on next login.
+_DJANGO_DEFAULT_HASHERS = [
+    "django.contrib.auth.hashers.PBKDF2PasswordHasher",
+    "django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher",
+    "django.contrib.auth.hashers.Argon2PasswordHasher",
+    "django.contrib.auth.hashers.BCryptSHA256PasswordHasher",
+    "django.contrib.auth.hashers.ScryptPasswordHasher",
+]
+PASSWORD_HASHER_PROFILES = {
+    "default": _DJANGO_DEFAULT_HASHERS,
+    "tuned": ["quiz.hashers.TunedPBKDF2PasswordHasher", *_DJANGO_DEFAULT_HASHERS],
+    "argon2": ["django.contrib.auth.hashers.Argon2PasswordHasher", *_DJANGO_DEFAULT_HASHERS],
+}
+PASSWORD_HASHERS = PASSWORD_HASHER_PROFILES[
+    os.getenv("QUIZ_PASSWORD_HASHER_PROFILE", "default").lower()
+]
+QUIZ_PBKDF2_ITERATIONS = int(os.getenv("QUIZ_PBKDF2_ITERATIONS", "0"))
+
+
 # --------------------------------------------------
 # Internationalization
 # --------------------------------------------------
@@ -158,10 +220,16 @@ DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 # Django REST Framework
 # --------------------------------------------------
 
+# Throttles identify anonymous clients by X-Forwarded-For. Left unset, DRF
+# trusts the whole header, which any client can spoof; NUM_PROXIES is the
+# number of proxies in front of gunicorn (Render has one).
+NUM_PROXIES = os.getenv("NUM_PROXIES", "1" if os.getenv("RENDER") else "")
+
 REST_FRAMEWORK = {
     "DEFAULT_AUTHENTICATION_CLASSES": [
         "rest_framework.authentication.SessionAuthentication",
     ],
+    "NUM_PROXIES": int(NUM_PROXIES) if NUM_PROXIES else None,
 }
 
 
@@ -173,6 +241,8 @@ CORS_ALLOW_ALL_ORIGINS = False
 CORS_ALLOW_CREDENTIALS = True
 
 CORS_ALLOWED_ORIGINS = get_list("CORS_ALLOWED_ORIGINS")
+# Idempotency-Key lets a retried exam submission replay its stored result.
+CORS_ALLOW_HEADERS = (*default_headers, "idempotency-key")
 CSRF_TRUSTED_ORIGINS = get_list("CSRF_TRUSTED_ORIGINS")
 
 # Local development defaults
@@ -217,3 +287,138 @@ CSRF_COOKIE_HTTPONLY = False
 
 SECURE_PROXY_SSL_HEADER = ("HTTP_X_FORWARDED_PROTO", "https")
 USE_X_FORWARDED_HOST = True
+
+
+# --------------------------------------------------
+# Quiz
+# --------------------------------------------------
+
+# Seconds a cached answer key may live; question edits also evict it.
+QUIZ_ANSWER_KEY_TIMEOUT = int(os.getenv("QUIZ_ANSWER_KEY_TIMEOUT", "3600"))
+
+# Answer storage for new exams: "ROWS" (one StudentAnswer per answer) or
+# "PACKED" (one string per attempt). Existing exams are moved with
+# `manage.py convert_answer_storage`.
+QUIZ_ANSWER_STORAGE = os.getenv("QUIZ_ANSWER_STORAGE", "ROWS").upper()
+
+# Deleting an exam only hides it; its rows are removed in batches of
+# QUIZ_PURGE_BATCH_SIZE by a background thread and/or
+# `manage.py purge_deleted_exams`.
+QUIZ_PURGE_IN_BACKGROUND = os.getenv("QUIZ_PURGE_IN_BACKGROUND", "True").lower() == "true"
+QUIZ_PURGE_BATCH_SIZE = int(os.getenv("QUIZ_PURGE_BATCH_SIZE", "1000"))
+
+# Retention: `manage.py archive_old_exams` moves the answers of inactive exams
+# older than QUIZ_ARCHIVE_AFTER_DAYS into one gzip file per exam under
+# QUIZ_ARCHIVE_DIR and deletes them from the database; attempts and results
+# stay. `manage.py restore_archived_exam` brings the answers back.
+QUIZ_ARCHIVE_AFTER_DAYS = int(os.getenv("QUIZ_ARCHIVE_AFTER_DAYS", "365"))
+QUIZ_ARCHIVE_DIR = os.getenv("QUIZ_ARCHIVE_DIR", str(BASE_DIR / "archives"))
+
+# Teacher exam and question lists return everything unless the client sends
+# ?limit= or ?cursor=; pages default to QUIZ_PAGE_SIZE rows.
+QUIZ_PAGE_SIZE = int(os.getenv("QUIZ_PAGE_SIZE", "25"))
+QUIZ_MAX_PAGE_SIZE = int(os.getenv("QUIZ_MAX_PAGE_SIZE", "100"))
+
+# Item analysis is cached until a new result arrives; this is only a ceiling.
+QUIZ_ANALYTICS_TIMEOUT = int(os.getenv("QUIZ_ANALYTICS_TIMEOUT", "86400"))
+
+# Timed exams: submissions are accepted this long after the deadline to
+# absorb network latency; later ones are graded from saved answers. Each
+# gunicorn worker closes attempts nobody submitted every QUIZ_SWEEP_INTERVAL
+# seconds (0 turns that off; `manage.py sweep_expired_attempts` does the same
+# by hand or from cron on the same machine).
+QUIZ_SUBMIT_GRACE_SECONDS = int(os.getenv("QUIZ_SUBMIT_GRACE_SECONDS", "30"))
+QUIZ_SWEEP_BATCH_SIZE = int(os.getenv("QUIZ_SWEEP_BATCH_SIZE", "200"))
+QUIZ_SWEEP_INTERVAL = float(os.getenv("QUIZ_SWEEP_INTERVAL", "15"))
+
+# Token-bucket admission control for the exam-start hot paths. Rates are
+# "<burst>/<period>" (s, min or hour); the bucket refills at that rate.
+# "memory" buckets are per worker process, "cache" shares them via CACHES.
+# Logins are limited per submitted username, not per address: a school lab
+# behind one NAT address logs in together. The "ip" bucket only stops a
+# single address spraying many usernames.
+QUIZ_THROTTLE_BACKEND = os.getenv("QUIZ_THROTTLE_BACKEND", "memory")
+QUIZ_THROTTLE_RATES = {
+    "login": {"user": "10/min", "ip": "600/min", "global": "20/s"},
+    "join": {"user": "10/min", "global": "50/s"},
+    "submit": {"user": "10/min", "global": "50/s"},
+}
+
+# Waiting room for scheduled exams: from Exam.starts_at, admission slots open
+# at QUIZ_WAITING_ROOM_RATE students per second in arrival order. Tickets
+# live in the cache, so use a shared cache (REDIS_URL) with several workers.
+QUIZ_WAITING_ROOM_RATE = float(os.getenv("QUIZ_WAITING_ROOM_RATE", "20"))
+QUIZ_WAITING_ROOM_MAX_POLL = int(os.getenv("QUIZ_WAITING_ROOM_MAX_POLL", "10"))
+QUIZ_WAITING_ROOM_SNAPSHOT_TIMEOUT = int(os.getenv("QUIZ_WAITING_ROOM_SNAPSHOT_TIMEOUT", "30"))
+QUIZ_WAITING_ROOM_TICKET_TIMEOUT = int(os.getenv("QUIZ_WAITING_ROOM_TICKET_TIMEOUT", "86400"))
+
+# Live exam activity over Server-Sent Events. Each open stream holds a worker
+# thread, so streams end after QUIZ_EVENT_STREAM_MAX_SECONDS and the browser
+# reconnects, and a worker serves at most QUIZ_EVENT_STREAMS_PER_WORKER (half
+# its GUNICORN_THREADS by default) so the rest stay free for requests.
+# Events cross worker processes only through REDIS_URL's pub/sub; without
+# it, run a single worker.
+QUIZ_EVENT_STREAM_HEARTBEAT = int(os.getenv("QUIZ_EVENT_STREAM_HEARTBEAT", "15"))
+QUIZ_EVENT_STREAM_MAX_SECONDS = int(os.getenv("QUIZ_EVENT_STREAM_MAX_SECONDS", "300"))
+QUIZ_EVENT_STREAMS_PER_WORKER = int(
+    os.getenv(
+        "QUIZ_EVENT_STREAMS_PER_WORKER",
+        str(max(1, int(os.getenv("GUNICORN_THREADS", "4")) // 2)),
+    )
+)
+
+# Results never change except through `manage.py regrade_exam`, which evicts
+# them, so they are cached at grading time for QUIZ_RESULT_CACHE_TIMEOUT and
+# browsers may reuse them for QUIZ_RESULT_MAX_AGE before revalidating by ETag.
+# Evictions from the regrade command or another worker only reach a shared
+# cache, so results are cached only when REDIS_URL is set.
+QUIZ_RESULT_CACHE = os.getenv("QUIZ_RESULT_CACHE", "true" if REDIS_URL else "false").lower() == "true"
+QUIZ_RESULT_CACHE_TIMEOUT = int(os.getenv("QUIZ_RESULT_CACHE_TIMEOUT", str(7 * 24 * 3600)))
+QUIZ_RESULT_MAX_AGE = int(os.getenv("QUIZ_RESULT_MAX_AGE", "300"))
+
+# Request profiling: staff add ?profile=1 (or X-Profile: 1) to a request;
+# QUIZ_PROFILE_SAMPLE_RATE also profiles that fraction of all requests.
+# Captures rotate in QUIZ_PROFILE_DIR; see `manage.py profile_summary`.
+QUIZ_PROFILE_SAMPLE_RATE = float(os.getenv("QUIZ_PROFILE_SAMPLE_RATE", "0"))
+QUIZ_PROFILE_DIR = Path(os.getenv("QUIZ_PROFILE_DIR", BASE_DIR / "profiles"))
+QUIZ_PROFILE_MAX_FILES = int(os.getenv("QUIZ_PROFILE_MAX_FILES", "200"))
+
+# Slow query log: statements over QUIZ_SLOW_QUERY_MS (-1 disables) are written
+# as JSON lines to QUIZ_SLOW_QUERY_LOG, rotated at QUIZ_SLOW_QUERY_LOG_BYTES.
+# Group them with `manage.py slow_query_report`.
+QUIZ_SLOW_QUERY_MS = float(os.getenv("QUIZ_SLOW_QUERY_MS", "200"))
+QUIZ_SLOW_QUERY_LOG = Path(os.getenv("QUIZ_SLOW_QUERY_LOG", BASE_DIR / "slow_queries.log"))
+QUIZ_SLOW_QUERY_LOG_BYTES = int(os.getenv("QUIZ_SLOW_QUERY_LOG_BYTES", str(10 * 1024 * 1024)))
+QUIZ_SLOW_QUERY_LOG_BACKUPS = int(os.getenv("QUIZ_SLOW_QUERY_LOG_BACKUPS", "5"))
+
+LOGGING = {
+    "version": 1,
+    "disable_existing_loggers": False,
+    "formatters": {
+        "json_lines": {"format": "%(message)s"},
+    },
+    "handlers": {
+        "console": {
+            "class": "logging.StreamHandler",
+        },
+        "slow_queries": {
+            "class": "logging.handlers.RotatingFileHandler",
+            "filename": QUIZ_SLOW_QUERY_LOG,
+            "maxBytes": QUIZ_SLOW_QUERY_LOG_BYTES,
+            "backupCount": QUIZ_SLOW_QUERY_LOG_BACKUPS,
+            "delay": True,
+            "formatter": "json_lines",
+        },
+    },
+    "loggers": {
+        "quiz": {
+            "handlers": ["console"],
+            "level": "INFO",
+        },
+        "quiz.slow_queries": {
+            "handlers": ["slow_queries"],
+            "level": "WARNING",
+            "propagate": False,
+        },
+    },
+}
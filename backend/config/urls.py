@@ -8,13 +8,24 @@ from .views import health_check
 urlpatterns = [
     path("admin/", admin.site.urls),
     path("api/health/", health_check, name="api-health"),
+    path(
+        "api/metrics/throttles/",
+        quiz_views.throttle_metrics_view,
+        name="api-metrics-throttles",
+    ),
     path("api/auth/csrf/", quiz_views.csrf_token, name="api-csrf"),
     path("api/auth/login/", quiz_views.login_view, name="api-login"),
     path("api/auth/signup/", quiz_views.signup_view, name="api-signup"),
     path("api/auth/logout/", quiz_views.logout_view, name="api-logout"),
     path("api/auth/me/", quiz_views.me_view, name="api-me"),
+    path("api/bootstrap/", quiz_views.bootstrap_view, name="api-bootstrap"),
     path("api/exams/", quiz_views.exams_view, name="api-exams"),
     path("api/exams/<int:exam_id>/", quiz_views.exam_delete_view, name="api-exam-delete"),
+    path(
+        "api/exams/<int:exam_id>/clone/",
+        quiz_views.exam_clone_view,
+        name="api-exam-clone",
+    ),
     path(
         "api/exams/<int:exam_id>/status/",
         quiz_views.exam_status_view,
@@ -30,12 +41,37 @@ urlpatterns = [
         quiz_views.exam_results_view,
         name="api-exam-results",
     ),
+    path(
+        "api/exams/<int:exam_id>/events/",
+        quiz_views.exam_events_view,
+        name="api-exam-events",
+    ),
+    path(
+        "api/exams/<int:exam_id>/item-analysis/",
+        quiz_views.exam_item_analysis_view,
+        name="api-exam-item-analysis",
+    ),
     path("api/exams/join/", quiz_views.join_exam_view, name="api-exam-join"),
+    path(
+        "api/exams/waiting-room/",
+        quiz_views.waiting_room_view,
+        name="api-exam-waiting-room",
+    ),
     path(
         "api/attempts/<int:attempt_id>/questions/",
         quiz_views.attempt_questions_view,
         name="api-attempt-questions",
     ),
+    path(
+        "api/attempts/<int:attempt_id>/bundle/",
+        quiz_views.attempt_bundle_view,
+        name="api-attempt-bundle",
+    ),
+    path(
+        "api/attempts/<int:attempt_id>/answers/",
+        quiz_views.attempt_answers_view,
+        name="api-attempt-answers",
+    ),
     path(
         "api/attempts/<int:attempt_id>/submit/",
         quiz_views.submit_attempt_view,
@@ -0,0 +1,66 @@
+"""Gunicorn settings for the backend.
+
+Start with ``gunicorn config.wsgi:application -c gunicorn.conf.py`` from
+backend/ (or ``--chdir backend -c backend/gunicorn.conf.py`` from the repo
+root, as on Render). Everything below can be overridden from the environment.
+
+Each worker serves GUNICORN_THREADS requests at once, so long-lived requests
+(event streams, logins waiting on the hashing pool) hold a thread rather than
+a whole process. With GUNICORN_PRELOAD the app is imported once in the master
+and forked, so workers share the imported code copy-on-write.
+"""
+import os
+
+
+def _flag(name: str, default: str) -> bool:
+    return os.getenv(name, default).lower() in {"1", "true", "yes"}
+
+
+cpu_count = os.cpu_count() or 1
+
+bind = os.getenv("GUNICORN_BIND", f"0.0.0.0:{os.getenv('PORT', '8000')}")
+# Caches, throttle buckets, waiting-room counters and the live event broker
+# are per process unless REDIS_URL points them at a shared Redis, so without
+# it a single worker (with its threads) is the default; only an explicit
+# GUNICORN_WORKERS overrides that, not a platform-provided WEB_CONCURRENCY.
+if os.getenv("REDIS_URL"):
+    default_workers = os.getenv("WEB_CONCURRENCY", str(cpu_count + 1))
+else:
+    default_workers = "1"
+workers = int(os.getenv("GUNICORN_WORKERS", default_workers))
+threads = int(os.getenv("GUNICORN_THREADS", "4"))
+worker_class = "gthread" if threads > 1 else "sync"
+preload_app = _flag("GUNICORN_PRELOAD", "true")
+
+# Recycle workers to bound slow memory growth; the jitter keeps them from all
+# restarting at the same moment.
+max_requests = int(os.getenv("GUNICORN_MAX_REQUESTS", "1000"))
+max_requests_jitter = int(os.getenv("GUNICORN_MAX_REQUESTS_JITTER", "100"))
+
+timeout = int(os.getenv("GUNICORN_TIMEOUT", "30"))
+graceful_timeout = int(os.getenv("GUNICORN_GRACEFUL_TIMEOUT", "30"))
+keepalive = int(os.getenv("GUNICORN_KEEPALIVE", "5"))
+
+accesslog = os.getenv("GUNICORN_ACCESS_LOG", "-") or None
+errorlog = "-"
+loglevel = os.getenv("GUNICORN_LOG_LEVEL", "info")
+
+
+def post_fork(server, worker):
+    # A connection opened in the master while preloading must not be shared
+    # by the forked workers; each one opens its own on first use.
+    if server.cfg.preload_app:
+        from django.db import connections
+
+        connections.close_all()
+
+
+def post_worker_init(worker):
+    # Timed-out attempts are graded in the web workers themselves: the
+    # database may be a file only this machine can open.
+    from django.conf import settings
+
+    if settings.QUIZ_SWEEP_INTERVAL > 0:
+        from quiz.sweeper import start_background_sweeper
+
+        start_background_sweeper(settings.QUIZ_SWEEP_INTERVAL)
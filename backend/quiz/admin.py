@@ -1,4 +1,7 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 
 from .models import (
     Exam,
@@ -10,6 +13,38 @@ from .models import (
 )
 
 
+class EstimatedCountPaginator(Paginator):
+    """Paginator that never runs a full COUNT(*) over a large table.
+
+    Unfiltered PostgreSQL changelists use the planner's row estimate; anything
+    else counts at most ``count_cap`` rows, so pages past the cap are not
+    linked (narrow the list with a filter instead).
+    """
+
+    count_cap = 10_000
+
+    @cached_property
+    def count(self) -> int:
+        queryset = self.object_list
+        connection = connections[queryset.db]
+        if connection.vendor == "postgresql" and not queryset.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = %s::regclass",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            # reltuples is -1 until the table has been analyzed.
+            if row and row[0] > self.count_cap:
+                return row[0]
+        return queryset[: self.count_cap].count()
+
+
+class LargeTableAdmin(admin.ModelAdmin):
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ("user", "user_email", "role")
@@ -22,8 +57,62 @@ class UserProfileAdmin(admin.ModelAdmin):
         return obj.user.email
 
 
-admin.site.register(Exam)
-admin.site.register(Question)
-admin.site.register(StudentExamAttempt)
-admin.site.register(StudentAnswer)
-admin.site.register(Result)
+@admin.register(Exam)
+class ExamAdmin(admin.ModelAdmin):
+    list_display = (
+        "title",
+        "exam_code",
+        "created_by",
+        "is_active",
+        "starts_at",
+        "created_at",
+        "deleted_at",
+        "archived_at",
+    )
+    list_select_related = ("created_by",)
+    list_filter = (
+        "is_active",
+        ("deleted_at", admin.EmptyFieldListFilter),
+        ("archived_at", admin.EmptyFieldListFilter),
+    )
+    search_fields = ("exam_code", "title")
+    autocomplete_fields = ("created_by",)
+    show_full_result_count = False
+
+
+@admin.register(Question)
+class QuestionAdmin(LargeTableAdmin):
+    list_display = ("id", "exam", "short_text", "correct_option", "marks")
+    list_select_related = ("exam",)
+    list_filter = ("exam",)
+    search_fields = ("question_text",)
+    autocomplete_fields = ("exam",)
+
+    @admin.display(description="Question")
+    def short_text(self, obj):
+        return obj.question_text[:60]
+
+
+@admin.register(StudentExamAttempt)
+class StudentExamAttemptAdmin(LargeTableAdmin):
+    list_display = ("id", "exam", "student", "started_at", "deadline", "submitted_at")
+    list_select_related = ("exam", "student")
+    list_filter = ("exam",)
+    raw_id_fields = ("exam", "student")
+
+
+@admin.register(StudentAnswer)
+class StudentAnswerAdmin(LargeTableAdmin):
+    # No filters or search: narrow the list by URL, e.g. ?attempt=<id>, which
+    # uses the (attempt, question) unique index.
+    list_display = ("id", "attempt", "question_id", "selected_option")
+    list_select_related = ("attempt__exam", "attempt__student")
+    raw_id_fields = ("attempt", "question")
+
+
+@admin.register(Result)
+class ResultAdmin(LargeTableAdmin):
+    list_display = ("attempt", "obtained_marks", "total_marks", "graded_at")
+    list_select_related = ("attempt__exam", "attempt__student")
+    list_filter = ("attempt__exam",)
+    raw_id_fields = ("attempt",)
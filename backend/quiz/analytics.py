@@ -0,0 +1,132 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Count, Q
+
+from .grading import UNANSWERED, get_answer_key
+from .models import AnswerStorage, Question, Result, StudentAnswer
+from .routers import primary_reads
+
+ITEM_ANALYSIS_CACHE_KEY = "quiz:item-analysis:{exam_id}"
+OPTIONS = [choice.value for choice in Question.Choice]
+
+
+def _quartile_cutoffs(results) -> tuple[int, object, object]:
+    """Return the result count and the bottom/top quartile score cutoffs."""
+    count = results.count()
+    if not count:
+        return 0, None, None
+    quarter = max(count // 4, 1)
+    scores = results.order_by("obtained_marks").values_list("obtained_marks", flat=True)
+    lower = scores[quarter - 1]
+    upper = scores[count - quarter]
+    return count, lower, upper
+
+
+def _row_counts(exam, lower, upper):
+    """Yield ``(question_id, option, total, top, bottom)`` from grouped answers."""
+    rows = (
+        StudentAnswer.objects.filter(attempt__exam=exam, attempt__result__isnull=False)
+        .values("question_id", "selected_option")
+        .annotate(
+            total=Count("id"),
+            top=Count("id", filter=Q(attempt__result__obtained_marks__gte=upper)),
+            bottom=Count("id", filter=Q(attempt__result__obtained_marks__lte=lower)),
+        )
+    )
+    for row in rows:
+        yield row["question_id"], row["selected_option"], row["total"], row["top"], row["bottom"]
+
+
+def _packed_counts(exam, key, lower, upper):
+    """Same as ``_row_counts`` for packed exams, streaming one string per attempt."""
+    counts = {}
+    packed = Result.objects.filter(attempt__exam=exam).values_list(
+        "attempt__packed_answers", "obtained_marks"
+    )
+    for answers, obtained in packed.iterator(chunk_size=2000):
+        for index, selected in enumerate(answers[: len(key)]):
+            if selected == UNANSWERED:
+                continue
+            bucket = counts.setdefault((key.question_ids[index], selected), [0, 0, 0])
+            bucket[0] += 1
+            bucket[1] += obtained >= upper
+            bucket[2] += obtained <= lower
+    for (question_id, selected), (total, top, bottom) in counts.items():
+        yield question_id, selected, total, top, bottom
+
+
+def _ratio(part: int, whole: int) -> float | None:
+    return round(part / whole, 2) if whole else None
+
+
+def build_item_analysis(exam) -> dict:
+    key = get_answer_key(exam)
+    results = Result.objects.filter(attempt__exam=exam)
+    count, lower, upper = _quartile_cutoffs(results)
+    group_sizes = {"top": 0, "bottom": 0}
+    if count:
+        group_sizes = results.aggregate(
+            top=Count("id", filter=Q(obtained_marks__gte=upper)),
+            bottom=Count("id", filter=Q(obtained_marks__lte=lower)),
+        )
+
+    stats = {
+        question_id: {"answered": 0, "options": dict.fromkeys(OPTIONS, 0), "top": 0, "bottom": 0}
+        for question_id in key.question_ids
+    }
+    ordinals = key.ordinals()
+    if exam.answer_storage == AnswerStorage.PACKED:
+        counts = _packed_counts(exam, key, lower, upper)
+    else:
+        counts = _row_counts(exam, lower, upper)
+    if count:
+        for question_id, selected, total, top, bottom in counts:
+            item = stats.get(question_id)
+            if item is None:
+                continue
+            item["answered"] += total
+            item["options"][selected] += total
+            if selected == key.correct_options[ordinals[question_id]]:
+                item["top"] += top
+                item["bottom"] += bottom
+
+    items = []
+    for index, question_id in enumerate(key.question_ids):
+        item = stats[question_id]
+        correct_option = key.correct_options[index]
+        discrimination = None
+        if group_sizes["top"] and group_sizes["bottom"]:
+            discrimination = round(
+                item["top"] / group_sizes["top"] - item["bottom"] / group_sizes["bottom"], 4
+            )
+        items.append(
+            {
+                "question": question_id,
+                "correct_option": correct_option,
+                "percent_correct": _ratio(item["options"][correct_option] * 100, count),
+                "percent_skipped": _ratio((count - item["answered"]) * 100, count),
+                "option_distribution": item["options"],
+                "discrimination_index": discrimination,
+            }
+        )
+    return {
+        "exam": exam.id,
+        "result_count": count,
+        "top_group_size": group_sizes["top"],
+        "bottom_group_size": group_sizes["bottom"],
+        "items": items,
+    }
+
+
+def get_item_analysis(exam) -> dict:
+    cache_key = ITEM_ANALYSIS_CACHE_KEY.format(exam_id=exam.id)
+    analysis = cache.get(cache_key)
+    if analysis is None:
+        with primary_reads():
+            analysis = build_item_analysis(exam)
+        cache.set(cache_key, analysis, settings.QUIZ_ANALYTICS_TIMEOUT)
+    return analysis
+
+
+def invalidate_item_analysis(exam_id: int) -> None:
+    cache.delete(ITEM_ANALYSIS_CACHE_KEY.format(exam_id=exam_id))
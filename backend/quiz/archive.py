@@ -0,0 +1,190 @@
+import gzip
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from .analytics import invalidate_item_analysis
+from .grading import UNANSWERED, build_answer_key, load_answer_maps, pack_answers
+from .models import AnswerStorage, Exam, StudentAnswer, StudentExamAttempt
+from .purge import delete_in_batches
+
+ARCHIVE_VERSION = 1
+
+
+class ArchiveError(Exception):
+    pass
+
+
+def archive_path(exam_id: int) -> Path:
+    return Path(settings.QUIZ_ARCHIVE_DIR) / f"exam-{exam_id}.ndjson.gz"
+
+
+def archivable_exams(cutoff):
+    """Inactive live exams created before ``cutoff`` with every attempt submitted."""
+    open_attempts = StudentExamAttempt.objects.filter(submitted_at__isnull=True)
+    return (
+        Exam.objects.live()
+        .filter(archived_at__isnull=True, is_active=False, created_at__lt=cutoff)
+        .exclude(id__in=open_attempts.values("exam_id"))
+    )
+
+
+def _write_archive(exam, key, batch_size: int) -> int:
+    """Stream the exam into its archive file: a header line, then one line per attempt.
+
+    Answers are packed against the header's ``question_ids`` whatever the
+    exam's storage mode. The file is written beside its final name and moved
+    into place only once it is complete and flushed to disk.
+    """
+    path = archive_path(exam.id)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(path.name + ".partial")
+    attempts = (
+        StudentExamAttempt.objects.filter(exam=exam)
+        .select_related("result")
+        .order_by("id")
+    )
+    written = 0
+    with open(partial, "wb") as raw:
+        with gzip.open(raw, "wt", encoding="utf-8") as stream:
+            header = {
+                "version": ARCHIVE_VERSION,
+                "exam": {"id": exam.id, "exam_code": exam.exam_code, "title": exam.title},
+                "question_ids": list(key.question_ids),
+                "archived_at": timezone.now().isoformat(),
+            }
+            stream.write(json.dumps(header) + "\n")
+            last_id = 0
+            while True:
+                batch = list(attempts.filter(id__gt=last_id)[:batch_size])
+                if not batch:
+                    break
+                last_id = batch[-1].id
+                answer_maps = load_answer_maps(exam, batch, key)
+                for attempt in batch:
+                    result = getattr(attempt, "result", None)
+                    record = {
+                        "attempt": attempt.id,
+                        "student": attempt.student_id,
+                        "submitted_at": attempt.submitted_at and attempt.submitted_at.isoformat(),
+                        "answers": pack_answers(key, answer_maps[attempt.id]),
+                        "result": result
+                        and {
+                            "total_marks": str(result.total_marks),
+                            "obtained_marks": str(result.obtained_marks),
+                            "graded_at": result.graded_at.isoformat(),
+                        },
+                    }
+                    stream.write(json.dumps(record) + "\n")
+                    written += 1
+        raw.flush()
+        os.fsync(raw.fileno())
+    os.replace(partial, path)
+    return written
+
+
+def archive_exam(exam, batch_size: int | None = None) -> int:
+    """Move ``exam``'s answers into its archive file and drop them from the database.
+
+    Returns the number of attempts archived. The exam is claimed before the
+    file is written, which also stops it being reactivated meanwhile.
+    Re-running on an exam already marked archived only finishes removing its
+    answers, so an interrupted run never overwrites its file.
+    """
+    batch_size = batch_size or settings.QUIZ_PURGE_BATCH_SIZE
+    archived = 0
+    if exam.archived_at is None:
+        if exam.attempts.filter(submitted_at__isnull=True).exists():
+            raise ArchiveError("Exam still has attempts in progress.")
+        archived_at = timezone.now()
+        claimed = Exam.objects.filter(
+            id=exam.id, is_active=False, archived_at__isnull=True
+        ).update(archived_at=archived_at)
+        if not claimed:
+            raise ArchiveError("Only inactive exams can be archived.")
+        try:
+            archived = _write_archive(exam, build_answer_key(exam.id), batch_size)
+        except BaseException:
+            Exam.objects.filter(id=exam.id).update(archived_at=None)
+            raise
+        exam.archived_at = archived_at
+    elif not archive_path(exam.id).exists():
+        raise ArchiveError(f"Exam is marked archived but {archive_path(exam.id)} is missing.")
+
+    delete_in_batches(StudentAnswer.objects.filter(attempt__exam_id=exam.id), batch_size)
+    attempts = StudentExamAttempt.objects.filter(exam_id=exam.id).exclude(packed_answers="")
+    while True:
+        ids = list(attempts.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            break
+        StudentExamAttempt.objects.filter(pk__in=ids).update(packed_answers="")
+    invalidate_item_analysis(exam.id)
+    return archived
+
+
+def _read_archive(exam):
+    path = archive_path(exam.id)
+    if not path.exists():
+        raise ArchiveError(f"No archive file at {path}.")
+    with gzip.open(path, "rt", encoding="utf-8") as stream:
+        header = json.loads(next(stream))
+        if header.get("version") != ARCHIVE_VERSION or header["exam"]["id"] != exam.id:
+            raise ArchiveError(f"{path} is not an archive of exam {exam.id}.")
+        yield header
+        for line in stream:
+            yield json.loads(line)
+
+
+def _restore_batch(exam, key, archived_ids: list, current: set, records: list) -> int:
+    answer_maps = {}
+    for record in records:
+        # Answers are packed against the question ids at archiving time.
+        answer_maps[record["attempt"]] = {
+            archived_ids[index]: selected
+            for index, selected in enumerate(record["answers"])
+            if selected != UNANSWERED and archived_ids[index] in current
+        }
+    if exam.answer_storage == AnswerStorage.PACKED:
+        attempts = list(StudentExamAttempt.objects.filter(id__in=answer_maps).only("id"))
+        for attempt in attempts:
+            attempt.packed_answers = pack_answers(key, answer_maps[attempt.id])
+        StudentExamAttempt.objects.bulk_update(attempts, ["packed_answers"])
+    else:
+        StudentAnswer.objects.bulk_create(
+            StudentAnswer(attempt_id=attempt_id, question_id=question_id, selected_option=selected)
+            for attempt_id, answer_map in answer_maps.items()
+            for question_id, selected in answer_map.items()
+        )
+    return len(records)
+
+
+def restore_exam(exam, batch_size: int | None = None) -> int:
+    """Write ``exam``'s archived answers back in its current storage mode.
+
+    Answers to questions deleted since archiving are dropped. Everything runs
+    in one transaction, so a failed restore leaves the exam archived.
+    """
+    if exam.archived_at is None:
+        raise ArchiveError("Exam is not archived.")
+    batch_size = batch_size or settings.QUIZ_PURGE_BATCH_SIZE
+    records = _read_archive(exam)
+    header = next(records)
+    key = build_answer_key(exam.id)
+    current = set(key.question_ids)
+    restored = 0
+    with transaction.atomic():
+        pending = []
+        for record in records:
+            pending.append(record)
+            if len(pending) >= batch_size:
+                restored += _restore_batch(exam, key, header["question_ids"], current, pending)
+                pending = []
+        restored += _restore_batch(exam, key, header["question_ids"], current, pending)
+        Exam.objects.filter(id=exam.id).update(archived_at=None)
+    exam.archived_at = None
+    invalidate_item_analysis(exam.id)
+    return restored
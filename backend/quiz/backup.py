@@ -0,0 +1,218 @@
+import gzip
+import json
+from contextlib import contextmanager
+
+from django.contrib.auth import get_user_model
+from django.core.management.color import no_style
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .analytics import invalidate_item_analysis
+from .models import Exam, Question, Result, StudentAnswer, StudentExamAttempt, UserProfile
+from .results import invalidate_exam_results
+from .waiting_room import invalidate_exam_snapshot
+
+BACKUP_FORMAT = "quiz-backup"
+BACKUP_VERSION = 1
+
+
+class BackupError(Exception):
+    pass
+
+
+def backup_models() -> list:
+    """Models in the archive, parents first so a restore never waits on a child.
+
+    Users are included because every other row hangs off them; their group and
+    permission memberships are not.
+    """
+    return [
+        get_user_model(),
+        UserProfile,
+        Exam,
+        Question,
+        StudentExamAttempt,
+        StudentAnswer,
+        Result,
+    ]
+
+
+def _attnames(model) -> list[str]:
+    return [field.attname for field in model._meta.concrete_fields]
+
+
+def write_backup(fileobj, using: str = "default", chunk_size: int = 2000, compresslevel: int = 6):
+    """Stream every backed-up table into ``fileobj`` as gzip-compressed NDJSON.
+
+    The first line is a header. Each model starts with a ``{"model", "fields"}``
+    line followed by one JSON array per row in primary-key order, read with a
+    chunked iterator so memory stays flat whatever the table size. All tables
+    come from one snapshot, so the app can stay online. Yields
+    ``(label, rows)`` as each model finishes.
+    """
+    encode = json.JSONEncoder(default=str, separators=(",", ":")).encode
+    connection = connections[using]
+    with (
+        transaction.atomic(using=using),
+        gzip.open(fileobj, "wt", encoding="utf-8", compresslevel=compresslevel) as stream,
+    ):
+        # Every table is read in one transaction, so a live database yields a
+        # consistent archive: no answer without its attempt or question.
+        # PostgreSQL needs REPEATABLE READ for one snapshot; SQLite and MySQL
+        # already keep one per transaction.
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ READ ONLY")
+        header = {
+            "format": BACKUP_FORMAT,
+            "version": BACKUP_VERSION,
+            "created_at": timezone.now().isoformat(),
+        }
+        stream.write(encode(header) + "\n")
+        for model in backup_models():
+            fields = _attnames(model)
+            stream.write(encode({"model": model._meta.label_lower, "fields": fields}) + "\n")
+            rows = (
+                model._base_manager.using(using)
+                .order_by("pk")
+                .values_list(*fields)
+                .iterator(chunk_size=chunk_size)
+            )
+            count = 0
+            lines = []
+            for row in rows:
+                lines.append(encode(row))
+                if len(lines) >= chunk_size:
+                    stream.write("\n".join(lines) + "\n")
+                    count += len(lines)
+                    lines = []
+            if lines:
+                stream.write("\n".join(lines) + "\n")
+                count += len(lines)
+            yield model._meta.label_lower, count
+
+
+def _instances(model, fields: list[str], rows: list):
+    # Positional construction is Model.__init__'s fast path; it needs the
+    # archive's columns to be the model's, in order.
+    if fields == _attnames(model):
+        return [model(*row) for row in rows]
+    return [model(**dict(zip(fields, row))) for row in rows]
+
+
+@contextmanager
+def _stored_timestamps(models):
+    """Keep archived auto_now/auto_now_add values; bulk_create would overwrite them.
+
+    This is what loaddata's raw saves get by skipping ``pre_save``. The flags
+    are process-wide, so only management commands should restore.
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for model in models
+        for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or getattr(field, "auto_now_add", False)
+    ]
+    for field, _, _ in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def _invalidate_caches(using: str) -> None:
+    """Drop cached exam data that may predate the restored rows.
+
+    Answer keys and papers need nothing: they are cached under each exam's
+    questions_version, which is restored with the row.
+    """
+    exams = Exam.objects.using(using).values_list("id", "exam_code")
+    for exam_id, exam_code in exams.iterator():
+        invalidate_exam_results(exam_id)
+        invalidate_item_analysis(exam_id)
+        invalidate_exam_snapshot(exam_code)
+
+
+def _clear_tables(models, using: str) -> None:
+    """Empty the backed-up tables, children first.
+
+    Quiz rows are deleted without signals or cascades since every table
+    they hang off is emptied too; users go through the ORM so rows outside
+    the backup that point at them (admin log, group memberships) follow.
+    """
+    _invalidate_caches(using)
+    for model in reversed(models[1:]):
+        model._base_manager.using(using).all()._raw_delete(using)
+    models[0]._base_manager.using(using).all().delete()
+
+
+def read_backup(fileobj, using: str = "default", batch_size: int = 2000, replace: bool = False):
+    """Load an archive from ``write_backup`` into empty tables.
+
+    Rows go in with ``bulk_create`` batches inside one transaction with
+    constraint checks disabled (deferred where the backend can only defer);
+    every table is checked once at the end, then sequences are moved past
+    the restored keys. With ``replace`` the tables are emptied first in the
+    same transaction, so a failed restore keeps the old rows. Yields
+    ``(label, rows)`` as each model finishes.
+    """
+    models = {model._meta.label_lower: model for model in backup_models()}
+    connection = connections[using]
+    if not replace:
+        for model in models.values():
+            if model._base_manager.using(using).exists():
+                raise BackupError(
+                    f"{model._meta.label} already has rows; restore into a freshly "
+                    "migrated database or pass --replace."
+                )
+
+    with gzip.open(fileobj, "rt", encoding="utf-8") as stream:
+        header = json.loads(next(stream, "{}"))
+        if header.get("format") != BACKUP_FORMAT or header.get("version") != BACKUP_VERSION:
+            raise BackupError("Not a quiz backup archive.")
+
+        with (
+            transaction.atomic(using=using),
+            connection.constraint_checks_disabled(),
+            _stored_timestamps(models.values()),
+        ):
+            if replace:
+                _clear_tables(list(models.values()), using)
+            model = fields = None
+            rows = []
+            count = 0
+            for line in stream:
+                if line.startswith("{"):
+                    if model is not None:
+                        model._base_manager.using(using).bulk_create(
+                            _instances(model, fields, rows)
+                        )
+                        yield model._meta.label_lower, count + len(rows)
+                    section = json.loads(line)
+                    model = models.get(section["model"])
+                    if model is None:
+                        raise BackupError(f"Unknown model {section['model']} in archive.")
+                    fields = section["fields"]
+                    rows = []
+                    count = 0
+                    continue
+                rows.append(json.loads(line))
+                if len(rows) >= batch_size:
+                    model._base_manager.using(using).bulk_create(_instances(model, fields, rows))
+                    count += len(rows)
+                    rows = []
+            if model is not None:
+                model._base_manager.using(using).bulk_create(_instances(model, fields, rows))
+                yield model._meta.label_lower, count + len(rows)
+            connection.check_constraints(
+                table_names=[model._meta.db_table for model in models.values()]
+            )
+
+    statements = connection.ops.sequence_reset_sql(no_style(), list(models.values()))
+    if statements:
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
+    _invalidate_caches(using)
@@ -0,0 +1,32 @@
+import logging
+import os
+
+from django.contrib.auth import get_user_model
+from django.db import DEFAULT_DB_ALIAS
+
+logger = logging.getLogger(__name__)
+
+
+def ensure_superuser(using: str = DEFAULT_DB_ALIAS) -> bool:
+    """Create the DJANGO_SUPERUSER_* account if it is configured and missing.
+
+    Returns True when a user was created; safe to call any number of times.
+    """
+    username = os.environ.get("DJANGO_SUPERUSER_USERNAME")
+    password = os.environ.get("DJANGO_SUPERUSER_PASSWORD")
+    email = os.environ.get("DJANGO_SUPERUSER_EMAIL", "")
+    if not username or not password:
+        return False
+
+    User = get_user_model()
+    if User.objects.db_manager(using).filter(username=username).exists():
+        return False
+    User.objects.db_manager(using).create_superuser(
+        username=username, email=email, password=password
+    )
+    logger.info("Created superuser %s", username)
+    return True
+
+
+def create_superuser_after_migrate(sender, using=DEFAULT_DB_ALIAS, **kwargs):
+    ensure_superuser(using)
@@ -0,0 +1,73 @@
+import hashlib
+
+from django.core import signing
+
+from .grading import UNANSWERED, AnswerKey
+from .models import Question
+from .papers import get_student_paper
+from .serializers import StudentExamAttemptSerializer
+from .shuffling import Shuffle, display_order, shuffle_paper
+
+BUNDLE_SALT = "quiz.bundle"
+VALID_LETTERS = frozenset(Question.Choice.values) | {UNANSWERED}
+
+
+class BundleError(Exception):
+    pass
+
+
+def paper_digest(key: AnswerKey, shuffle: Shuffle | None) -> str:
+    """Fingerprint of the question and option order a packed string aligns to."""
+    digest = hashlib.sha256(repr(display_order(key, shuffle)).encode())
+    if shuffle is not None:
+        digest.update("".join(shuffle.option_orders).encode())
+    return digest.hexdigest()[:32]
+
+
+def build_bundle(attempt, key: AnswerKey, shuffle: Shuffle | None) -> dict:
+    """Paper and attempt metadata for offline use, with a signed token.
+
+    The token binds the attempt, the student and the paper digest; it comes
+    back with a packed submission so the server can trust the alignment
+    without looking anything up.
+    """
+    digest = paper_digest(key, shuffle)
+    token = signing.dumps(
+        {"attempt": attempt.id, "student": attempt.student_id, "paper": digest},
+        salt=BUNDLE_SALT,
+    )
+    return {
+        "attempt": StudentExamAttemptSerializer(attempt).data,
+        "questions": shuffle_paper(get_student_paper(attempt.exam), key, shuffle),
+        "paper_digest": digest,
+        "token": token,
+    }
+
+
+def parse_packed_answers(
+    attempt, key: AnswerKey, shuffle: Shuffle | None, packed, token
+) -> dict[int, str]:
+    """Verify a bundle token and turn ``packed`` into an answer map.
+
+    ``packed`` holds one letter per question in bundle order, "-" for a
+    skipped question; trailing skips may be left out. Letters are returned
+    as displayed, before any option unshuffling.
+    """
+    if not isinstance(token, str):
+        raise BundleError("Invalid bundle token.")
+    try:
+        claims = signing.loads(token, salt=BUNDLE_SALT)
+    except signing.BadSignature as exc:
+        raise BundleError("Invalid bundle token.") from exc
+    if claims.get("attempt") != attempt.id or claims.get("student") != attempt.student_id:
+        raise BundleError("Bundle token belongs to another attempt.")
+    if claims.get("paper") != paper_digest(key, shuffle):
+        raise BundleError("The exam paper changed; download the bundle again.")
+    if not isinstance(packed, str) or len(packed) > len(key) or not VALID_LETTERS.issuperset(packed):
+        raise BundleError("Packed answers must be one letter or '-' per question.")
+    question_ids = display_order(key, shuffle)
+    return {
+        question_ids[position]: selected
+        for position, selected in enumerate(packed)
+        if selected != UNANSWERED
+    }
@@ -0,0 +1,67 @@
+import secrets
+
+from django.db import connection, transaction
+
+from .models import Exam, Question
+
+EXAM_CODE_ALPHABET = "ABCDEFGHJKLMNPQRSTUVWXYZ23456789"
+EXAM_CODE_LENGTH = 8
+
+# Exam settings a clone keeps; it always starts inactive and unscheduled.
+CLONED_EXAM_FIELDS = (
+    "negative_marking_enabled",
+    "negative_marks",
+    "total_marks",
+    "duration_minutes",
+    "answer_storage",
+    "shuffle_questions",
+    "shuffle_options",
+)
+
+
+def generate_exam_code() -> str:
+    while True:
+        code = "".join(secrets.choice(EXAM_CODE_ALPHABET) for _ in range(EXAM_CODE_LENGTH))
+        if not Exam.objects.filter(exam_code=code).exists():
+            return code
+
+
+def _copy_questions(source_id: int, target_id: int) -> int:
+    """INSERT ... SELECT every question of ``source_id`` into ``target_id``."""
+    quote = connection.ops.quote_name
+    columns = [
+        field.column
+        for field in Question._meta.concrete_fields
+        if not field.primary_key and field.name != "exam"
+    ]
+    exam_column = Question._meta.get_field("exam").column
+    order = ", ".join(
+        quote(Question._meta.get_field(name).column) for name in ("created_at", "id")
+    )
+    column_list = ", ".join(quote(column) for column in columns)
+    table = quote(Question._meta.db_table)
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f"INSERT INTO {table} ({quote(exam_column)}, {column_list}) "
+            f"SELECT %s, {column_list} FROM {table} WHERE {quote(exam_column)} = %s "
+            f"ORDER BY {order}",
+            [target_id, source_id],
+        )
+        return cursor.rowcount
+
+
+def clone_exam(exam: Exam, created_by, title: str | None = None) -> Exam:
+    """Copy ``exam`` and its questions in two statements plus the code check.
+
+    Questions keep their ``created_at`` so the clone's paper has the same order.
+    """
+    with transaction.atomic():
+        clone = Exam.objects.create(
+            title=(title or f"{exam.title} (copy)")[: Exam._meta.get_field("title").max_length],
+            exam_code=generate_exam_code(),
+            is_active=False,
+            created_by=created_by,
+            **{field: getattr(exam, field) for field in CLONED_EXAM_FIELDS},
+        )
+        clone.question_count = _copy_questions(exam.id, clone.id)
+    return clone
@@ -0,0 +1,206 @@
+import itertools
+import json
+import logging
+import queue
+import threading
+import time
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import transaction
+from rest_framework.renderers import BaseRenderer
+
+from .serializers import ResultSerializer
+
+logger = logging.getLogger(__name__)
+
+
+class EventStreamBusy(Exception):
+    pass
+
+
+class ExamEventBroker:
+    """In-process pub/sub of exam activity, one queue per listening stream.
+
+    On its own it only reaches streams served by the process that saved the
+    attempt or result; with REDIS_URL set, ``RedisRelay`` feeds it events from
+    every process. Slow listeners drop events instead of blocking writers.
+    """
+
+    def __init__(self, queue_size: int = 1000):
+        self.queue_size = queue_size
+        self.subscribers = {}
+        self.streams = 0
+        self.lock = threading.Lock()
+        self.ids = itertools.count(1)
+
+    def subscribe(self, exam_id: int) -> queue.Queue:
+        """Register a listener, or raise EventStreamBusy at QUIZ_EVENT_STREAMS_PER_WORKER."""
+        listener = queue.Queue(maxsize=self.queue_size)
+        with self.lock:
+            if self.streams >= settings.QUIZ_EVENT_STREAMS_PER_WORKER:
+                raise EventStreamBusy()
+            self.streams += 1
+            self.subscribers.setdefault(exam_id, set()).add(listener)
+        return listener
+
+    def unsubscribe(self, exam_id: int, listener: queue.Queue) -> None:
+        with self.lock:
+            listeners = self.subscribers.get(exam_id, set())
+            if listener in listeners:
+                listeners.discard(listener)
+                self.streams -= 1
+            if not listeners:
+                self.subscribers.pop(exam_id, None)
+
+    def publish(self, exam_id: int, build_event) -> None:
+        """Deliver ``build_event()``; it is only called if someone listens."""
+        with self.lock:
+            listeners = list(self.subscribers.get(exam_id, ()))
+        if not listeners:
+            return
+        event = {"id": next(self.ids), **build_event()}
+        for listener in listeners:
+            try:
+                listener.put_nowait(event)
+            except queue.Full:
+                pass
+
+
+broker = ExamEventBroker()
+
+
+class RedisRelay:
+    """Carries events between processes over Redis pub/sub.
+
+    Publishers send each event to its exam's channel; in every process that
+    serves streams, one daemon thread listens on all exam channels and hands
+    events to the local broker. The thread starts with the first stream, so
+    it never runs in the gunicorn master or in management commands.
+    """
+
+    channel_prefix = "quiz:events:"
+
+    def __init__(self, url: str, target: ExamEventBroker):
+        import redis
+
+        self.redis = redis
+        self.client = redis.Redis.from_url(url)
+        self.target = target
+        self.thread = None
+        self.lock = threading.Lock()
+
+    def publish(self, exam_id: int, build_event) -> None:
+        payload = json.dumps(build_event(), cls=DjangoJSONEncoder)
+        try:
+            self.client.publish(f"{self.channel_prefix}{exam_id}", payload)
+        except self.redis.RedisError:
+            logger.warning("Could not publish exam %s event to Redis.", exam_id, exc_info=True)
+
+    def start(self) -> None:
+        with self.lock:
+            if self.thread is None or not self.thread.is_alive():
+                self.thread = threading.Thread(
+                    target=self._listen, name="quiz-event-relay", daemon=True
+                )
+                self.thread.start()
+
+    def _listen(self) -> None:
+        while True:
+            try:
+                pubsub = self.client.pubsub(ignore_subscribe_messages=True)
+                pubsub.psubscribe(f"{self.channel_prefix}*")
+                for message in pubsub.listen():
+                    exam_id = int(message["channel"].rsplit(b":", 1)[1])
+                    event = json.loads(message["data"])
+                    self.target.publish(exam_id, lambda event=event: event)
+            except self.redis.RedisError:
+                logger.warning("Exam event relay lost Redis; reconnecting.", exc_info=True)
+                time.sleep(1)
+
+
+_relay = None
+_relay_lock = threading.Lock()
+
+
+def get_relay():
+    """The process's RedisRelay when REDIS_URL is set, else None."""
+    global _relay
+    if not settings.REDIS_URL:
+        return None
+    with _relay_lock:
+        if _relay is None:
+            _relay = RedisRelay(settings.REDIS_URL, broker)
+    return _relay
+
+
+def publish(exam_id: int, build_event) -> None:
+    relay = get_relay()
+    if relay is None:
+        broker.publish(exam_id, build_event)
+    else:
+        relay.publish(exam_id, build_event)
+
+
+def publish_after_commit(exam_id: int, build_event) -> None:
+    transaction.on_commit(lambda: publish(exam_id, build_event))
+
+
+def joined_event(attempt) -> dict:
+    return {
+        "type": "joined",
+        "attempt": attempt.id,
+        "student_username": attempt.student.username,
+        "started_at": attempt.started_at.isoformat(),
+    }
+
+
+def submitted_event(result) -> dict:
+    return {"type": "submitted", "attempt": result.attempt_id, **ResultSerializer(result).data}
+
+
+def format_event(event: dict) -> str:
+    return f"id: {event['id']}\nevent: {event['type']}\ndata: {json.dumps(event)}\n\n"
+
+
+class ExamEventStream:
+    """Server-Sent Events for one exam, until QUIZ_EVENT_STREAM_MAX_SECONDS.
+
+    The listener is registered on construction, so a process already serving
+    QUIZ_EVENT_STREAMS_PER_WORKER streams raises EventStreamBusy before a
+    response starts. Streams are capped in time so a worker thread is never
+    held indefinitely; EventSource reconnects on its own. ``close`` (called
+    by the response) releases the slot even if the stream never started.
+    """
+
+    def __init__(self, exam_id: int):
+        relay = get_relay()
+        if relay is not None:
+            relay.start()
+        self.exam_id = exam_id
+        self.listener = broker.subscribe(exam_id)
+
+    def __iter__(self):
+        yield "retry: 3000\n\n"
+        heartbeat = settings.QUIZ_EVENT_STREAM_HEARTBEAT
+        ends_at = time.monotonic() + settings.QUIZ_EVENT_STREAM_MAX_SECONDS
+        while time.monotonic() < ends_at:
+            try:
+                event = self.listener.get(timeout=heartbeat)
+            except queue.Empty:
+                yield ": keep-alive\n\n"
+                continue
+            yield format_event(event)
+
+    def close(self) -> None:
+        broker.unsubscribe(self.exam_id, self.listener)
+
+
+class EventStreamRenderer(BaseRenderer):
+    """Lets ``Accept: text/event-stream`` pass DRF content negotiation."""
+
+    media_type = "text/event-stream"
+    format = "event-stream"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data).encode()
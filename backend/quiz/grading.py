@@ -0,0 +1,179 @@
+from array import array
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .routers import primary_reads
+
+from .models import (
+    AnswerStorage,
+    Exam,
+    Question,
+    StudentAnswer,
+    StudentExamAttempt,
+    new_questions_version,
+)
+
+ANSWER_KEY_CACHE_KEY = "quiz:answer-key:v4:{exam_id}:{version}"
+UNANSWERED = "-"
+
+
+@dataclass(frozen=True)
+class AnswerKey:
+    """Compact grading data for one exam, in paper order.
+
+    ``question_ids`` and ``marks`` are parallel integer arrays,
+    ``correct_options`` holds one letter per question and ``option_counts``
+    one byte per question (4 or 5), so a 1,000-question key pickles to a few
+    kilobytes.
+    """
+
+    question_ids: array
+    correct_options: str
+    marks: array
+    option_counts: bytes
+
+    def __len__(self) -> int:
+        return len(self.question_ids)
+
+    def ordinals(self) -> dict[int, int]:
+        return {question_id: index for index, question_id in enumerate(self.question_ids)}
+
+
+def build_answer_key(exam_id: int) -> AnswerKey:
+    rows = (
+        Question.objects.filter(exam_id=exam_id)
+        .order_by("created_at", "id")
+        .values_list("id", "correct_option", "marks", "option_e")
+    )
+    question_ids = array("q")
+    marks = array("q")
+    correct = []
+    option_counts = bytearray()
+    for question_id, correct_option, question_marks, option_e in rows:
+        question_ids.append(question_id)
+        correct.append(correct_option)
+        marks.append(question_marks)
+        option_counts.append(5 if option_e else 4)
+    return AnswerKey(question_ids, "".join(correct), marks, bytes(option_counts))
+
+
+def get_answer_key(exam) -> AnswerKey:
+    """The cached key of ``exam``, stored under its ``questions_version``.
+
+    The version lives on the exam row, so an edit handled by any process
+    retires the cached keys of all of them once it commits.
+    """
+    cache_key = ANSWER_KEY_CACHE_KEY.format(exam_id=exam.id, version=exam.questions_version)
+    key = cache.get(cache_key)
+    if key is None:
+        with primary_reads():
+            key = build_answer_key(exam.id)
+        cache.set(cache_key, key, settings.QUIZ_ANSWER_KEY_TIMEOUT)
+    return key
+
+
+def invalidate_answer_key(exam_id: int) -> None:
+    """Retire the exam's cached answer key and paper.
+
+    The new version commits with the surrounding transaction, so readers
+    see either the old questions under the old version or the new ones.
+    """
+    Exam.objects.filter(id=exam_id).update(questions_version=new_questions_version())
+
+
+def score_answers(key: AnswerKey, answer_map: dict[int, str], exam) -> Decimal:
+    # Scoring: correct => +marks, wrong => -negative_marks if enabled, unattempted => 0.
+    # Total marks are not reduced by negative deductions and obtained marks never go below 0.
+    obtained = Decimal("0")
+    penalty = exam.negative_marks if exam.negative_marking_enabled else Decimal("0")
+    for index, question_id in enumerate(key.question_ids):
+        selected = answer_map.get(question_id)
+        if not selected:
+            continue
+        if selected == key.correct_options[index]:
+            obtained += key.marks[index]
+        else:
+            obtained -= penalty
+    if obtained < 0:
+        obtained = Decimal("0")
+    return obtained
+
+
+def pack_answers(key: AnswerKey, answer_map: dict[int, str]) -> str:
+    packed = "".join(answer_map.get(question_id, UNANSWERED) for question_id in key.question_ids)
+    return packed.rstrip(UNANSWERED)
+
+
+def unpack_answers(key: AnswerKey, packed: str) -> dict[int, str]:
+    return {
+        key.question_ids[index]: selected
+        for index, selected in enumerate(packed[: len(key)])
+        if selected != UNANSWERED
+    }
+
+
+def repack_answers(exam_id: int, old_question_ids, batch_size: int = 500) -> int:
+    """Rewrite packed attempts laid out for ``old_question_ids`` to the current key.
+
+    Packed answers are positional, so removing a question would otherwise
+    shift every later answer onto the wrong question.
+    """
+    key = build_answer_key(exam_id)
+    attempts = (
+        StudentExamAttempt.objects.filter(exam_id=exam_id)
+        .exclude(packed_answers="")
+        .only("id", "packed_answers")
+        .order_by("id")
+    )
+    repacked = 0
+    last_id = 0
+    while True:
+        batch = list(attempts.filter(id__gt=last_id)[:batch_size])
+        if not batch:
+            return repacked
+        last_id = batch[-1].id
+        for attempt in batch:
+            answer_map = {
+                old_question_ids[index]: selected
+                for index, selected in enumerate(attempt.packed_answers[: len(old_question_ids)])
+                if selected != UNANSWERED
+            }
+            attempt.packed_answers = pack_answers(key, answer_map)
+        StudentExamAttempt.objects.bulk_update(batch, ["packed_answers"])
+        repacked += len(batch)
+
+
+def save_answers(attempt, key: AnswerKey, answer_map: dict[int, str]) -> None:
+    """Persist ``answer_map`` in the storage mode of the attempt's exam."""
+    if attempt.exam.answer_storage == AnswerStorage.PACKED:
+        attempt.packed_answers = pack_answers(key, answer_map)
+        attempt.save(update_fields=["packed_answers"])
+        return
+    StudentAnswer.objects.filter(attempt=attempt).delete()
+    StudentAnswer.objects.bulk_create(
+        StudentAnswer(attempt=attempt, question_id=question_id, selected_option=selected)
+        for question_id, selected in answer_map.items()
+    )
+
+
+def load_answer_maps(exam, attempts, key: AnswerKey) -> dict[int, dict[int, str]]:
+    """Return ``{attempt_id: {question_id: option}}`` whatever the storage mode.
+
+    Row-mode exams cost one query for the whole batch of ``attempts``.
+    """
+    if exam.answer_storage == AnswerStorage.PACKED:
+        return {attempt.id: unpack_answers(key, attempt.packed_answers) for attempt in attempts}
+    answer_maps = {attempt.id: {} for attempt in attempts}
+    rows = StudentAnswer.objects.filter(attempt_id__in=list(answer_maps)).values_list(
+        "attempt_id", "question_id", "selected_option"
+    )
+    for attempt_id, question_id, selected in rows:
+        answer_maps[attempt_id][question_id] = selected
+    return answer_maps
+
+
+def load_answer_map(attempt, key: AnswerKey) -> dict[int, str]:
+    return load_answer_maps(attempt.exam, [attempt], key)[attempt.id]
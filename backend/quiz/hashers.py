@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """PBKDF2-SHA256 with the iteration count from QUIZ_PBKDF2_ITERATIONS.
+
+    The count can only raise Django's own default. It shares the
+    ``pbkdf2_sha256`` algorithm name, so existing hashes keep verifying and
+    are rewritten with the new count on the next login.
+    """
+
+    @property
+    def iterations(self) -> int:
+        return max(settings.QUIZ_PBKDF2_ITERATIONS, PBKDF2PasswordHasher.iterations)
@@ -0,0 +1,45 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+
+from quiz.archive import ArchiveError, archivable_exams, archive_exam, archive_path
+from quiz.models import Exam
+
+
+class Command(BaseCommand):
+    help = "Archive the answers of old inactive exams to files and delete them in batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=settings.QUIZ_ARCHIVE_AFTER_DAYS)
+        parser.add_argument(
+            "--exam", type=int, help="Archive (or finish archiving) this exam id at any age."
+        )
+        parser.add_argument("--batch-size", type=int, default=settings.QUIZ_PURGE_BATCH_SIZE)
+        parser.add_argument("--dry-run", action="store_true")
+
+    def handle(self, *args, **options):
+        if options["exam"]:
+            exams = Exam.objects.live().filter(id=options["exam"])
+        else:
+            cutoff = timezone.now() - timedelta(days=options["days"])
+            exams = archivable_exams(cutoff)
+        exams = list(exams.order_by("created_at"))
+        if options["dry_run"]:
+            for exam in exams:
+                self.stdout.write(f"Would archive exam {exam.id} ({exam.exam_code}).")
+            return
+
+        archived = 0
+        for exam in exams:
+            try:
+                attempts = archive_exam(exam, options["batch_size"])
+            except ArchiveError as exc:
+                self.stderr.write(f"Skipped exam {exam.id}: {exc}")
+                continue
+            archived += 1
+            self.stdout.write(
+                f"Archived exam {exam.id} ({attempts} attempts) to {archive_path(exam.id)}."
+            )
+        self.stdout.write(self.style.SUCCESS(f"Archived {archived} exams."))
@@ -0,0 +1,34 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from quiz.backup import write_backup
+
+
+class Command(BaseCommand):
+    help = "Stream users and all quiz tables into a gzip-compressed NDJSON archive."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="Archive to write, e.g. quiz-backup.ndjson.gz.")
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--chunk-size", type=int, default=2000)
+        parser.add_argument(
+            "--compresslevel", type=int, default=6, choices=range(1, 10), metavar="1-9"
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = 0
+        with open(options["path"], "wb") as fileobj:
+            for label, rows in write_backup(
+                fileobj, options["database"], options["chunk_size"], options["compresslevel"]
+            ):
+                total += rows
+                self.stdout.write(f"{label}: {rows} rows")
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Backed up {total} rows to {options['path']} in {elapsed:.1f}s "
+                f"({total / max(elapsed, 1e-9):,.0f} rows/s)."
+            )
+        )
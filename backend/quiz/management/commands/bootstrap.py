@@ -0,0 +1,19 @@
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+
+from quiz.bootstrap import ensure_superuser
+
+
+class Command(BaseCommand):
+    help = "Apply migrations and create the DJANGO_SUPERUSER_* account. Safe to re-run."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--skip-migrate", action="store_true")
+
+    def handle(self, *args, **options):
+        if not options["skip_migrate"]:
+            call_command("migrate", interactive=False, verbosity=options["verbosity"])
+        if ensure_superuser():
+            self.stdout.write(self.style.SUCCESS("Superuser created."))
+        else:
+            self.stdout.write("Superuser already present or not configured.")
@@ -0,0 +1,35 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.cloning import clone_exam
+from quiz.models import Exam
+
+
+class Command(BaseCommand):
+    help = "Copy an exam and all of its questions into a new, inactive exam."
+
+    def add_arguments(self, parser):
+        parser.add_argument("exam_id", type=int)
+        parser.add_argument("--title", help="Title of the copy (default: '<title> (copy)').")
+        parser.add_argument("--owner", help="Username of the copy's owner (default: same owner).")
+
+    def handle(self, *args, **options):
+        try:
+            exam = Exam.objects.live().select_related("created_by").get(id=options["exam_id"])
+        except Exam.DoesNotExist as exc:
+            raise CommandError("Exam not found.") from exc
+
+        owner = exam.created_by
+        if options["owner"]:
+            try:
+                owner = get_user_model().objects.get(username=options["owner"])
+            except get_user_model().DoesNotExist as exc:
+                raise CommandError(f"User {options['owner']} not found.") from exc
+
+        clone = clone_exam(exam, owner, title=options["title"])
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Cloned exam {exam.id} into exam {clone.id} ({clone.exam_code}) "
+                f"with {clone.question_count} questions."
+            )
+        )
@@ -0,0 +1,72 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from quiz.grading import build_answer_key, load_answer_maps, pack_answers
+from quiz.models import AnswerStorage, Exam, StudentAnswer, StudentExamAttempt
+
+
+class Command(BaseCommand):
+    help = "Move an exam's stored answers between row and packed storage."
+
+    def add_arguments(self, parser):
+        parser.add_argument("exam_id", type=int)
+        parser.add_argument("storage", choices=[AnswerStorage.ROWS, AnswerStorage.PACKED])
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        target = options["storage"]
+        batch_size = options["batch_size"]
+        try:
+            exam = Exam.objects.get(id=options["exam_id"])
+        except Exam.DoesNotExist as exc:
+            raise CommandError("Exam not found.") from exc
+        if exam.archived_at:
+            raise CommandError("Exam is archived; run restore_archived_exam first.")
+
+        source = exam.answer_storage
+        # Switch first so concurrent submissions already write the new format;
+        # the guards below then skip attempts that have nothing to convert.
+        Exam.objects.filter(id=exam.id).update(answer_storage=target)
+        if source == target:
+            self.stdout.write(f"Exam {exam.id} already uses {target} storage.")
+            return
+
+        key = build_answer_key(exam.id)
+        attempts = StudentExamAttempt.objects.filter(exam=exam).only("id", "packed_answers")
+        if target == AnswerStorage.PACKED:
+            attempts = attempts.filter(packed_answers="")
+        else:
+            attempts = attempts.exclude(packed_answers="")
+
+        converted = 0
+        last_id = 0
+        while True:
+            batch = list(attempts.filter(id__gt=last_id).order_by("id")[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            answer_maps = load_answer_maps(exam, batch, key)
+            with transaction.atomic():
+                if target == AnswerStorage.PACKED:
+                    for attempt in batch:
+                        attempt.packed_answers = pack_answers(key, answer_maps[attempt.id])
+                    StudentExamAttempt.objects.bulk_update(batch, ["packed_answers"])
+                    StudentAnswer.objects.filter(attempt__in=batch).delete()
+                else:
+                    StudentAnswer.objects.bulk_create(
+                        StudentAnswer(
+                            attempt_id=attempt_id,
+                            question_id=question_id,
+                            selected_option=selected,
+                        )
+                        for attempt_id, answer_map in answer_maps.items()
+                        for question_id, selected in answer_map.items()
+                    )
+                    StudentExamAttempt.objects.filter(id__in=answer_maps).update(
+                        packed_answers=""
+                    )
+            converted += len(batch)
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Converted {converted} attempts of exam {exam.id} to {target}.")
+        )
@@ -0,0 +1,75 @@
+import io
+import json
+import pstats
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Summarize the request profiles saved by ProfilingMiddleware."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--dir", default=str(settings.QUIZ_PROFILE_DIR))
+        parser.add_argument("--view", help="Only include profiles of this view name.")
+        parser.add_argument("--limit", type=int, default=25)
+        parser.add_argument(
+            "--sort", choices=["cumulative", "tottime", "ncalls"], default="cumulative"
+        )
+
+    def handle(self, *args, **options):
+        directory = Path(options["dir"])
+        captures = []
+        for summary_path in sorted(directory.glob("*.json")):
+            profile_path = summary_path.with_suffix(".prof")
+            if not profile_path.exists():
+                continue
+            with open(summary_path, encoding="utf-8") as handle:
+                summary = json.load(handle)
+            if options["view"] and summary["view"] != options["view"]:
+                continue
+            captures.append((profile_path, summary))
+        if not captures:
+            raise CommandError(f"No profiles found in {directory}.")
+
+        self.stdout.write(f"{len(captures)} profiles\n")
+        self._requests(captures)
+        self._queries(captures, options["limit"])
+
+        output = io.StringIO()
+        stats = pstats.Stats(*(str(path) for path, _ in captures), stream=output)
+        stats.strip_dirs().sort_stats(options["sort"]).print_stats(options["limit"])
+        self.stdout.write(output.getvalue())
+
+    def _requests(self, captures) -> None:
+        views = {}
+        for _, summary in captures:
+            view = views.setdefault(summary["view"] or summary["path"], [0, 0.0, 0.0, 0])
+            view[0] += 1
+            view[1] += summary["duration_ms"]
+            view[2] += summary["query_ms"]
+            view[3] += summary["query_count"]
+        self.stdout.write(f"{'view':<40} {'n':>5} {'avg ms':>9} {'sql ms':>9} {'queries':>8}")
+        for name, (count, total_ms, sql_ms, queries) in sorted(
+            views.items(), key=lambda item: item[1][1], reverse=True
+        ):
+            self.stdout.write(
+                f"{name[:40]:<40} {count:>5} {total_ms / count:>9.1f} "
+                f"{sql_ms / count:>9.1f} {queries / count:>8.1f}"
+            )
+        self.stdout.write("")
+
+    def _queries(self, captures, limit: int) -> None:
+        statements = {}
+        for _, summary in captures:
+            for query in summary["queries"]:
+                entry = statements.setdefault(query["sql"], [0, 0.0])
+                entry[0] += 1
+                entry[1] += query["duration_ms"]
+        self.stdout.write(f"{'calls':>6} {'total ms':>9}  sql")
+        for sql, (calls, total_ms) in sorted(
+            statements.items(), key=lambda item: item[1][1], reverse=True
+        )[:limit]:
+            self.stdout.write(f"{calls:>6} {total_ms:>9.1f}  {sql[:160]}")
+        self.stdout.write("")
@@ -0,0 +1,23 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from quiz.models import Exam
+from quiz.purge import purge_exam
+
+
+class Command(BaseCommand):
+    help = "Remove soft-deleted exams and all of their rows in small batches."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--exam", type=int, help="Only purge this exam id.")
+        parser.add_argument("--batch-size", type=int, default=settings.QUIZ_PURGE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        exams = Exam.objects.filter(deleted_at__isnull=False)
+        if options["exam"]:
+            exams = exams.filter(id=options["exam"])
+        exam_ids = list(exams.order_by("deleted_at").values_list("id", flat=True))
+        for exam_id in exam_ids:
+            deleted = purge_exam(exam_id, options["batch_size"])
+            self.stdout.write(f"Purged exam {exam_id} ({deleted} rows).")
+        self.stdout.write(self.style.SUCCESS(f"Purged {len(exam_ids)} exams."))
@@ -0,0 +1,56 @@
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.analytics import invalidate_item_analysis
+from quiz.grading import build_answer_key, invalidate_answer_key, load_answer_maps, score_answers
+from quiz.models import Exam, Result, StudentExamAttempt
+from quiz.results import invalidate_exam_results
+
+
+class Command(BaseCommand):
+    help = "Recompute every result of an exam from its stored answers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("exam_id", type=int)
+        parser.add_argument("--batch-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        batch_size = options["batch_size"]
+        try:
+            exam = Exam.objects.get(id=options["exam_id"])
+        except Exam.DoesNotExist as exc:
+            raise CommandError("Exam not found.") from exc
+        if exam.archived_at:
+            raise CommandError("Exam is archived; run restore_archived_exam first.")
+
+        invalidate_answer_key(exam.id)
+        key = build_answer_key(exam.id)
+        total = Decimal(exam.total_marks)
+        attempts = (
+            StudentExamAttempt.objects.filter(exam=exam, result__isnull=False)
+            .select_related("result")
+            .only("id", "packed_answers", "result__id")
+            .order_by("id")
+        )
+
+        regraded = 0
+        last_id = 0
+        while True:
+            batch = list(attempts.filter(id__gt=last_id)[:batch_size])
+            if not batch:
+                break
+            last_id = batch[-1].id
+            answer_maps = load_answer_maps(exam, batch, key)
+            results = []
+            for attempt in batch:
+                result = attempt.result
+                result.total_marks = total
+                result.obtained_marks = score_answers(key, answer_maps[attempt.id], exam)
+                results.append(result)
+            Result.objects.bulk_update(results, ["total_marks", "obtained_marks"])
+            regraded += len(results)
+        invalidate_item_analysis(exam.id)
+        invalidate_exam_results(exam.id)
+
+        self.stdout.write(self.style.SUCCESS(f"Regraded {regraded} results of exam {exam.id}."))
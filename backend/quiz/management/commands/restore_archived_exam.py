@@ -0,0 +1,26 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.archive import ArchiveError, restore_exam
+from quiz.models import Exam
+
+
+class Command(BaseCommand):
+    help = "Load an archived exam's answers back into the database."
+
+    def add_arguments(self, parser):
+        parser.add_argument("exam_id", type=int)
+        parser.add_argument("--batch-size", type=int, default=settings.QUIZ_PURGE_BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        try:
+            exam = Exam.objects.live().get(id=options["exam_id"])
+        except Exam.DoesNotExist as exc:
+            raise CommandError("Exam not found.") from exc
+        try:
+            restored = restore_exam(exam, options["batch_size"])
+        except ArchiveError as exc:
+            raise CommandError(str(exc)) from exc
+        self.stdout.write(
+            self.style.SUCCESS(f"Restored answers of {restored} attempts of exam {exam.id}.")
+        )
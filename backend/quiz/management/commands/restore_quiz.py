@@ -0,0 +1,43 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from quiz.backup import BackupError, read_backup
+
+
+class Command(BaseCommand):
+    help = (
+        "Load a backup_quiz archive into a freshly migrated database. migrate "
+        "creates the DJANGO_SUPERUSER_* account, so pass --replace (or unset "
+        "those variables while migrating) when that is the only existing row."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path")
+        parser.add_argument("--database", default="default")
+        parser.add_argument("--batch-size", type=int, default=2000)
+        parser.add_argument(
+            "--replace",
+            action="store_true",
+            help="Delete every user, exam and answer first (in the restore's transaction).",
+        )
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        total = 0
+        try:
+            with open(options["path"], "rb") as fileobj:
+                for label, rows in read_backup(
+                    fileobj, options["database"], options["batch_size"], options["replace"]
+                ):
+                    total += rows
+                    self.stdout.write(f"{label}: {rows} rows")
+        except (BackupError, OSError) as exc:
+            raise CommandError(str(exc)) from exc
+        elapsed = time.perf_counter() - started
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Restored {total} rows from {options['path']} in {elapsed:.1f}s "
+                f"({total / max(elapsed, 1e-9):,.0f} rows/s)."
+            )
+        )
@@ -0,0 +1,76 @@
+import json
+import re
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+_STRING = re.compile(r"'(?:[^']|'')*'")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*(?:\?|%s)(?:\s*,\s*(?:\?|%s))*\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+
+
+def fingerprint(sql: str) -> str:
+    """Normalize ``sql`` so statements differing only in literals group together."""
+    sql = _STRING.sub("?", sql)
+    sql = _NUMBER.sub("?", sql)
+    sql = sql.replace("%s", "?")
+    sql = _PLACEHOLDER_LIST.sub("(...)", sql)
+    return _WHITESPACE.sub(" ", sql).strip()
+
+
+class Command(BaseCommand):
+    help = "Group the slow query log by query fingerprint."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--log", default=str(settings.QUIZ_SLOW_QUERY_LOG))
+        parser.add_argument("--view", help="Only include queries issued by this view.")
+        parser.add_argument("--limit", type=int, default=25)
+        parser.add_argument("--sort", choices=["total", "max", "count"], default="total")
+
+    def handle(self, *args, **options):
+        log = Path(options["log"])
+        paths = sorted(log.parent.glob(f"{log.name}.*"), reverse=True)
+        if log.exists():
+            paths.append(log)
+        if not paths:
+            raise CommandError(f"No slow query log at {log}.")
+
+        groups = {}
+        for path in paths:
+            with open(path, encoding="utf-8") as handle:
+                for line in handle:
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    if options["view"] and entry["view"] != options["view"]:
+                        continue
+                    group = groups.setdefault(
+                        fingerprint(entry["sql"]),
+                        {"count": 0, "total": 0.0, "max": 0.0, "views": {}, "roles": set()},
+                    )
+                    group["count"] += 1
+                    group["total"] += entry["duration_ms"]
+                    group["max"] = max(group["max"], entry["duration_ms"])
+                    view = entry["view"] or entry["path"]
+                    group["views"][view] = group["views"].get(view, 0) + 1
+                    group["roles"].add(entry["role"])
+        if not groups:
+            raise CommandError("No matching slow queries.")
+
+        ranked = sorted(groups.items(), key=lambda item: item[1][options["sort"]], reverse=True)
+        self.stdout.write(f"{len(groups)} fingerprints\n")
+        for sql, group in ranked[: options["limit"]]:
+            views = ", ".join(
+                f"{view} ({count})"
+                for view, count in sorted(group["views"].items(), key=lambda item: -item[1])
+            )
+            self.stdout.write(
+                f"{group['count']:>6} calls {group['total']:>10.1f} ms total "
+                f"{group['total'] / group['count']:>8.1f} avg {group['max']:>8.1f} max"
+            )
+            self.stdout.write(f"  views: {views}")
+            self.stdout.write(f"  roles: {', '.join(sorted(group['roles']))}")
+            self.stdout.write(f"  {sql[:400]}\n")
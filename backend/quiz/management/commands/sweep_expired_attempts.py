@@ -0,0 +1,29 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand
+
+from quiz.sweeper import sweep_all_expired_attempts
+
+
+class Command(BaseCommand):
+    help = "Grade attempts whose time limit has run out, using their saved answers."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=settings.QUIZ_SWEEP_BATCH_SIZE)
+        parser.add_argument(
+            "--loop",
+            action="store_true",
+            help="Keep sweeping every --interval seconds instead of exiting.",
+        )
+        parser.add_argument("--interval", type=float, default=15.0)
+
+    def handle(self, *args, **options):
+        while True:
+            graded = sweep_all_expired_attempts(options["batch_size"])
+            if graded:
+                self.stdout.write(f"Graded {graded} expired attempts.")
+            if not options["loop"]:
+                break
+            time.sleep(options["interval"])
+        self.stdout.write(self.style.SUCCESS("Sweep complete."))
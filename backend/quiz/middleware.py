@@ -0,0 +1,258 @@
+import cProfile
+import json
+import logging
+import os
+import random
+import threading
+import time
+from contextlib import ExitStack
+from pathlib import Path
+
+from django.conf import settings
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+
+from .routers import STICKY_COOKIE, replica_configured
+
+slow_query_logger = logging.getLogger("quiz.slow_queries")
+
+
+class QueryRecorder:
+    """``execute_wrapper`` that records each statement and its duration."""
+
+    def __init__(self, alias: str, queries: list):
+        self.alias = alias
+        self.queries = queries
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.queries.append(
+                {
+                    "alias": self.alias,
+                    "sql": sql,
+                    "many": many,
+                    "duration_ms": round((time.perf_counter() - started) * 1000, 3),
+                }
+            )
+
+
+def prune_profiles(directory: Path, keep: int) -> None:
+    """Keep only the newest ``keep`` profiles (file names sort by time)."""
+    profiles = sorted(directory.glob("*.prof"))
+    for stale in profiles[: max(len(profiles) - keep, 0)]:
+        stale.unlink(missing_ok=True)
+        stale.with_suffix(".json").unlink(missing_ok=True)
+
+
+# cProfile allows one active profiler per process (enabling a second raises
+# ValueError on Python 3.12+), so gthread workers profile one request at a time.
+_profiler_lock = threading.Lock()
+
+
+class ProfilingMiddleware:
+    """Capture cProfile stats and SQL timings for selected requests.
+
+    Staff users opt a request in with ``?profile=1`` or an ``X-Profile: 1``
+    header; QUIZ_PROFILE_SAMPLE_RATE additionally samples that fraction of all
+    requests. Each capture writes ``<name>.prof`` and ``<name>.json`` into
+    QUIZ_PROFILE_DIR, which keeps the newest QUIZ_PROFILE_MAX_FILES captures;
+    `manage.py profile_summary` reports across them. A request that arrives
+    while another thread of the worker is being profiled runs unprofiled.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def should_profile(self, request) -> bool:
+        if request.GET.get("profile") == "1" or request.headers.get("X-Profile") == "1":
+            user = getattr(request, "user", None)
+            if user is not None and user.is_staff:
+                return True
+        rate = settings.QUIZ_PROFILE_SAMPLE_RATE
+        return rate > 0 and random.random() < rate
+
+    def __call__(self, request):
+        if not self.should_profile(request):
+            return self.get_response(request)
+        if not _profiler_lock.acquire(blocking=False):
+            return self.get_response(request)
+        try:
+            return self.profile(request)
+        finally:
+            _profiler_lock.release()
+
+    def profile(self, request):
+        queries = []
+        profiler = cProfile.Profile()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(QueryRecorder(connection.alias, queries))
+                )
+            profiler.enable()
+            try:
+                response = self.get_response(request)
+            finally:
+                profiler.disable()
+        elapsed_ms = round((time.perf_counter() - started) * 1000, 3)
+
+        name = self.save(request, response, profiler, queries, elapsed_ms)
+        response["X-Profile-Id"] = name
+        return response
+
+    def save(self, request, response, profiler, queries, elapsed_ms) -> str:
+        directory = Path(settings.QUIZ_PROFILE_DIR)
+        directory.mkdir(parents=True, exist_ok=True)
+        match = getattr(request, "resolver_match", None)
+        view = match.view_name if match else ""
+        name = f"{time.time_ns()}-{os.getpid()}"
+        profiler.dump_stats(directory / f"{name}.prof")
+        summary = {
+            "method": request.method,
+            "path": request.path,
+            "view": view,
+            "status": response.status_code,
+            "duration_ms": elapsed_ms,
+            "query_count": len(queries),
+            "query_ms": round(sum(query["duration_ms"] for query in queries), 3),
+            "queries": queries,
+        }
+        with open(directory / f"{name}.json", "w", encoding="utf-8") as handle:
+            json.dump(summary, handle)
+        prune_profiles(directory, settings.QUIZ_PROFILE_MAX_FILES)
+        return name
+
+
+def describe_params(params, many: bool) -> dict:
+    """Shape of the query parameters without their values."""
+    if many:
+        params = list(params or [])
+        first = params[0] if params else ()
+        return {"rows": len(params), **describe_params(first, False)}
+    if isinstance(params, dict):
+        return {"names": sorted(params)}
+    return {"types": [type(param).__name__ for param in params or ()]}
+
+
+class SlowQueryCollector:
+    """``execute_wrapper`` that keeps statements slower than ``threshold_ms``."""
+
+    def __init__(self, alias: str, threshold_ms: float, slow: list):
+        self.alias = alias
+        self.threshold_ms = threshold_ms
+        self.slow = slow
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            duration_ms = (time.perf_counter() - started) * 1000
+            if duration_ms >= self.threshold_ms:
+                self.slow.append(
+                    {
+                        "alias": self.alias,
+                        "sql": sql,
+                        "params": describe_params(params, many),
+                        "duration_ms": round(duration_ms, 3),
+                    }
+                )
+
+
+def request_role(request) -> str:
+    user = getattr(request, "user", None)
+    if user is None or not user.is_authenticated:
+        return "anonymous"
+    profile = getattr(user, "profile", None)
+    if profile is not None:
+        return profile.role
+    return "staff" if user.is_staff else "unknown"
+
+
+class SlowQueryLogMiddleware:
+    """Log statements slower than QUIZ_SLOW_QUERY_MS to ``quiz.slow_queries``.
+
+    Each slow statement becomes one JSON line carrying the SQL, the shape of
+    its parameters, its duration, the resolving view and the user's role.
+    Lines are written once the response is ready so the role lookup never
+    runs inside the timed statement. `manage.py slow_query_report` groups
+    the log by query fingerprint.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "view_class", None)
+        name = view_class.__name__ if view_class is not None else view_func.__name__
+        request.slow_query_view = f"{view_func.__module__}.{name}"
+
+    def __call__(self, request):
+        threshold_ms = settings.QUIZ_SLOW_QUERY_MS
+        if threshold_ms < 0:
+            return self.get_response(request)
+
+        slow = []
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(
+                    connection.execute_wrapper(
+                        SlowQueryCollector(connection.alias, threshold_ms, slow)
+                    )
+                )
+            response = self.get_response(request)
+
+        if slow:
+            view = getattr(request, "slow_query_view", "")
+            role = request_role(request)
+            for query in slow:
+                slow_query_logger.warning(
+                    json.dumps(
+                        {
+                            "ts": round(time.time(), 3),
+                            "method": request.method,
+                            "path": request.path,
+                            "view": view,
+                            "role": role,
+                            "status": response.status_code,
+                            **query,
+                        }
+                    )
+                )
+        return response
+
+
+class ReplicaStickinessMiddleware:
+    """Pin a user's reads to the primary for a while after their writes.
+
+    A successful unsafe request by any signed-in user (a teacher editing, a
+    student joining or submitting) sets a cookie that lasts
+    QUIZ_REPLICA_STICKY_SECONDS, long enough to cover replication lag, so
+    views using ``replica_reads`` show them their own changes.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        response = self.get_response(request)
+        if (
+            replica_configured()
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            response.set_cookie(
+                STICKY_COOKIE,
+                "1",
+                max_age=settings.QUIZ_REPLICA_STICKY_SECONDS,
+                domain=settings.SESSION_COOKIE_DOMAIN,
+                secure=settings.SESSION_COOKIE_SECURE,
+                httponly=True,
+                samesite=settings.SESSION_COOKIE_SAMESITE,
+            )
+        return response
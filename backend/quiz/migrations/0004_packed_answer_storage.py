@@ -0,0 +1,42 @@
+from django.db import migrations, models
+import quiz.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0003_negative_marks_decimal"),
+    ]
+
+    operations = [
+        # Existing exams keep their answer rows; only new exams follow
+        # settings.QUIZ_ANSWER_STORAGE.
+        migrations.AddField(
+            model_name="exam",
+            name="answer_storage",
+            field=models.CharField(
+                choices=[
+                    ("ROWS", "One row per answer"),
+                    ("PACKED", "Packed string per attempt"),
+                ],
+                default="ROWS",
+                max_length=10,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="exam",
+            name="answer_storage",
+            field=models.CharField(
+                choices=[
+                    ("ROWS", "One row per answer"),
+                    ("PACKED", "Packed string per attempt"),
+                ],
+                default=quiz.models.default_answer_storage,
+                max_length=10,
+            ),
+        ),
+        migrations.AddField(
+            model_name="studentexamattempt",
+            name="packed_answers",
+            field=models.TextField(blank=True, default=""),
+        ),
+    ]
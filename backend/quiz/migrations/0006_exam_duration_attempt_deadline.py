@@ -0,0 +1,33 @@
+from django.db import migrations, models
+import django.core.validators
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0005_exam_deleted_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exam",
+            name="duration_minutes",
+            field=models.PositiveIntegerField(
+                blank=True,
+                null=True,
+                validators=[django.core.validators.MinValueValidator(1)],
+            ),
+        ),
+        migrations.AddField(
+            model_name="studentexamattempt",
+            name="deadline",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddIndex(
+            model_name="studentexamattempt",
+            index=models.Index(
+                condition=models.Q(("deadline__isnull", False), ("submitted_at__isnull", True)),
+                fields=["deadline"],
+                name="open_attempt_deadline_idx",
+            ),
+        ),
+    ]
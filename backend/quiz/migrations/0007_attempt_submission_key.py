@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0006_exam_duration_attempt_deadline"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="studentexamattempt",
+            name="submission_key",
+            field=models.CharField(blank=True, default="", max_length=64),
+        ),
+    ]
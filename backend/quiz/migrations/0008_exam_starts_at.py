@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0007_attempt_submission_key"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exam",
+            name="starts_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
@@ -0,0 +1,48 @@
+import secrets
+
+from django.db import migrations, models
+
+import quiz.models
+
+
+def populate_secrets(apps, schema_editor):
+    Exam = apps.get_model("quiz", "Exam")
+    exams = list(Exam.objects.only("id"))
+    for exam in exams:
+        exam.shuffle_secret = secrets.token_hex(16)
+    Exam.objects.bulk_update(exams, ["shuffle_secret"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0008_exam_starts_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exam",
+            name="shuffle_questions",
+            field=models.BooleanField(default=False),
+        ),
+        migrations.AddField(
+            model_name="exam",
+            name="shuffle_options",
+            field=models.BooleanField(default=False),
+        ),
+        # Added empty and filled per row: a callable default would give every
+        # existing exam the same secret.
+        migrations.AddField(
+            model_name="exam",
+            name="shuffle_secret",
+            field=models.CharField(default="", editable=False, max_length=32),
+            preserve_default=False,
+        ),
+        migrations.RunPython(populate_secrets, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name="exam",
+            name="shuffle_secret",
+            field=models.CharField(
+                default=quiz.models.new_shuffle_secret, editable=False, max_length=32
+            ),
+        ),
+    ]
@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0009_exam_shuffling"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exam",
+            name="archived_at",
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
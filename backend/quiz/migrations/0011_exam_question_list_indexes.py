@@ -0,0 +1,22 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0010_exam_archived_at"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="exam",
+            index=models.Index(
+                fields=["created_by", "-created_at", "-id"], name="exam_owner_recent_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="question",
+            index=models.Index(
+                fields=["exam", "created_at", "id"], name="question_exam_order_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+from django.db import migrations, models
+
+import quiz.models
+
+
+class Migration(migrations.Migration):
+    dependencies = [
+        ("quiz", "0011_exam_question_list_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exam",
+            name="questions_version",
+            field=models.CharField(
+                default=quiz.models.new_questions_version, editable=False, max_length=16
+            ),
+        ),
+    ]
@@ -1,6 +1,9 @@
+import secrets
+
 from django.conf import settings
 from django.core.validators import MinValueValidator
 from django.db import models
+from django.db.models.functions import Coalesce
 
 
 class UserRole(models.TextChoices):
@@ -8,6 +11,15 @@ class UserRole(models.TextChoices):
     STUDENT = "STUDENT", "Student"
 
 
+class AnswerStorage(models.TextChoices):
+    ROWS = "ROWS", "One row per answer"
+    PACKED = "PACKED", "Packed string per attempt"
+
+
+def default_answer_storage() -> str:
+    return getattr(settings, "QUIZ_ANSWER_STORAGE", AnswerStorage.ROWS)
+
+
 class UserProfile(models.Model):
     user = models.OneToOneField(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="profile"
@@ -18,6 +30,48 @@ class UserProfile(models.Model):
         return f"{self.user.username} ({self.role})"
 
 
+def new_shuffle_secret() -> str:
+    return secrets.token_hex(16)
+
+
+def new_questions_version() -> str:
+    return secrets.token_hex(8)
+
+
+class ExamQuerySet(models.QuerySet):
+    def live(self):
+        return self.filter(deleted_at__isnull=True)
+
+    def with_question_count(self):
+        questions = Question.objects.filter(exam=models.OuterRef("pk")).order_by().values("exam")
+        return self.annotate(
+            question_count=Coalesce(
+                models.Subquery(questions.annotate(n=models.Count("id")).values("n")), 0
+            )
+        )
+
+    def with_summary(self):
+        """Annotate question, attempt and result counts and the mean score.
+
+        Each figure is a correlated subquery, so the joins never multiply and
+        the whole list is still one query.
+        """
+        exam = models.OuterRef("pk")
+        attempts = StudentExamAttempt.objects.filter(exam=exam).order_by().values("exam")
+        results = Result.objects.filter(attempt__exam=exam).order_by().values("attempt__exam")
+        return self.with_question_count().annotate(
+            attempt_count=Coalesce(
+                models.Subquery(attempts.annotate(n=models.Count("id")).values("n")), 0
+            ),
+            submitted_count=Coalesce(
+                models.Subquery(results.annotate(n=models.Count("id")).values("n")), 0
+            ),
+            average_marks=models.Subquery(
+                results.annotate(mean=models.Avg("obtained_marks")).values("mean")
+            ),
+        )
+
+
 class Exam(models.Model):
     title = models.CharField(max_length=255)
     exam_code = models.CharField(max_length=20, unique=True)
@@ -27,10 +81,43 @@ class Exam(models.Model):
         max_digits=6, decimal_places=2, default=0, validators=[MinValueValidator(0)]
     )
     total_marks = models.PositiveIntegerField(default=0)
+    # Scheduled start; students queue in the waiting room until then.
+    starts_at = models.DateTimeField(null=True, blank=True)
+    # Time allowed per attempt; no limit when empty.
+    duration_minutes = models.PositiveIntegerField(
+        null=True, blank=True, validators=[MinValueValidator(1)]
+    )
+    answer_storage = models.CharField(
+        max_length=10, choices=AnswerStorage.choices, default=default_answer_storage
+    )
+    # Each attempt sees an order derived from this secret and its id.
+    shuffle_questions = models.BooleanField(default=False)
+    shuffle_options = models.BooleanField(default=False)
+    shuffle_secret = models.CharField(max_length=32, default=new_shuffle_secret, editable=False)
+    # Replaced whenever a question changes; cached answer keys and papers are
+    # stored under it, so every process retires them with the same commit.
+    questions_version = models.CharField(
+        max_length=16, default=new_questions_version, editable=False
+    )
     created_by = models.ForeignKey(
         settings.AUTH_USER_MODEL, on_delete=models.CASCADE, related_name="exams"
     )
     created_at = models.DateTimeField(auto_now_add=True)
+    # Set by a soft delete; the row and its children are purged later.
+    deleted_at = models.DateTimeField(null=True, blank=True, db_index=True)
+    # Set once the exam's answers have moved to an archive file; attempts and
+    # results stay, so its summaries still come from the database.
+    archived_at = models.DateTimeField(null=True, blank=True)
+
+    objects = ExamQuerySet.as_manager()
+
+    class Meta:
+        indexes = [
+            # A teacher's exam list, newest first, and its keyset cursor.
+            models.Index(
+                fields=["created_by", "-created_at", "-id"], name="exam_owner_recent_idx"
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.title} ({self.exam_code})"
@@ -55,6 +142,12 @@ class Question(models.Model):
     marks = models.PositiveIntegerField(default=1)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            # Paper order, which the answer key and the question list page by.
+            models.Index(fields=["exam", "created_at", "id"], name="question_exam_order_idx")
+        ]
+
     def __str__(self) -> str:
         return f"{self.exam.title}: {self.question_text[:40]}"
 
@@ -66,6 +159,12 @@ class StudentExamAttempt(models.Model):
     )
     started_at = models.DateTimeField(auto_now_add=True)
     submitted_at = models.DateTimeField(null=True, blank=True)
+    deadline = models.DateTimeField(null=True, blank=True)
+    # Client-supplied Idempotency-Key of the request that submitted the attempt.
+    submission_key = models.CharField(max_length=64, blank=True, default="")
+    # One letter per question in answer-key order ("-" when skipped); only
+    # used when the exam stores answers as AnswerStorage.PACKED.
+    packed_answers = models.TextField(blank=True, default="")
 
     class Meta:
         constraints = [
@@ -73,6 +172,14 @@ class StudentExamAttempt(models.Model):
                 fields=["exam", "student"], name="unique_exam_attempt"
             )
         ]
+        indexes = [
+            # Only open attempts with a deadline, which is all the sweeper reads.
+            models.Index(
+                fields=["deadline"],
+                name="open_attempt_deadline_idx",
+                condition=models.Q(submitted_at__isnull=True, deadline__isnull=False),
+            )
+        ]
 
     def __str__(self) -> str:
         return f"{self.exam.title} - {self.student.username}"
@@ -0,0 +1,65 @@
+import base64
+import json
+
+from django.conf import settings
+from django.db.models import Q
+from django.utils.dateparse import parse_datetime
+from rest_framework.exceptions import ParseError
+
+
+def wants_page(request) -> bool:
+    """Lists stay whole unless the client asks for a page, so old clients keep working."""
+    return "cursor" in request.query_params or "limit" in request.query_params
+
+
+def _page_size(request) -> int:
+    raw = request.query_params.get("limit")
+    if raw is None:
+        return settings.QUIZ_PAGE_SIZE
+    try:
+        limit = int(raw)
+    except ValueError as exc:
+        raise ParseError("limit must be an integer.") from exc
+    if limit < 1:
+        raise ParseError("limit must be positive.")
+    return min(limit, settings.QUIZ_MAX_PAGE_SIZE)
+
+
+def _encode_cursor(item) -> str:
+    position = json.dumps([item.created_at.isoformat(), item.pk])
+    return base64.urlsafe_b64encode(position.encode()).decode()
+
+
+def _decode_cursor(cursor: str):
+    try:
+        created_at, pk = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        created_at = parse_datetime(created_at)
+        if created_at is None or not isinstance(pk, int):
+            raise ValueError(cursor)
+    except (ValueError, TypeError) as exc:
+        raise ParseError("Invalid cursor.") from exc
+    return created_at, pk
+
+
+def keyset_page(request, queryset, descending: bool = False) -> tuple[list, str | None]:
+    """Return one page of ``queryset`` by ``(created_at, id)`` and the next cursor.
+
+    The cursor is the last row's position, so each page is a range scan from
+    there on the matching index however deep the client has paged.
+    """
+    limit = _page_size(request)
+    if descending:
+        queryset = queryset.order_by("-created_at", "-id")
+    else:
+        queryset = queryset.order_by("created_at", "id")
+    cursor = request.query_params.get("cursor")
+    if cursor:
+        created_at, pk = _decode_cursor(cursor)
+        if descending:
+            after = Q(created_at__lt=created_at) | Q(created_at=created_at, id__lt=pk)
+        else:
+            after = Q(created_at__gt=created_at) | Q(created_at=created_at, id__gt=pk)
+        queryset = queryset.filter(after)
+    items = list(queryset[: limit + 1])
+    next_cursor = _encode_cursor(items[limit - 1]) if len(items) > limit else None
+    return items[:limit], next_cursor
@@ -0,0 +1,21 @@
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import Question
+from .routers import primary_reads
+from .serializers import QuestionStudentSerializer
+
+PAPER_CACHE_KEY = "quiz:paper:{exam_id}:{version}"
+
+
+def get_student_paper(exam) -> list:
+    """Serialized questions as students see them, shared by every attempt."""
+    cache_key = PAPER_CACHE_KEY.format(exam_id=exam.id, version=exam.questions_version)
+    paper = cache.get(cache_key)
+    if paper is None:
+        with primary_reads():
+            questions = Question.objects.filter(exam_id=exam.id).order_by("created_at", "id")
+            paper = QuestionStudentSerializer(questions, many=True).data
+        cache.set(cache_key, paper, settings.QUIZ_ANSWER_KEY_TIMEOUT)
+    return paper
+
@@ -0,0 +1,72 @@
+import logging
+import threading
+
+from django.conf import settings
+from django.db import connections, transaction
+from django.utils import timezone
+
+from .models import Exam, Question, Result, StudentAnswer, StudentExamAttempt
+from .results import invalidate_exam_results
+from .waiting_room import invalidate_exam_snapshot
+
+logger = logging.getLogger(__name__)
+
+# Children first, so no statement has to cascade.
+PURGE_ORDER = (
+    (StudentAnswer, "attempt__exam_id"),
+    (Result, "attempt__exam_id"),
+    (StudentExamAttempt, "exam_id"),
+    (Question, "exam_id"),
+)
+
+
+def delete_in_batches(queryset, batch_size: int) -> int:
+    """Delete ``queryset`` with plain ``DELETE ... WHERE pk IN`` statements.
+
+    Only primary keys are loaded, at most ``batch_size`` at a time, and each
+    batch commits on its own so write locks stay short. Signals and Django's
+    cascade collector are skipped; callers delete children first.
+    """
+    model = queryset.model
+    deleted = 0
+    while True:
+        ids = list(queryset.order_by("pk").values_list("pk", flat=True)[:batch_size])
+        if not ids:
+            return deleted
+        deleted += model.objects.filter(pk__in=ids)._raw_delete(queryset.db)
+
+
+def purge_exam(exam_id: int, batch_size: int | None = None) -> int:
+    batch_size = batch_size or settings.QUIZ_PURGE_BATCH_SIZE
+    deleted = 0
+    for model, lookup in PURGE_ORDER:
+        deleted += delete_in_batches(model.objects.filter(**{lookup: exam_id}), batch_size)
+    exams = Exam.objects.filter(id=exam_id, deleted_at__isnull=False)
+    # Cached answer keys and papers are named by the deleted row's version,
+    # so nothing can look them up again; they expire on their own.
+    deleted += exams._raw_delete(exams.db)
+    return deleted
+
+
+def _purge_in_background(exam_id: int) -> None:
+    try:
+        purge_exam(exam_id)
+    except Exception:
+        logger.exception("Background purge of exam %s failed", exam_id)
+    finally:
+        connections.close_all()
+
+
+def soft_delete_exam(exam) -> None:
+    """Hide ``exam`` immediately and schedule removal of its rows."""
+    Exam.objects.filter(id=exam.id).update(deleted_at=timezone.now(), is_active=False)
+    invalidate_exam_snapshot(exam.exam_code)
+    # After the commit, so a concurrent read cannot re-cache a result from
+    # before the delete.
+    transaction.on_commit(lambda: invalidate_exam_results(exam.id))
+    if settings.QUIZ_PURGE_IN_BACKGROUND:
+        transaction.on_commit(
+            lambda: threading.Thread(
+                target=_purge_in_background, args=(exam.id,), daemon=True
+            ).start()
+        )
@@ -0,0 +1,56 @@
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import StudentExamAttempt
+from .serializers import ResultSerializer
+
+RESULT_CACHE_KEY = "quiz:result:{attempt_id}"
+
+
+def _result_entry(result) -> dict:
+    data = dict(ResultSerializer(result).data)
+    digest = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+    return {
+        "student_id": result.attempt.student_id,
+        "data": data,
+        "etag": f'"{digest[:32]}"',
+    }
+
+
+def cache_results(results) -> dict[int, dict]:
+    """Serialize ``results`` and store them by attempt id.
+
+    Results only change through a regrade, which evicts them, so entries are
+    kept for QUIZ_RESULT_CACHE_TIMEOUT; with QUIZ_RESULT_CACHE off they are
+    only serialized. Callers should have the attempt's student loaded to keep
+    this query-free.
+    """
+    entries = {result.attempt_id: _result_entry(result) for result in results}
+    if not settings.QUIZ_RESULT_CACHE:
+        return entries
+    cache.set_many(
+        {
+            RESULT_CACHE_KEY.format(attempt_id=attempt_id): entry
+            for attempt_id, entry in entries.items()
+        },
+        settings.QUIZ_RESULT_CACHE_TIMEOUT,
+    )
+    return entries
+
+
+def get_cached_result(attempt_id: int) -> dict | None:
+    if not settings.QUIZ_RESULT_CACHE:
+        return None
+    return cache.get(RESULT_CACHE_KEY.format(attempt_id=attempt_id))
+
+
+def invalidate_exam_results(exam_id: int) -> None:
+    if not settings.QUIZ_RESULT_CACHE:
+        return
+    attempt_ids = StudentExamAttempt.objects.filter(exam_id=exam_id).values_list("id", flat=True)
+    cache.delete_many(
+        [RESULT_CACHE_KEY.format(attempt_id=attempt_id) for attempt_id in attempt_ids.iterator()]
+    )
@@ -0,0 +1,74 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from functools import wraps
+
+from django.db import connections
+from rest_framework.permissions import SAFE_METHODS
+
+REPLICA = "replica"
+STICKY_COOKIE = "quiz_primary"
+
+_read_alias = ContextVar("quiz_read_alias", default=None)
+
+
+def replica_configured() -> bool:
+    return REPLICA in connections.settings
+
+
+class ReplicaRouter:
+    """Send reads to the replica only inside views marked with ``replica_reads``.
+
+    Everything else, including every write, stays on "default", so code that
+    is not opted in never reads stale rows.
+    """
+
+    def db_for_read(self, model, **hints):
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica receives its schema through replication.
+        return False if db == REPLICA else None
+
+
+def replica_reads(view):
+    """Run the safe-method requests of ``view`` against the replica.
+
+    Requests carrying the stickiness cookie, set for a while after any of the
+    user's own writes by ReplicaStickinessMiddleware, keep reading the primary.
+    """
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        if (
+            not replica_configured()
+            or request.method not in SAFE_METHODS
+            or STICKY_COOKIE in request.COOKIES
+        ):
+            return view(request, *args, **kwargs)
+        token = _read_alias.set(REPLICA)
+        try:
+            return view(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+
+    return wrapper
+
+
+@contextmanager
+def primary_reads():
+    """Read from "default" even inside ``replica_reads``.
+
+    For filling shared caches: a lagging replica's rows would otherwise be
+    served to everyone for the entry's whole lifetime.
+    """
+    token = _read_alias.set(None)
+    try:
+        yield
+    finally:
+        _read_alias.reset(token)
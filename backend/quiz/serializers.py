@@ -36,10 +36,15 @@ class ExamSerializer(serializers.ModelSerializer):
             "negative_marking_enabled",
             "negative_marks",
             "total_marks",
+            "starts_at",
+            "duration_minutes",
+            "shuffle_questions",
+            "shuffle_options",
             "created_at",
+            "archived_at",
             "question_count",
         ]
-        read_only_fields = ["id", "created_at", "question_count", "total_marks"]
+        read_only_fields = ["id", "created_at", "archived_at", "question_count", "total_marks"]
 
     def validate(self, attrs):
         enabled = attrs.get(
@@ -67,6 +72,41 @@ class ExamSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class ExamListSerializer(serializers.ModelSerializer):
+    """What an exam list row shows; the settings load with the exam itself."""
+
+    question_count = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Exam
+        fields = [
+            "id",
+            "title",
+            "exam_code",
+            "is_active",
+            "starts_at",
+            "created_at",
+            "archived_at",
+            "question_count",
+        ]
+        read_only_fields = fields
+
+
+class ExamSummarySerializer(ExamSerializer):
+    attempt_count = serializers.IntegerField(read_only=True)
+    submitted_count = serializers.IntegerField(read_only=True)
+    average_marks = serializers.DecimalField(
+        max_digits=8, decimal_places=2, read_only=True, allow_null=True
+    )
+
+    class Meta(ExamSerializer.Meta):
+        fields = ExamSerializer.Meta.fields + [
+            "attempt_count",
+            "submitted_count",
+            "average_marks",
+        ]
+
+
 class QuestionSerializer(serializers.ModelSerializer):
     class Meta:
         model = Question
@@ -95,6 +135,15 @@ class QuestionSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class QuestionSummarySerializer(serializers.ModelSerializer):
+    """A question list row without the text and options."""
+
+    class Meta:
+        model = Question
+        fields = ["id", "exam", "correct_option", "marks", "created_at"]
+        read_only_fields = fields
+
+
 class QuestionStudentSerializer(serializers.ModelSerializer):
     class Meta:
         model = Question
@@ -133,6 +182,7 @@ class StudentExamAttemptSerializer(serializers.ModelSerializer):
             "exam_negative_marking_enabled",
             "exam_negative_marks",
             "started_at",
+            "deadline",
             "submitted_at",
         ]
         read_only_fields = [
@@ -142,6 +192,7 @@ class StudentExamAttemptSerializer(serializers.ModelSerializer):
             "exam_negative_marking_enabled",
             "exam_negative_marks",
             "started_at",
+            "deadline",
             "submitted_at",
         ]
 
@@ -152,6 +203,13 @@ class StudentAnswerSerializer(serializers.ModelSerializer):
         fields = ["question", "selected_option"]
 
 
+class SubmittedAnswerSerializer(serializers.Serializer):
+    # Plain integer ids: membership is checked against the cached answer key
+    # instead of a per-answer Question lookup.
+    question = serializers.IntegerField()
+    selected_option = serializers.ChoiceField(choices=Question.Choice.choices)
+
+
 class ResultSerializer(serializers.ModelSerializer):
     student_username = serializers.CharField(source="attempt.student.username", read_only=True)
 
@@ -0,0 +1,89 @@
+import hashlib
+import hmac
+import random
+from dataclasses import dataclass
+
+from .grading import AnswerKey
+
+LETTERS = "ABCDE"
+
+
+@dataclass(frozen=True)
+class Shuffle:
+    """One attempt's view of the paper.
+
+    ``question_order`` lists answer-key indexes in display order and
+    ``option_orders[i]`` gives, for key index ``i``, the original letter shown
+    in each display position ("CADB" shows original C as A).
+    """
+
+    question_order: list[int]
+    option_orders: list[str]
+
+
+def attempt_seed(exam, attempt_id: int) -> int:
+    digest = hmac.new(
+        exam.shuffle_secret.encode(), str(attempt_id).encode(), hashlib.sha256
+    ).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def get_shuffle(exam, attempt_id: int, key: AnswerKey) -> Shuffle | None:
+    """Recompute the attempt's order; None when the exam does not shuffle."""
+    if not (exam.shuffle_questions or exam.shuffle_options):
+        return None
+    seed = attempt_seed(exam, attempt_id)
+    question_order = list(range(len(key)))
+    if exam.shuffle_questions:
+        random.Random(seed).shuffle(question_order)
+    option_orders = []
+    for question_id, count in zip(key.question_ids, key.option_counts):
+        letters = list(LETTERS[:count])
+        if exam.shuffle_options:
+            # Seeded by id, so adding or removing a question mid-exam leaves
+            # the options (and saved answers) of the others where they were.
+            random.Random(f"{seed}:{question_id}").shuffle(letters)
+        option_orders.append("".join(letters))
+    return Shuffle(question_order, option_orders)
+
+
+def shuffle_paper(paper: list, key: AnswerKey, shuffle: Shuffle | None) -> list:
+    """Reorder the shared cached ``paper`` for one attempt without mutating it."""
+    if shuffle is None:
+        return paper
+    by_id = {question["id"]: question for question in paper}
+    shuffled = []
+    for index in shuffle.question_order:
+        original = by_id.get(key.question_ids[index])
+        if original is None:
+            # Key and paper read across a question change; the next request
+            # sees both at the new version.
+            continue
+        question = dict(original)
+        for position, letter in enumerate(shuffle.option_orders[index]):
+            question[f"option_{LETTERS[position].lower()}"] = original[f"option_{letter.lower()}"]
+        shuffled.append(question)
+    return shuffled
+
+
+def display_order(key: AnswerKey, shuffle: Shuffle | None) -> list[int]:
+    """Question ids in the order the attempt sees them."""
+    if shuffle is None:
+        return list(key.question_ids)
+    return [key.question_ids[index] for index in shuffle.question_order]
+
+
+def unshuffle_answers(
+    answer_map: dict[int, str], key: AnswerKey, shuffle: Shuffle | None
+) -> dict[int, str]:
+    """Map displayed option letters back to the original ones for grading."""
+    if shuffle is None:
+        return answer_map
+    ordinals = key.ordinals()
+    unshuffled = {}
+    for question_id, selected in answer_map.items():
+        order = shuffle.option_orders[ordinals[question_id]]
+        position = LETTERS.index(selected)
+        # A letter past the question's options stays as is and grades wrong.
+        unshuffled[question_id] = order[position] if position < len(order) else selected
+    return unshuffled
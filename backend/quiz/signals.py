@@ -1,11 +1,72 @@
+import threading
+
 from django.conf import settings
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save, pre_delete
 from django.dispatch import receiver
 
-from .models import UserProfile, UserRole
+from .analytics import invalidate_item_analysis
+from .events import joined_event, publish_after_commit, submitted_event
+from .grading import build_answer_key, invalidate_answer_key, repack_answers
+from .models import Exam, Question, Result, StudentExamAttempt, UserProfile, UserRole
+from .waiting_room import invalidate_exam_snapshot
 
 
 @receiver(post_save, sender=settings.AUTH_USER_MODEL)
 def create_profile(sender, instance, created, **kwargs):
     if created:
         UserProfile.objects.create(user=instance, role=UserRole.STUDENT)
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def invalidate_question_caches(sender, instance, **kwargs):
+    # Also retires the student paper, which shares the version.
+    invalidate_answer_key(instance.exam_id)
+
+
+# {exam_id: (origin, question ids before the delete)} for deletes in progress
+# on this thread; keyed by origin so one multi-question delete repacks once.
+_packed_layouts = threading.local()
+
+
+@receiver(pre_delete, sender=Question)
+def remember_packed_layout(sender, instance, origin=None, **kwargs):
+    layouts = _packed_layouts.__dict__.setdefault("exams", {})
+    entry = layouts.get(instance.exam_id)
+    if entry is not None and entry[0] is origin:
+        return
+    packed = StudentExamAttempt.objects.filter(exam_id=instance.exam_id).exclude(packed_answers="")
+    if packed.exists():
+        layouts[instance.exam_id] = (origin, list(build_answer_key(instance.exam_id).question_ids))
+
+
+@receiver(post_delete, sender=Question)
+def repack_after_question_delete(sender, instance, origin=None, **kwargs):
+    # post_delete runs once every row of the delete is gone, so the current
+    # key is the final layout.
+    entry = _packed_layouts.__dict__.get("exams", {}).pop(instance.exam_id, None)
+    if entry is not None and entry[0] is origin:
+        repack_answers(instance.exam_id, entry[1])
+
+
+@receiver(post_save, sender=Exam)
+def invalidate_exam_caches(sender, instance, **kwargs):
+    invalidate_exam_snapshot(instance.exam_code)
+
+
+@receiver(post_save, sender=Result)
+def invalidate_result_caches(sender, instance, created, **kwargs):
+    # After commit, so a concurrent reader cannot refill it from older rows.
+    exam_id = instance.attempt.exam_id
+    transaction.on_commit(lambda: invalidate_item_analysis(exam_id))
+    if created:
+        publish_after_commit(
+            instance.attempt.exam_id, lambda: submitted_event(instance)
+        )
+
+
+@receiver(post_save, sender=StudentExamAttempt)
+def announce_attempt(sender, instance, created, **kwargs):
+    if created:
+        publish_after_commit(instance.exam_id, lambda: joined_event(instance))
@@ -0,0 +1,130 @@
+import logging
+import threading
+import time
+from datetime import timedelta
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+from django.utils import timezone
+
+from .analytics import invalidate_item_analysis
+from .events import publish_after_commit, submitted_event
+from .grading import get_answer_key, load_answer_maps, score_answers
+from .models import Result, StudentExamAttempt
+from .results import cache_results
+
+logger = logging.getLogger(__name__)
+
+
+def submission_cutoff(now=None):
+    """Deadlines before this instant no longer accept answers."""
+    now = now or timezone.now()
+    return now - timedelta(seconds=settings.QUIZ_SUBMIT_GRACE_SECONDS)
+
+
+def is_expired(attempt, now=None) -> bool:
+    return attempt.deadline is not None and attempt.deadline < submission_cutoff(now)
+
+
+def grade_open_attempts(attempts, now=None) -> list[Result]:
+    """Close ``attempts`` and grade them from their saved answers.
+
+    Each attempt is claimed with a conditional UPDATE, so one the student
+    submitted in the meantime is skipped instead of graded twice. Answers are
+    loaded with one query per exam, results are inserted in bulk and cached
+    once committed (load ``attempts`` with their student to avoid a query
+    per result).
+    """
+    now = now or timezone.now()
+    by_exam = {}
+    for attempt in attempts:
+        by_exam.setdefault(attempt.exam_id, []).append(attempt)
+
+    results = []
+    with transaction.atomic():
+        for exam_attempts in by_exam.values():
+            exam = exam_attempts[0].exam
+            key = get_answer_key(exam)
+            answer_maps = load_answer_maps(exam, exam_attempts, key)
+            total = Decimal(exam.total_marks)
+            for attempt in exam_attempts:
+                claimed = StudentExamAttempt.objects.filter(
+                    id=attempt.id, submitted_at__isnull=True
+                ).update(submitted_at=now)
+                if not claimed:
+                    continue
+                attempt.submitted_at = now
+                results.append(
+                    Result(
+                        attempt=attempt,
+                        total_marks=total,
+                        obtained_marks=score_answers(key, answer_maps[attempt.id], exam),
+                    )
+                )
+        Result.objects.bulk_create(results)
+        # bulk_create skips post_save, so announce the results here.
+        for result in results:
+            publish_after_commit(
+                result.attempt.exam_id, lambda result=result: submitted_event(result)
+            )
+        transaction.on_commit(lambda: cache_results(results))
+
+    for exam_id in by_exam:
+        transaction.on_commit(lambda exam_id=exam_id: invalidate_item_analysis(exam_id))
+    return results
+
+
+def sweep_expired_attempts(batch_size: int | None = None) -> int:
+    """Grade one batch of attempts whose deadline has passed."""
+    batch_size = batch_size or settings.QUIZ_SWEEP_BATCH_SIZE
+    attempts = list(
+        StudentExamAttempt.objects.filter(
+            submitted_at__isnull=True,
+            deadline__isnull=False,
+            deadline__lt=submission_cutoff(),
+            exam__deleted_at__isnull=True,
+        )
+        .select_related("exam", "student")
+        .order_by("deadline")[:batch_size]
+    )
+    if not attempts:
+        return 0
+    return len(grade_open_attempts(attempts))
+
+
+def sweep_all_expired_attempts(batch_size: int | None = None) -> int:
+    """Grade every attempt whose deadline has passed, a batch at a time."""
+    batch_size = batch_size or settings.QUIZ_SWEEP_BATCH_SIZE
+    graded = 0
+    while True:
+        swept = sweep_expired_attempts(batch_size)
+        graded += swept
+        if swept < batch_size:
+            return graded
+
+
+def _sweep_forever(interval: float) -> None:
+    while True:
+        time.sleep(interval)
+        try:
+            graded = sweep_all_expired_attempts()
+            if graded:
+                logger.info("Graded %s expired attempts", graded)
+        except Exception:
+            logger.exception("Sweeping expired attempts failed")
+        finally:
+            close_old_connections()
+
+
+def start_background_sweeper(interval: float) -> threading.Thread:
+    """Sweep every ``interval`` seconds from a daemon thread of this process.
+
+    Attempts are claimed with a conditional UPDATE, so several workers
+    sweeping at once never grade one twice.
+    """
+    thread = threading.Thread(
+        target=_sweep_forever, args=(interval,), name="quiz-sweeper", daemon=True
+    )
+    thread.start()
+    return thread
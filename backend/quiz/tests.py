@@ -0,0 +1,415 @@
+import io
+import json
+import tempfile
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import PBKDF2PasswordHasher
+from django.core.cache import cache
+from django.db import connections
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+
+from .backup import BackupError, read_backup, write_backup
+from .events import broker
+from .analytics import get_item_analysis
+from .grading import get_answer_key
+from .hashers import TunedPBKDF2PasswordHasher
+from .middleware import _profiler_lock
+from .models import Exam, Question, Result, StudentExamAttempt, UserProfile, UserRole
+from .results import invalidate_exam_results
+from .routers import REPLICA, STICKY_COOKIE
+from .shuffling import get_shuffle
+from .throttling import _local_store
+
+
+def make_user(username: str, role: str):
+    user = get_user_model().objects.create_user(username=username, password="password")
+    UserProfile.objects.filter(user=user).update(role=role)
+    return user
+
+
+class BootstrapQueryBudgetTests(TestCase):
+    """Page load is one request, and its query count must not grow with the data."""
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.teacher = make_user("teacher", UserRole.TEACHER)
+        cls.student = make_user("student", UserRole.STUDENT)
+        for number in range(5):
+            exam = Exam.objects.create(
+                title=f"Exam {number}", exam_code=f"CODE{number}", created_by=cls.teacher
+            )
+            Question.objects.bulk_create(
+                Question(
+                    exam=exam,
+                    question_text=f"Question {index}",
+                    option_a="a",
+                    option_b="b",
+                    option_c="c",
+                    option_d="d",
+                    correct_option="A",
+                )
+                for index in range(3)
+            )
+        cls.attempt = StudentExamAttempt.objects.create(exam=exam, student=cls.student)
+
+    def test_teacher_bootstrap(self):
+        self.client.force_login(self.teacher)
+        # Session, user, profile and the annotated exam list.
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("api-bootstrap"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["profile"]["role"], UserRole.TEACHER)
+        self.assertEqual(len(response.json()["exams"]), 5)
+        self.assertEqual(response.json()["exams"][0]["question_count"], 3)
+
+    def test_student_bootstrap(self):
+        self.client.force_login(self.student)
+        # Session, user, profile and the open attempt with its exam.
+        with self.assertNumQueries(4):
+            response = self.client.get(reverse("api-bootstrap"))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["profile"]["role"], UserRole.STUDENT)
+        self.assertEqual(response.json()["active_attempt"]["id"], self.attempt.id)
+
+    def test_anonymous_bootstrap(self):
+        response = self.client.get(reverse("api-bootstrap"))
+        self.assertIn(response.status_code, (401, 403))
+
+
+@override_settings(
+    QUIZ_THROTTLE_BACKEND="memory",
+    QUIZ_THROTTLE_RATES={"login": {"user": "2/min", "ip": "5/min", "global": "100/s"}},
+)
+class LoginThrottleTests(TestCase):
+    def setUp(self):
+        _local_store.buckets.clear()
+
+    def login(self, username: str, address: str = "203.0.113.7"):
+        return self.client.post(
+            reverse("api-login"),
+            {"username": username, "password": "wrong"},
+            content_type="application/json",
+            REMOTE_ADDR=address,
+        )
+
+    def test_bucket_is_per_username_not_per_address(self):
+        self.assertEqual(self.login("student0").status_code, 401)
+        self.assertEqual(self.login(" Student0").status_code, 401)
+        self.assertEqual(self.login("student0").status_code, 429)
+        # A classmate behind the same NAT address is unaffected.
+        self.assertEqual(self.login("student1").status_code, 401)
+
+    def test_address_bucket_caps_username_spraying(self):
+        for number in range(5):
+            self.assertEqual(self.login(f"student{number}").status_code, 401)
+        self.assertEqual(self.login("student9").status_code, 429)
+        self.assertEqual(self.login("student9", address="198.51.100.1").status_code, 401)
+
+
+class TunedHasherTests(TestCase):
+    def test_iterations_never_drop_below_django_default(self):
+        default = PBKDF2PasswordHasher.iterations
+        with override_settings(QUIZ_PBKDF2_ITERATIONS=600_000):
+            self.assertEqual(TunedPBKDF2PasswordHasher().iterations, default)
+        with override_settings(QUIZ_PBKDF2_ITERATIONS=default * 2):
+            self.assertEqual(TunedPBKDF2PasswordHasher().iterations, default * 2)
+
+
+@override_settings(QUIZ_EVENT_STREAMS_PER_WORKER=1)
+class EventStreamLimitTests(TestCase):
+    def test_streams_are_capped_per_worker(self):
+        teacher = make_user("teacher", UserRole.TEACHER)
+        exam = Exam.objects.create(title="Live", exam_code="LIVE1", created_by=teacher)
+        self.client.force_login(teacher)
+        url = reverse("api-exam-events", args=[exam.id])
+        first = self.client.get(url, HTTP_ACCEPT="text/event-stream")
+        self.assertEqual(first.status_code, 200)
+        busy = self.client.get(url, HTTP_ACCEPT="text/event-stream")
+        self.assertEqual(busy.status_code, 503)
+        self.assertEqual(busy["Retry-After"], "10")
+        # Closing a stream that never started still frees its slot.
+        first.close()
+        second = self.client.get(url, HTTP_ACCEPT="text/event-stream")
+        self.assertEqual(second.status_code, 200)
+        second.close()
+        self.assertEqual(broker.streams, 0)
+
+
+class ProfilingTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.enterContext(
+            override_settings(QUIZ_PROFILE_SAMPLE_RATE=1.0, QUIZ_PROFILE_DIR=directory.name)
+        )
+
+    def test_sampled_request_is_profiled(self):
+        response = self.client.get(reverse("api-bootstrap"))
+        self.assertIn("X-Profile-Id", response)
+
+    def test_concurrent_request_runs_unprofiled(self):
+        # Another thread of the worker holds the process's only profiler.
+        with _profiler_lock:
+            response = self.client.get(reverse("api-bootstrap"))
+        self.assertNotIn("X-Profile-Id", response)
+        self.assertIn(response.status_code, (401, 403))
+
+
+class RestoreReplaceTests(TestCase):
+    def test_replace_clears_bootstrap_rows(self):
+        teacher = make_user("teacher", UserRole.TEACHER)
+        Exam.objects.create(title="Kept", exam_code="KEPT1", created_by=teacher)
+        archive = io.BytesIO()
+        for _ in write_backup(archive):
+            pass
+        # What migrate's post_migrate hook leaves in a fresh database.
+        Exam.objects.all().delete()
+        get_user_model().objects.all().delete()
+        get_user_model().objects.create_superuser("admin", password="password")
+
+        archive.seek(0)
+        with self.assertRaises(BackupError):
+            list(read_backup(archive))
+        archive.seek(0)
+        list(read_backup(archive, replace=True))
+        self.assertEqual(
+            list(get_user_model().objects.values_list("username", flat=True)), ["teacher"]
+        )
+        self.assertEqual(Exam.objects.get().exam_code, "KEPT1")
+
+
+class AnswerKeyVersionTests(TestCase):
+    def test_question_change_moves_the_version_on_the_exam(self):
+        teacher = make_user("teacher", UserRole.TEACHER)
+        exam = Exam.objects.create(title="Key", exam_code="KEY1", created_by=teacher)
+        question = Question.objects.create(
+            exam=exam,
+            question_text="Question",
+            option_a="a",
+            option_b="b",
+            option_c="c",
+            option_d="d",
+            correct_option="A",
+        )
+        exam.refresh_from_db()
+        self.assertEqual(get_answer_key(exam).correct_options, "A")
+        question.correct_option = "B"
+        question.save()
+        stale_version = exam.questions_version
+        # Any process reading the row now looks under the new version.
+        exam.refresh_from_db()
+        self.assertNotEqual(exam.questions_version, stale_version)
+        self.assertEqual(get_answer_key(exam).correct_options, "B")
+
+
+class ResultCacheTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_user("student", UserRole.STUDENT)
+        teacher = make_user("teacher", UserRole.TEACHER)
+        exam = Exam.objects.create(title="Graded", exam_code="GRADE1", created_by=teacher)
+        cls.attempt = StudentExamAttempt.objects.create(
+            exam=exam, student=cls.student, submitted_at=timezone.now()
+        )
+        Result.objects.create(attempt=cls.attempt, total_marks=10, obtained_marks=4)
+
+    def setUp(self):
+        cache.clear()
+
+    def fetch_marks(self):
+        response = self.client.get(reverse("api-attempt-result", args=[self.attempt.id]))
+        self.assertEqual(response.status_code, 200)
+        return response.json()["obtained_marks"]
+
+    def test_without_shared_cache_results_come_from_the_database(self):
+        self.client.force_login(self.student)
+        self.assertEqual(self.fetch_marks(), "4.00")
+        # A regrade in another process cannot evict this process's cache.
+        Result.objects.filter(attempt=self.attempt).update(obtained_marks=7)
+        self.assertEqual(self.fetch_marks(), "7.00")
+
+    @override_settings(QUIZ_RESULT_CACHE=True)
+    def test_shared_cache_serves_until_evicted(self):
+        self.client.force_login(self.student)
+        self.assertEqual(self.fetch_marks(), "4.00")
+        Result.objects.filter(attempt=self.attempt).update(obtained_marks=7)
+        self.assertEqual(self.fetch_marks(), "4.00")
+        invalidate_exam_results(self.attempt.exam_id)
+        self.assertEqual(self.fetch_marks(), "7.00")
+
+    def test_item_analysis_is_evicted_once_the_result_commits(self):
+        exam = self.attempt.exam
+        self.assertEqual(get_item_analysis(exam)["result_count"], 1)
+        other = StudentExamAttempt.objects.create(
+            exam=exam, student=make_user("other", UserRole.STUDENT), submitted_at=timezone.now()
+        )
+        with self.captureOnCommitCallbacks() as callbacks:
+            Result.objects.create(attempt=other, total_marks=10, obtained_marks=9)
+            # Until commit, readers keep the cached copy instead of refilling it
+            # from rows about to change.
+            self.assertEqual(get_item_analysis(exam)["result_count"], 1)
+        for callback in callbacks:
+            callback()
+        self.assertEqual(get_item_analysis(exam)["result_count"], 2)
+
+
+class ShufflingTests(TestCase):
+    def test_option_orders_survive_question_changes(self):
+        teacher = make_user("teacher", UserRole.TEACHER)
+        exam = Exam.objects.create(
+            title="Shuffled", exam_code="SHUF1", created_by=teacher, shuffle_options=True
+        )
+        questions = [
+            Question.objects.create(
+                exam=exam,
+                question_text=f"Question {index}",
+                option_a="a",
+                option_b="b",
+                option_c="c",
+                option_d="d",
+                correct_option="A",
+            )
+            for index in range(8)
+        ]
+
+        def option_orders():
+            exam.refresh_from_db()
+            key = get_answer_key(exam)
+            shuffle = get_shuffle(exam, 1, key)
+            return dict(zip(key.question_ids, shuffle.option_orders))
+
+        before = option_orders()
+        questions[0].delete()
+        Question.objects.create(
+            exam=exam,
+            question_text="Added",
+            option_a="a",
+            option_b="b",
+            option_c="c",
+            option_d="d",
+            correct_option="A",
+        )
+        after = option_orders()
+        for question in questions[1:]:
+            self.assertEqual(after[question.id], before[question.id])
+
+
+class AutosaveTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.student = make_user("student", UserRole.STUDENT)
+        teacher = make_user("teacher", UserRole.TEACHER)
+        exam = Exam.objects.create(title="Saved", exam_code="SAVE1", created_by=teacher)
+        cls.question = Question.objects.create(
+            exam=exam,
+            question_text="Question",
+            option_a="a",
+            option_b="b",
+            option_c="c",
+            option_d="d",
+            correct_option="A",
+        )
+        cls.attempt = StudentExamAttempt.objects.create(exam=exam, student=cls.student)
+
+    def test_autosave_after_submit_is_rejected(self):
+        student, question, attempt = self.student, self.question, self.attempt
+        self.client.force_login(student)
+        url = reverse("api-attempt-answers", args=[attempt.id])
+        body = {"answers": [{"question": question.id, "selected_option": "A"}]}
+        response = self.client.put(url, body, content_type="application/json")
+        self.assertEqual(response.json(), {"saved": 1})
+
+        def submitted_meanwhile(checked_attempt):
+            # A submit claims the attempt between the first check and the write.
+            StudentExamAttempt.objects.filter(id=attempt.id).update(submitted_at=timezone.now())
+            return False
+
+        body["answers"][0]["selected_option"] = "B"
+        with mock.patch("quiz.views.is_expired", submitted_meanwhile):
+            response = self.client.put(url, body, content_type="application/json")
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(
+            list(attempt.answers.values_list("selected_option", flat=True)), ["A"]
+        )
+
+    def test_non_string_bundle_token_is_a_bad_request(self):
+        self.client.force_login(self.student)
+        for url in (
+            reverse("api-attempt-answers", args=[self.attempt.id]),
+            reverse("api-attempt-submit", args=[self.attempt.id]),
+        ):
+            response = self.client.generic(
+                "PUT" if "answers" in url else "POST",
+                url,
+                json.dumps({"packed": "A", "token": 123}),
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 400)
+            self.assertEqual(response.json()["detail"], "Invalid bundle token.")
+
+
+class ReplicaRoutingTests(TransactionTestCase):
+    """Two aliases on one SQLite database; which connection runs a query is the routing."""
+
+    # Resolved when the class is set up, after setUpClass adds the replica.
+    databases = "__all__"
+
+    @classmethod
+    def setUpClass(cls):
+        connections.settings[REPLICA] = dict(connections["default"].settings_dict)
+        super().setUpClass()
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        connections[REPLICA].close()
+        del connections.settings[REPLICA]
+
+    def setUp(self):
+        self.teacher = make_user("teacher", UserRole.TEACHER)
+        self.exam = Exam.objects.create(title="Routed", exam_code="ROUTE1", created_by=self.teacher)
+        self.client.force_login(self.teacher)
+
+    def queries(self, method, url, **extra):
+        with (
+            CaptureQueriesContext(connections["default"]) as primary,
+            CaptureQueriesContext(connections[REPLICA]) as replica,
+        ):
+            response = getattr(self.client, method)(url, content_type="application/json", **extra)
+        self.assertLess(response.status_code, 400)
+        return response, len(primary), len(replica)
+
+    def test_marked_views_read_from_the_replica(self):
+        _, _, replica = self.queries("get", reverse("api-exams"))
+        self.assertGreater(replica, 0)
+
+    def test_writes_go_to_default_and_pin_later_reads(self):
+        body = json.dumps({"title": "New", "exam_code": "ROUTE2"})
+        response, primary, replica = self.queries("post", reverse("api-exams"), data=body)
+        self.assertEqual(replica, 0)
+        self.assertGreater(primary, 0)
+        self.assertIn(STICKY_COOKIE, response.cookies)
+        _, _, replica = self.queries("get", reverse("api-exams"))
+        self.assertEqual(replica, 0)
+
+    def test_students_are_pinned_after_their_writes_too(self):
+        student = make_user("student", UserRole.STUDENT)
+        self.client.force_login(student)
+        response, _, _ = self.queries(
+            "post", reverse("api-exam-join"), data=json.dumps({"exam_code": "ROUTE1"})
+        )
+        self.assertIn(STICKY_COOKIE, response.cookies)
+        _, _, replica = self.queries("get", reverse("api-bootstrap"))
+        self.assertEqual(replica, 0)
+
+    def test_cache_fills_read_the_primary(self):
+        cache.clear()
+        url = reverse("api-exam-item-analysis", args=[self.exam.id])
+        _, _, replica = self.queries("get", url)
+        # Only the ownership check reads the replica; the analysis is built
+        # from "default" because it is cached for everyone.
+        self.assertEqual(replica, 1)
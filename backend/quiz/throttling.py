@@ -0,0 +1,169 @@
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework.throttling import BaseThrottle
+
+PERIODS = {"s": 1, "sec": 1, "m": 60, "min": 60, "h": 3600, "hour": 3600}
+
+
+def parse_rate(rate: str) -> tuple[float, float]:
+    """Turn ``"20/min"`` into ``(capacity, tokens_per_second)``."""
+    count, period = rate.split("/")
+    capacity = float(count)
+    return capacity, capacity / PERIODS[period]
+
+
+class LocalBucketStore:
+    """Token buckets in process memory; least recently used ones are evicted."""
+
+    def __init__(self, max_buckets: int = 10000):
+        self.max_buckets = max_buckets
+        self.buckets = OrderedDict()
+        self.lock = threading.Lock()
+
+    def take(self, name: str, capacity: float, refill: float, now: float) -> tuple[bool, float]:
+        with self.lock:
+            tokens, stamp = self.buckets.pop(name, (capacity, now))
+            tokens = min(capacity, tokens + (now - stamp) * refill)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self.buckets[name] = (tokens, now)
+            if len(self.buckets) > self.max_buckets:
+                self.buckets.popitem(last=False)
+            return allowed, tokens
+
+    def peek(self, name: str, capacity: float, refill: float, now: float) -> float:
+        with self.lock:
+            tokens, stamp = self.buckets.get(name, (capacity, now))
+        return min(capacity, tokens + (now - stamp) * refill)
+
+
+class CacheBucketStore:
+    """Token buckets in the shared Django cache, so limits span workers.
+
+    The read-modify-write is not atomic; under contention a bucket may hand
+    out a few extra tokens, which is fine for admission control.
+    """
+
+    prefix = "quiz:bucket:"
+
+    def take(self, name: str, capacity: float, refill: float, now: float) -> tuple[bool, float]:
+        tokens = self.peek(name, capacity, refill, now)
+        allowed = tokens >= 1
+        if allowed:
+            tokens -= 1
+        cache.set(self.prefix + name, (tokens, now), int(capacity / refill) + 1)
+        return allowed, tokens
+
+    def peek(self, name: str, capacity: float, refill: float, now: float) -> float:
+        tokens, stamp = cache.get(self.prefix + name, (capacity, now))
+        return min(capacity, tokens + (now - stamp) * refill)
+
+
+_local_store = LocalBucketStore()
+_counters = {}
+_counters_lock = threading.Lock()
+
+
+def get_store():
+    if settings.QUIZ_THROTTLE_BACKEND == "cache":
+        return CacheBucketStore()
+    return _local_store
+
+
+def _count(scope: str, outcome: str) -> None:
+    with _counters_lock:
+        counts = _counters.setdefault(scope, {"allowed": 0, "throttled": 0})
+        counts[outcome] += 1
+
+
+class TokenBucketThrottle(BaseThrottle):
+    """Per-client, per-address and global token buckets for a QUIZ_THROTTLE_RATES scope.
+
+    A request spends one token from each configured bucket; when any is empty
+    it is rejected with 429 and a Retry-After of the time to the next token.
+    """
+
+    scope = None
+
+    def get_client_key(self, request) -> str:
+        if request.user and request.user.is_authenticated:
+            return f"user:{request.user.pk}"
+        return f"ip:{self.get_ident(request)}"
+
+    def allow_request(self, request, view) -> bool:
+        rates = settings.QUIZ_THROTTLE_RATES.get(self.scope)
+        if not rates:
+            return True
+        store = get_store()
+        now = time.time()
+        # Client bucket first, so one noisy client cannot drain the global one.
+        buckets = [
+            (f"{self.scope}:{self.get_client_key(request)}", rates.get("user")),
+            (f"{self.scope}:ip:{self.get_ident(request)}", rates.get("ip")),
+            (f"{self.scope}:global", rates.get("global")),
+        ]
+        self.retry_after = None
+        for name, rate in buckets:
+            if not rate:
+                continue
+            capacity, refill = parse_rate(rate)
+            allowed, tokens = store.take(name, capacity, refill, now)
+            if not allowed:
+                self.retry_after = (1 - tokens) / refill
+                _count(self.scope, "throttled")
+                return False
+        _count(self.scope, "allowed")
+        return True
+
+    def wait(self):
+        return self.retry_after
+
+
+class LoginThrottle(TokenBucketThrottle):
+    """Per-username buckets: a lab behind one address does not share one."""
+
+    scope = "login"
+
+    def get_client_key(self, request) -> str:
+        username = request.data.get("username") if hasattr(request.data, "get") else None
+        if not isinstance(username, str) or not username.strip():
+            return super().get_client_key(request)
+        digest = hashlib.sha256(username.strip().lower().encode()).hexdigest()[:32]
+        return f"username:{digest}"
+
+
+class JoinThrottle(TokenBucketThrottle):
+    scope = "join"
+
+
+class SubmitThrottle(TokenBucketThrottle):
+    scope = "submit"
+
+
+def throttle_metrics() -> dict:
+    """Request counters of this process and the fill level of global buckets."""
+    store = get_store()
+    now = time.time()
+    with _counters_lock:
+        counters = {scope: dict(counts) for scope, counts in _counters.items()}
+    scopes = {}
+    for scope, rates in settings.QUIZ_THROTTLE_RATES.items():
+        global_tokens = None
+        if rates.get("global"):
+            capacity, refill = parse_rate(rates["global"])
+            global_tokens = round(store.peek(f"{scope}:global", capacity, refill, now), 2)
+        scopes[scope] = {
+            "rates": rates,
+            "global_tokens": global_tokens,
+            **counters.get(scope, {"allowed": 0, "throttled": 0}),
+        }
+    metrics = {"backend": settings.QUIZ_THROTTLE_BACKEND, "scopes": scopes}
+    if store is _local_store:
+        metrics["tracked_buckets"] = len(_local_store.buckets)
+    return metrics
@@ -1,36 +1,60 @@
+from datetime import timedelta
 from decimal import Decimal
 
+from django.conf import settings
 from django.contrib.auth import authenticate, login, logout
-from django.db.models import Count, F
+from django.db import transaction
+from django.db.models import F, Q
+from django.http import HttpResponseNotModified, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
 from django.views.decorators.csrf import ensure_csrf_cookie
 from rest_framework import status
-from rest_framework.decorators import api_view, permission_classes
-from rest_framework.permissions import AllowAny, IsAuthenticated
+from rest_framework.decorators import (
+    api_view,
+    permission_classes,
+    renderer_classes,
+    throttle_classes,
+)
+from rest_framework.permissions import AllowAny, IsAdminUser, IsAuthenticated
+from rest_framework.renderers import JSONRenderer
 from rest_framework.response import Response
 
+from .analytics import get_item_analysis
+from .bundles import BundleError, build_bundle, parse_packed_answers
+from .cloning import clone_exam
+from .events import EventStreamBusy, EventStreamRenderer, ExamEventStream
+from .grading import get_answer_key, load_answer_map, save_answers, score_answers
 from .models import (
     Exam,
-    Question,
     Result,
-    StudentAnswer,
     StudentExamAttempt,
     UserProfile,
     UserRole,
 )
+from .pagination import keyset_page, wants_page
+from .papers import get_student_paper
 from .permissions import IsStudent, IsTeacher
+from .purge import soft_delete_exam
+from .results import cache_results, get_cached_result
+from .routers import replica_reads
 from .serializers import (
+    ExamListSerializer,
     ExamSerializer,
+    ExamSummarySerializer,
     QuestionSerializer,
-    QuestionStudentSerializer,
+    QuestionSummarySerializer,
     ResultSerializer,
     LoginSerializer,
     SignupSerializer,
-    StudentAnswerSerializer,
     StudentExamAttemptSerializer,
+    SubmittedAnswerSerializer,
     UserProfileSerializer,
 )
+from .shuffling import get_shuffle, shuffle_paper, unshuffle_answers
+from .sweeper import is_expired
+from .throttling import JoinThrottle, LoginThrottle, SubmitThrottle, throttle_metrics
+from .waiting_room import admission, get_exam_snapshot, invalidate_exam_snapshot
 
 
 @api_view(["GET"])
@@ -42,6 +66,7 @@ def csrf_token(_request):
 
 @api_view(["POST"])
 @permission_classes([AllowAny])
+@throttle_classes([LoginThrottle])
 def login_view(request):
     serializer = LoginSerializer(data=request.data)
     serializer.is_valid(raise_exception=True)  # return 400 on invalid input
@@ -93,16 +118,72 @@ def me_view(request):
     return Response(UserProfileSerializer(profile).data)
 
 
+@api_view(["GET"])
+@permission_classes([IsAuthenticated])
+@replica_reads
+def bootstrap_view(request):
+    """Profile plus the teacher's exam summaries or the student's open attempt."""
+    profile, _ = UserProfile.objects.get_or_create(
+        user=request.user, defaults={"role": UserRole.STUDENT}
+    )
+    profile.user = request.user
+    data = {"profile": UserProfileSerializer(profile).data}
+    if profile.role == UserRole.TEACHER:
+        exams = (
+            Exam.objects.live()
+            .filter(created_by=request.user)
+            .with_summary()
+            .order_by("-created_at")
+        )
+        data["exams"] = ExamSummarySerializer(exams, many=True).data
+    else:
+        attempt = (
+            StudentExamAttempt.objects.filter(
+                student=request.user,
+                submitted_at__isnull=True,
+                exam__deleted_at__isnull=True,
+                exam__is_active=True,
+            )
+            .select_related("exam")
+            .order_by("-started_at")
+            .first()
+        )
+        data["active_attempt"] = (
+            StudentExamAttemptSerializer(attempt).data if attempt is not None else None
+        )
+    return Response(data)
+
+
+@api_view(["GET"])
+@permission_classes([IsAdminUser])
+def throttle_metrics_view(_request):
+    return Response(throttle_metrics())
+
+
 @api_view(["GET", "POST"])
 @permission_classes([IsTeacher])
+@replica_reads
 def exams_view(request):
     if request.method == "GET":
-        exams = (
-            Exam.objects.filter(created_by=request.user)
-            .annotate(question_count=Count("questions"))
-            .order_by("-created_at")
-        )
-        serializer = ExamSerializer(exams, many=True)
+        exams = Exam.objects.live().filter(created_by=request.user).with_question_count()
+        search = request.query_params.get("search", "").strip()
+        if search:
+            exams = exams.filter(Q(title__icontains=search) | Q(exam_code__icontains=search))
+        active = request.query_params.get("active")
+        if active is not None:
+            exams = exams.filter(is_active=active.lower() in {"1", "true", "yes"})
+        serializer_class = ExamSerializer
+        if request.query_params.get("fields") == "summary":
+            exams = exams.only(
+                "id", "title", "exam_code", "is_active", "starts_at", "created_at", "archived_at"
+            )
+            serializer_class = ExamListSerializer
+        if wants_page(request):
+            page, next_cursor = keyset_page(request, exams, descending=True)
+            return Response(
+                {"results": serializer_class(page, many=True).data, "next": next_cursor}
+            )
+        serializer = serializer_class(exams.order_by("-created_at", "-id"), many=True)
         return Response(serializer.data)
 
     serializer = ExamSerializer(data=request.data)
@@ -116,19 +197,43 @@ def exams_view(request):
 @api_view(["DELETE"])
 @permission_classes([IsTeacher])
 def exam_delete_view(request, exam_id: int):
-    exam = get_object_or_404(Exam, id=exam_id)
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id)
     if exam.created_by != request.user:
         return Response({"detail": "Forbidden."}, status=status.HTTP_403_FORBIDDEN)
-    exam.delete()
+    soft_delete_exam(exam)
     return Response(status=status.HTTP_204_NO_CONTENT)
 
 
+@api_view(["POST"])
+@permission_classes([IsTeacher])
+def exam_clone_view(request, exam_id: int):
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id, created_by=request.user)
+    title = request.data.get("title")
+    if title is not None and not isinstance(title, str):
+        return Response({"detail": "Title must be a string."}, status=status.HTTP_400_BAD_REQUEST)
+    clone = clone_exam(exam, request.user, title=title or None)
+    return Response(ExamSerializer(clone).data, status=status.HTTP_201_CREATED)
+
+
 @api_view(["PATCH"])
 @permission_classes([IsTeacher])
 def exam_status_view(request, exam_id: int):
-    exam = get_object_or_404(Exam, id=exam_id, created_by=request.user)
-    allowed_fields = {"is_active", "negative_marking_enabled", "negative_marks"}
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id, created_by=request.user)
+    allowed_fields = {
+        "is_active",
+        "negative_marking_enabled",
+        "negative_marks",
+        "duration_minutes",
+        "starts_at",
+        "shuffle_questions",
+        "shuffle_options",
+    }
     payload = {key: value for key, value in request.data.items() if key in allowed_fields}
+    if exam.archived_at:
+        return Response(
+            {"detail": "Archived exams cannot be changed."},
+            status=status.HTTP_409_CONFLICT,
+        )
     if not payload:
         return Response(
             {"detail": "No valid fields provided."},
@@ -139,6 +244,11 @@ def exam_status_view(request, exam_id: int):
             {"detail": "Negative marking settings cannot be changed after activation."},
             status=status.HTTP_400_BAD_REQUEST,
         )
+    if exam.is_active and ("shuffle_questions" in payload or "shuffle_options" in payload):
+        return Response(
+            {"detail": "Shuffling cannot be changed while the exam is active."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
     serializer = ExamSerializer(exam, data=payload, partial=True)
     if serializer.is_valid():
         serializer.save()
@@ -148,11 +258,21 @@ def exam_status_view(request, exam_id: int):
 
 @api_view(["GET", "POST"])
 @permission_classes([IsTeacher])
+@replica_reads
 def exam_questions_view(request, exam_id: int):
-    exam = get_object_or_404(Exam, id=exam_id, created_by=request.user)
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id, created_by=request.user)
     if request.method == "GET":
-        questions = exam.questions.order_by("created_at")
-        serializer = QuestionSerializer(questions, many=True)
+        questions = exam.questions.all()
+        serializer_class = QuestionSerializer
+        if request.query_params.get("fields") == "summary":
+            questions = questions.only("id", "exam_id", "correct_option", "marks", "created_at")
+            serializer_class = QuestionSummarySerializer
+        if wants_page(request):
+            page, next_cursor = keyset_page(request, questions)
+            return Response(
+                {"results": serializer_class(page, many=True).data, "next": next_cursor}
+            )
+        serializer = serializer_class(questions.order_by("created_at", "id"), many=True)
         return Response(serializer.data)
 
     payload = request.data.copy()
@@ -171,30 +291,116 @@ def exam_questions_view(request, exam_id: int):
 
 @api_view(["GET"])
 @permission_classes([IsTeacher])
+@replica_reads
 def exam_results_view(request, exam_id: int):
-    exam = get_object_or_404(Exam, id=exam_id, created_by=request.user)
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id, created_by=request.user)
     results = Result.objects.filter(attempt__exam=exam).select_related("attempt__student")
     serializer = ResultSerializer(results, many=True)
     return Response(serializer.data)
 
 
+@api_view(["GET"])
+@permission_classes([IsTeacher])
+@replica_reads
+def exam_item_analysis_view(request, exam_id: int):
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id, created_by=request.user)
+    if exam.archived_at:
+        return Response(
+            {"detail": "Item analysis needs the exam's answers; restore it from the archive."},
+            status=status.HTTP_409_CONFLICT,
+        )
+    return Response(get_item_analysis(exam))
+
+
+def _exam_snapshot_error(snapshot):
+    if not snapshot:
+        return Response(
+            {"detail": "Invalid exam code."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if not snapshot["is_active"]:
+        return Response(
+            {"detail": "Exam is inactive."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    return None
+
+
+def _waiting_room_response(data: dict, status_code: int = status.HTTP_200_OK):
+    response = Response(data, status=status_code)
+    if data["retry_after"]:
+        response["Retry-After"] = str(data["retry_after"])
+    return response
+
+
+@api_view(["GET"])
+@permission_classes([IsTeacher])
+@renderer_classes([JSONRenderer, EventStreamRenderer])
+def exam_events_view(request, exam_id: int):
+    """Stream ``joined`` and ``submitted`` events for one exam as Server-Sent Events.
+
+    Each open stream holds a gunicorn thread for up to
+    QUIZ_EVENT_STREAM_MAX_SECONDS, so a worker serves at most
+    QUIZ_EVENT_STREAMS_PER_WORKER of them and answers 503 beyond that. With
+    several workers (or the sweeper) events only cross processes through
+    Redis, so set REDIS_URL or run a single worker.
+    """
+    exam = get_object_or_404(Exam.objects.live(), id=exam_id, created_by=request.user)
+    try:
+        events = ExamEventStream(exam.id)
+    except EventStreamBusy:
+        response = Response(
+            {"detail": "Too many live streams open, retry shortly."},
+            status=status.HTTP_503_SERVICE_UNAVAILABLE,
+        )
+        response["Retry-After"] = "10"
+        return response
+    response = StreamingHttpResponse(events, content_type="text/event-stream")
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
 @api_view(["POST"])
 @permission_classes([IsStudent])
-def join_exam_view(request):
+def waiting_room_view(request):
     exam_code = request.data.get("exam_code")
     if not exam_code:
         return Response(
             {"detail": "Exam code is required"}, status=status.HTTP_400_BAD_REQUEST
         )
-    try:
-        exam = Exam.objects.get(exam_code=exam_code)
-    except Exam.DoesNotExist:
+    snapshot = get_exam_snapshot(exam_code)
+    error = _exam_snapshot_error(snapshot)
+    if error:
+        return error
+    state = admission(snapshot["id"], snapshot["starts_at"], request.user.id)
+    return _waiting_room_response({**state, "starts_at": snapshot["starts_at"]})
+
+
+@api_view(["POST"])
+@permission_classes([IsStudent])
+@throttle_classes([JoinThrottle])
+def join_exam_view(request):
+    exam_code = request.data.get("exam_code")
+    if not exam_code:
         return Response(
-            {"detail": "Invalid exam code."},
-            status=status.HTTP_400_BAD_REQUEST,
+            {"detail": "Exam code is required"}, status=status.HTTP_400_BAD_REQUEST
+        )
+    # Reject unknown, inactive and not-yet-admitted joins from the cache.
+    snapshot = get_exam_snapshot(exam_code)
+    error = _exam_snapshot_error(snapshot)
+    if error:
+        return error
+    state = admission(snapshot["id"], snapshot["starts_at"], request.user.id)
+    if state["status"] != "admitted":
+        return _waiting_room_response(
+            {"detail": "Waiting for admission.", **state}, status.HTTP_425_TOO_EARLY
         )
 
-    if not exam.is_active:
+    exam = Exam.objects.live().filter(id=snapshot["id"], is_active=True).first()
+    if exam is None:
+        # The cached snapshot was stale.
+        invalidate_exam_snapshot(exam_code)
         return Response(
             {"detail": "Exam is inactive."},
             status=status.HTTP_400_BAD_REQUEST,
@@ -206,7 +412,12 @@ def join_exam_view(request):
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    attempt = StudentExamAttempt.objects.create(exam=exam, student=request.user)
+    deadline = None
+    if exam.duration_minutes:
+        deadline = timezone.now() + timedelta(minutes=exam.duration_minutes)
+    attempt = StudentExamAttempt.objects.create(
+        exam=exam, student=request.user, deadline=deadline
+    )
     serializer = StudentExamAttemptSerializer(attempt)
     return Response(serializer.data, status=status.HTTP_201_CREATED)
 
@@ -215,99 +426,237 @@ def join_exam_view(request):
 @permission_classes([IsStudent])
 def attempt_questions_view(request, attempt_id: int):
     attempt = get_object_or_404(
-        StudentExamAttempt, id=attempt_id, student=request.user
+        StudentExamAttempt.objects.select_related("exam"),
+        id=attempt_id,
+        student=request.user,
+        exam__deleted_at__isnull=True,
     )
     if attempt.submitted_at:
         return Response(
             {"detail": "This attempt is already submitted."},
             status=status.HTTP_400_BAD_REQUEST,
         )
-    questions = attempt.exam.questions.order_by("created_at")
-    serializer = QuestionStudentSerializer(questions, many=True)
-    return Response(serializer.data)
+    if is_expired(attempt):
+        return Response(
+            {"detail": "Time limit exceeded."}, status=status.HTTP_400_BAD_REQUEST
+        )
+    # The paper is shared by every attempt; only the order is per attempt.
+    key = get_answer_key(attempt.exam)
+    shuffle = get_shuffle(attempt.exam, attempt.id, key)
+    return Response(shuffle_paper(get_student_paper(attempt.exam), key, shuffle))
 
 
-@api_view(["POST"])
+@api_view(["GET"])
 @permission_classes([IsStudent])
-def submit_attempt_view(request, attempt_id: int):
+def attempt_bundle_view(request, attempt_id: int):
     attempt = get_object_or_404(
-        StudentExamAttempt, id=attempt_id, student=request.user
+        StudentExamAttempt.objects.select_related("exam"),
+        id=attempt_id,
+        student=request.user,
+        exam__deleted_at__isnull=True,
     )
     if attempt.submitted_at:
         return Response(
             {"detail": "This attempt is already submitted."},
             status=status.HTTP_400_BAD_REQUEST,
         )
+    if is_expired(attempt):
+        return Response(
+            {"detail": "Time limit exceeded."}, status=status.HTTP_400_BAD_REQUEST
+        )
+    key = get_answer_key(attempt.exam)
+    return Response(build_bundle(attempt, key, get_shuffle(attempt.exam, attempt.id, key)))
+
+
+def _parse_answers(request, attempt, key):
+    """Validate the submitted answers against the exam's answer key.
+
+    Accepts either ``answers`` as a list of question/option pairs or a
+    ``packed`` string with the ``token`` of an offline bundle.
+    Returns ``(answer_map, None)`` or ``(None, error_response)``.
+    """
+    shuffle = get_shuffle(attempt.exam, attempt.id, key)
+    if "packed" in request.data:
+        try:
+            answer_map = parse_packed_answers(
+                attempt, key, shuffle, request.data["packed"], request.data.get("token")
+            )
+        except BundleError as exc:
+            return None, Response({"detail": str(exc)}, status=status.HTTP_400_BAD_REQUEST)
+        return unshuffle_answers(answer_map, key, shuffle), None
 
     answers = request.data.get("answers", [])
     if not isinstance(answers, list):
-        return Response(
+        return None, Response(
             {"detail": "Answers must be a list."}, status=status.HTTP_400_BAD_REQUEST
         )
 
-    questions = list(attempt.exam.questions.all())
-    question_ids = {q.id for q in questions}
-    serializer = StudentAnswerSerializer(data=answers, many=True)
+    serializer = SubmittedAnswerSerializer(data=answers, many=True)
     if not serializer.is_valid():
-        return Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
+        return None, Response(serializer.errors, status=status.HTTP_400_BAD_REQUEST)
 
-    payload_ids = [item["question"].id for item in serializer.validated_data]
+    payload_ids = [item["question"] for item in serializer.validated_data]
     payload_set = set(payload_ids)
     if len(payload_ids) != len(payload_set):
-        return Response(
+        return None, Response(
             {"detail": "Duplicate answers are not allowed."},
             status=status.HTTP_400_BAD_REQUEST,
         )
-    if not payload_set.issubset(question_ids):
-        return Response(
+    if not payload_set.issubset(key.ordinals()):
+        return None, Response(
             {"detail": "Answers must match exam questions."},
             status=status.HTTP_400_BAD_REQUEST,
         )
 
-    # Scoring: correct => +marks, wrong => -negative_marks if enabled, unattempted => 0.
-    # Total marks are not reduced by negative deductions and obtained marks never go below 0.
-    correct_map = {q.id: (q.correct_option, q.marks) for q in questions}
-    obtained = Decimal("0")
-    StudentAnswer.objects.filter(attempt=attempt).delete()
     answer_map = {
-        item["question"].id: item["selected_option"] for item in serializer.validated_data
+        item["question"]: item["selected_option"] for item in serializer.validated_data
     }
-    for question in questions:
-        selected = answer_map.get(question.id)
-        if not selected:
-            continue
-        StudentAnswer.objects.create(
-            attempt=attempt,
-            question_id=question.id,
-            selected_option=selected,
-        )
-        correct_option, marks = correct_map[question.id]
-        if selected == correct_option:
-            obtained += Decimal(marks)
-        elif attempt.exam.negative_marking_enabled:
-            obtained -= attempt.exam.negative_marks
-
-    total = Decimal(attempt.exam.total_marks)
-    if obtained < 0:
-        obtained = Decimal("0")
-    attempt.submitted_at = timezone.now()
-    attempt.save(update_fields=["submitted_at"])
-
-    result = Result.objects.create(
-        attempt=attempt, total_marks=total, obtained_marks=obtained
+    return unshuffle_answers(answer_map, key, shuffle), None
+
+
+@api_view(["PUT"])
+@permission_classes([IsStudent])
+def attempt_answers_view(request, attempt_id: int):
+    attempt = get_object_or_404(
+        StudentExamAttempt.objects.select_related("exam"),
+        id=attempt_id,
+        student=request.user,
+        exam__deleted_at__isnull=True,
     )
+    if attempt.submitted_at:
+        return Response(
+            {"detail": "This attempt is already submitted."},
+            status=status.HTTP_400_BAD_REQUEST,
+        )
+    if is_expired(attempt):
+        return Response(
+            {"detail": "Time limit exceeded."}, status=status.HTTP_400_BAD_REQUEST
+        )
 
-    return Response(ResultSerializer(result).data)
+    key = get_answer_key(attempt.exam)
+    answer_map, error = _parse_answers(request, attempt, key)
+    if error:
+        return error
+    with transaction.atomic():
+        # Lock the attempt and check again: a submit that claimed it since has
+        # graded the stored answers, and two saves must not interleave their
+        # delete and insert.
+        locked = (
+            StudentExamAttempt.objects.select_for_update()
+            .only("submitted_at")
+            .get(id=attempt.id)
+        )
+        if locked.submitted_at:
+            return Response(
+                {"detail": "This attempt is already submitted."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        save_answers(attempt, key, answer_map)
+    return Response({"saved": len(answer_map)})
 
 
-@api_view(["GET"])
+@api_view(["POST"])
 @permission_classes([IsStudent])
-def attempt_result_view(request, attempt_id: int):
+@throttle_classes([SubmitThrottle])
+def submit_attempt_view(request, attempt_id: int):
     attempt = get_object_or_404(
-        StudentExamAttempt, id=attempt_id, student=request.user
+        StudentExamAttempt.objects.select_related("exam"),
+        id=attempt_id,
+        student=request.user,
+        exam__deleted_at__isnull=True,
     )
-    if not hasattr(attempt, "result"):
+    # The result serializer and the submitted event read the student.
+    attempt.student = request.user
+    submission_key = request.headers.get("Idempotency-Key", "")[:64]
+    if attempt.submitted_at:
+        return _repeated_submission(attempt, submission_key)
+
+    exam = attempt.exam
+    key = get_answer_key(exam)
+    expired = is_expired(attempt)
+    answer_map = None
+    if not expired:
+        answer_map, error = _parse_answers(request, attempt, key)
+        if error:
+            return error
+
+    with transaction.atomic():
+        # Claim the attempt in one statement; a concurrent submit of the same
+        # attempt waits here and then updates nothing.
+        claimed = StudentExamAttempt.objects.filter(
+            id=attempt.id, submitted_at__isnull=True
+        ).update(submitted_at=timezone.now(), submission_key=submission_key)
+        if not claimed:
+            attempt.refresh_from_db(fields=["submitted_at", "submission_key"])
+            return _repeated_submission(attempt, submission_key)
+
+        if expired:
+            # Too late for new answers: grade whatever was saved before the deadline.
+            answer_map = load_answer_map(attempt, key)
+        else:
+            save_answers(attempt, key, answer_map)
+        result = Result.objects.create(
+            attempt=attempt,
+            total_marks=Decimal(exam.total_marks),
+            obtained_marks=score_answers(key, answer_map, exam),
+        )
+
+    entry = cache_results([result])[attempt.id]
+    return _result_response(request, entry)
+
+
+def _repeated_submission(attempt, submission_key: str):
+    """Replay the stored result for a retry carrying the original key."""
+    if not attempt.submitted_at:
         return Response(
-            {"detail": "Result not available."}, status=status.HTTP_404_NOT_FOUND
+            {"detail": "Submission in progress, retry shortly."},
+            status=status.HTTP_409_CONFLICT,
+        )
+    if submission_key and submission_key == attempt.submission_key:
+        entry = get_cached_result(attempt.id)
+        if entry is not None:
+            return Response(entry["data"])
+        result = (
+            Result.objects.filter(attempt=attempt)
+            .select_related("attempt__student")
+            .first()
+        )
+        if result is not None:
+            return Response(ResultSerializer(result).data)
+    return Response(
+        {"detail": "This attempt is already submitted."},
+        status=status.HTTP_400_BAD_REQUEST,
+    )
+
+
+def _result_response(request, entry: dict):
+    if request.headers.get("If-None-Match") == entry["etag"]:
+        response = HttpResponseNotModified()
+    else:
+        response = Response(entry["data"])
+    response["ETag"] = entry["etag"]
+    response["Cache-Control"] = f"private, max-age={settings.QUIZ_RESULT_MAX_AGE}"
+    return response
+
+
+@api_view(["GET"])
+@permission_classes([IsStudent])
+def attempt_result_view(request, attempt_id: int):
+    # Results are immutable until a regrade evicts them, so with a shared
+    # cache (QUIZ_RESULT_CACHE) an entry is served without touching the database.
+    entry = get_cached_result(attempt_id)
+    if entry is None:
+        attempt = get_object_or_404(
+            StudentExamAttempt.objects.select_related("result", "student"),
+            id=attempt_id,
+            student=request.user,
+            exam__deleted_at__isnull=True,
         )
-    return Response(ResultSerializer(attempt.result).data)
+        if not hasattr(attempt, "result"):
+            return Response(
+                {"detail": "Result not available."}, status=status.HTTP_404_NOT_FOUND
+            )
+        entry = cache_results([attempt.result])[attempt.id]
+    elif entry["student_id"] != request.user.id:
+        return Response({"detail": "Not found."}, status=status.HTTP_404_NOT_FOUND)
+    return _result_response(request, entry)
@@ -0,0 +1,76 @@
+import math
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from .models import Exam
+
+SNAPSHOT_CACHE_KEY = "quiz:exam-code:{exam_code}"
+TICKET_COUNTER_KEY = "quiz:waiting-room:{exam_id}:counter"
+TICKET_KEY = "quiz:waiting-room:{exam_id}:{user_id}"
+
+
+def get_exam_snapshot(exam_code: str) -> dict | None:
+    """The few exam fields the waiting room needs, cached by exam code."""
+    cache_key = SNAPSHOT_CACHE_KEY.format(exam_code=exam_code)
+    snapshot = cache.get(cache_key)
+    if snapshot is None:
+        exam = (
+            Exam.objects.live()
+            .filter(exam_code=exam_code)
+            .values("id", "is_active", "starts_at")
+            .first()
+        )
+        # Unknown codes are cached too, so guessing does not reach the database.
+        snapshot = exam or {}
+        cache.set(cache_key, snapshot, settings.QUIZ_WAITING_ROOM_SNAPSHOT_TIMEOUT)
+    return snapshot or None
+
+
+def invalidate_exam_snapshot(exam_code: str) -> None:
+    cache.delete(SNAPSHOT_CACHE_KEY.format(exam_code=exam_code))
+
+
+def _ticket(exam_id: int, user_id: int) -> int:
+    """The student's place in the queue, handed out on first arrival."""
+    ticket_key = TICKET_KEY.format(exam_id=exam_id, user_id=user_id)
+    ticket = cache.get(ticket_key)
+    if ticket is None:
+        counter_key = TICKET_COUNTER_KEY.format(exam_id=exam_id)
+        timeout = settings.QUIZ_WAITING_ROOM_TICKET_TIMEOUT
+        cache.add(counter_key, 0, timeout)
+        ticket = cache.incr(counter_key)
+        if not cache.add(ticket_key, ticket, timeout):
+            ticket = cache.get(ticket_key, ticket)
+    return ticket
+
+
+def admission(exam_id: int, starts_at, user_id: int, now=None) -> dict:
+    """Queue state of ``user_id`` for an exam scheduled at ``starts_at``.
+
+    Admission slots open at QUIZ_WAITING_ROOM_RATE per second from the
+    scheduled start; ticket ``n`` is admitted once ``n`` slots are open.
+    """
+    if starts_at is None:
+        return {"status": "admitted", "position": 0, "retry_after": 0}
+    now = now or timezone.now()
+    ticket = _ticket(exam_id, user_id)
+    rate = settings.QUIZ_WAITING_ROOM_RATE
+    max_poll = settings.QUIZ_WAITING_ROOM_MAX_POLL
+    elapsed = (now - starts_at).total_seconds()
+    if elapsed < 0:
+        return {
+            "status": "scheduled",
+            "position": ticket,
+            "retry_after": min(math.ceil(-elapsed), max_poll),
+        }
+    open_slots = int(elapsed * rate)
+    if ticket <= open_slots:
+        return {"status": "admitted", "position": 0, "retry_after": 0}
+    ahead = ticket - open_slots
+    return {
+        "status": "waiting",
+        "position": ahead,
+        "retry_after": min(max(math.ceil(ahead / rate), 1), max_poll),
+    }
@@ -1,13 +1,15 @@
 import React from "react";
 
 import { api } from "./api";
-import type { UserProfile } from "./types";
+import type { Bootstrap, UserProfile } from "./types";
 
 type AuthContextValue = {
   user: UserProfile | null;
   setUser: (user: UserProfile | null) => void;
   loading: boolean;
   logout: () => Promise<void>;
+  // The page-load bootstrap payload, handed to the first page that asks for it.
+  takeBootstrap: () => Bootstrap | null;
 };
 
 const AuthContext = React.createContext<AuthContextValue | undefined>(undefined);
@@ -15,13 +17,16 @@ const AuthContext = React.createContext<AuthContextValue | undefined>(undefined)
 export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children }) => {
   const [user, setUser] = React.useState<UserProfile | null>(null);
   const [loading, setLoading] = React.useState(true);
+  const bootstrapRef = React.useRef<Bootstrap | null>(null);
 
   React.useEffect(() => {
+    // One request on page load: the profile plus the landing page's data.
+    // The CSRF cookie is fetched on demand before the first unsafe request.
     const init = async () => {
       try {
-        await api.csrf();
-        const me = await api.me();
-        setUser(me);
+        const data = await api.bootstrap();
+        bootstrapRef.current = data;
+        setUser(data.profile);
       } catch {
         setUser(null);
       } finally {
@@ -35,12 +40,19 @@ export const AuthProvider: React.FC<{ children: React.ReactNode }> = ({ children
     try {
       await api.logout();
     } finally {
+      bootstrapRef.current = null;
       setUser(null);
     }
   };
 
+  const takeBootstrap = React.useCallback(() => {
+    const data = bootstrapRef.current;
+    bootstrapRef.current = null;
+    return data;
+  }, []);
+
   return (
-    <AuthContext.Provider value={{ user, setUser, loading, logout }}>
+    <AuthContext.Provider value={{ user, setUser, loading, logout, takeBootstrap }}>
       {children}
     </AuthContext.Provider>
   );
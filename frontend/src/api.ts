@@ -1,6 +1,18 @@
 import axios, { AxiosError, AxiosRequestConfig } from "axios";
 
-import type { Attempt, Exam, Question, Result, UserProfile } from "./types";
+import type {
+  Attempt,
+  Bootstrap,
+  CursorPage,
+  Exam,
+  ExamBundle,
+  ExamListItem,
+  ExamListParams,
+  Question,
+  Result,
+  UserProfile,
+  WaitingRoomState
+} from "./types";
 
 class ApiError extends Error {
   status: number;
@@ -78,6 +90,17 @@ const request = async <T>(config: AxiosRequestConfig): Promise<T> => {
   }
 };
 
+// One key per attempt and tab, so retries and double clicks replay the stored result.
+const submissionKey = (attemptId: number) => {
+  const storageKey = `submission-key-${attemptId}`;
+  let key = sessionStorage.getItem(storageKey);
+  if (!key) {
+    key = `${attemptId}-${Date.now()}-${Math.random().toString(36).slice(2)}`;
+    sessionStorage.setItem(storageKey, key);
+  }
+  return key;
+};
+
 export const api = {
   csrf: () => request<{ detail: string }>({ url: "/auth/csrf/", method: "GET" }),
   login: async (username: string, password: string) => {
@@ -115,11 +138,26 @@ export const api = {
     }
   },
   me: () => request<UserProfile>({ url: "/auth/me/", method: "GET" }),
+  bootstrap: () => request<Bootstrap>({ url: "/bootstrap/", method: "GET" }),
   listExams: () => request<Exam[]>({ url: "/exams/", method: "GET" }),
+  listExamPage: (params: ExamListParams = {}) =>
+    request<CursorPage<ExamListItem>>({
+      url: "/exams/",
+      method: "GET",
+      params: { fields: "summary", limit: 25, ...params }
+    }),
   deleteExam: async (examId: number) => {
     await ensureCsrf();
     return request<void>({ url: `/exams/${examId}/`, method: "DELETE" });
   },
+  cloneExam: async (examId: number, title?: string) => {
+    await ensureCsrf();
+    return request<Exam>({
+      url: `/exams/${examId}/clone/`,
+      method: "POST",
+      data: title ? { title } : {}
+    });
+  },
   createExam: async (payload: {
     title: string;
     exam_code: string;
@@ -135,6 +173,8 @@ export const api = {
       is_active?: boolean;
       negative_marking_enabled?: boolean;
       negative_marks?: number;
+      duration_minutes?: number | null;
+      starts_at?: string | null;
     }
   ) => {
     await ensureCsrf();
@@ -156,6 +196,16 @@ export const api = {
   },
   getResults: (examId: number) =>
     request<Result[]>({ url: `/exams/${examId}/results/`, method: "GET" }),
+  // Server-Sent Events of ExamEvent; open with EventSource (withCredentials).
+  examEventsUrl: (examId: number) => `${API_BASE}/exams/${examId}/events/`,
+  waitingRoom: async (exam_code: string) => {
+    await ensureCsrf();
+    return request<WaitingRoomState>({
+      url: "/exams/waiting-room/",
+      method: "POST",
+      data: { exam_code }
+    });
+  },
   joinExam: async (exam_code: string) => {
     await ensureCsrf();
     return request<Attempt>({
@@ -169,6 +219,22 @@ export const api = {
       url: `/attempts/${attemptId}/questions/`,
       method: "GET"
     }),
+  getAttemptBundle: (attemptId: number) =>
+    request<ExamBundle>({
+      url: `/attempts/${attemptId}/bundle/`,
+      method: "GET"
+    }),
+  saveAnswers: async (
+    attemptId: number,
+    answers: { question: number; selected_option: string }[]
+  ) => {
+    await ensureCsrf();
+    return request<{ saved: number }>({
+      url: `/attempts/${attemptId}/answers/`,
+      method: "PUT",
+      data: { answers }
+    });
+  },
   submitAttempt: async (
     attemptId: number,
     answers: { question: number; selected_option: string }[]
@@ -177,7 +243,18 @@ export const api = {
     return request<Result>({
       url: `/attempts/${attemptId}/submit/`,
       method: "POST",
-      data: { answers }
+      data: { answers },
+      headers: { "Idempotency-Key": submissionKey(attemptId) }
+    });
+  },
+  // `packed` holds one letter per bundle question in order, "-" when skipped.
+  submitPacked: async (attemptId: number, packed: string, token: string) => {
+    await ensureCsrf();
+    return request<Result>({
+      url: `/attempts/${attemptId}/submit/`,
+      method: "POST",
+      data: { packed, token },
+      headers: { "Idempotency-Key": submissionKey(attemptId) }
     });
   },
   getAttemptResult: (attemptId: number) =>
@@ -4,6 +4,22 @@ import { useLocation, useNavigate, useParams } from "react-router-dom";
 import { api, ApiError } from "../api";
 import type { Attempt, Question } from "../types";
 
+// Answers are saved on the server this often while they change, so a submit
+// that arrives after the deadline is still graded from recent answers.
+const AUTOSAVE_INTERVAL_MS = 15000;
+
+const answersStorageKey = (attemptId: number) => `answers-${attemptId}`;
+
+const formatRemaining = (milliseconds: number) => {
+  const totalSeconds = Math.max(0, Math.floor(milliseconds / 1000));
+  const hours = Math.floor(totalSeconds / 3600);
+  const minutes = Math.floor((totalSeconds % 3600) / 60);
+  const seconds = String(totalSeconds % 60).padStart(2, "0");
+  return hours > 0
+    ? `${hours}:${String(minutes).padStart(2, "0")}:${seconds}`
+    : `${minutes}:${seconds}`;
+};
+
 const StudentExamPage: React.FC = () => {
   const params = useParams();
   const attemptId = Number(params.attemptId);
@@ -11,7 +27,22 @@ const StudentExamPage: React.FC = () => {
   const location = useLocation();
 
   const [questions, setQuestions] = React.useState<Question[]>([]);
-  const [answers, setAnswers] = React.useState<Record<number, string>>({});
+  // Kept in sessionStorage so a reload neither loses them nor autosaves a
+  // smaller set over what the server already has.
+  const [answers, setAnswers] = React.useState<Record<number, string>>(() => {
+    try {
+      const stored = sessionStorage.getItem(answersStorageKey(attemptId));
+      return stored ? (JSON.parse(stored) as Record<number, string>) : {};
+    } catch {
+      return {};
+    }
+  });
+  const [now, setNow] = React.useState(() => Date.now());
+  const [saveState, setSaveState] = React.useState<"idle" | "saving" | "saved" | "failed">(
+    "idle"
+  );
+  const dirtyRef = React.useRef(false);
+  const autoSubmittedRef = React.useRef(false);
   const [loading, setLoading] = React.useState(true);
   const [submitting, setSubmitting] = React.useState(false);
   const [error, setError] = React.useState<string | null>(null);
@@ -31,10 +62,21 @@ const StudentExamPage: React.FC = () => {
       const stored = sessionStorage.getItem(`attempt-${attemptId}`);
       if (stored) {
         setAttemptInfo(JSON.parse(stored) as Attempt);
+        return;
       }
     } catch {
       // Ignore storage errors.
     }
+    // Reloaded without the join state: the open attempt (with its deadline)
+    // comes with the bootstrap payload.
+    api
+      .bootstrap()
+      .then((data) => {
+        if (data.active_attempt?.id === attemptId) {
+          setAttemptInfo(data.active_attempt);
+        }
+      })
+      .catch(() => undefined);
   }, [attemptId, attemptInfo]);
 
   React.useEffect(() => {
@@ -80,26 +122,99 @@ const StudentExamPage: React.FC = () => {
     return () => window.removeEventListener("beforeunload", handler);
   }, [questions.length]);
 
+  const deadline = attemptInfo?.deadline ? new Date(attemptInfo.deadline).getTime() : null;
+  const remaining = deadline !== null ? deadline - now : null;
+  const timeUp = remaining !== null && remaining <= 0;
+
+  React.useEffect(() => {
+    if (deadline === null) {
+      return;
+    }
+    const timer = window.setInterval(() => setNow(Date.now()), 1000);
+    return () => window.clearInterval(timer);
+  }, [deadline]);
+
+  const answerPayload = React.useCallback(
+    () =>
+      Object.entries(answers)
+        .filter(([, selected]) => selected)
+        .map(([question, selected]) => ({
+          question: Number(question),
+          selected_option: selected
+        })),
+    [answers]
+  );
+
+  const saveNow = React.useCallback(async () => {
+    if (!dirtyRef.current) {
+      return;
+    }
+    dirtyRef.current = false;
+    setSaveState("saving");
+    try {
+      await api.saveAnswers(attemptId, answerPayload());
+      setSaveState("saved");
+    } catch {
+      dirtyRef.current = true;
+      setSaveState("failed");
+    }
+  }, [attemptId, answerPayload]);
+
+  React.useEffect(() => {
+    if (questions.length === 0 || timeUp) {
+      return;
+    }
+    const timer = window.setInterval(saveNow, AUTOSAVE_INTERVAL_MS);
+    const onHidden = () => {
+      if (document.visibilityState === "hidden") {
+        saveNow();
+      }
+    };
+    document.addEventListener("visibilitychange", onHidden);
+    return () => {
+      window.clearInterval(timer);
+      document.removeEventListener("visibilitychange", onHidden);
+    };
+  }, [questions.length, timeUp, saveNow]);
+
   const onSelect = (questionId: number, value: string) => {
-    setAnswers((prev) => ({ ...prev, [questionId]: value }));
+    dirtyRef.current = true;
+    setAnswers((prev) => {
+      const next = { ...prev, [questionId]: value };
+      try {
+        sessionStorage.setItem(answersStorageKey(attemptId), JSON.stringify(next));
+      } catch {
+        // Ignore storage errors.
+      }
+      return next;
+    });
   };
 
-  const onSubmit = async () => {
+  const onSubmit = React.useCallback(async () => {
     setError(null);
     setSubmitting(true);
     try {
-      const payload = questions.map((question) => ({
-        question: question.id,
-        selected_option: answers[question.id]
-      }));
-      const result = await api.submitAttempt(attemptId, payload);
+      const result = await api.submitAttempt(attemptId, answerPayload());
+      try {
+        sessionStorage.removeItem(answersStorageKey(attemptId));
+      } catch {
+        // Ignore storage errors.
+      }
       navigate(`/student/results/${attemptId}`, { state: result });
     } catch (err) {
       setError(err instanceof ApiError ? err.message : "Unable to submit exam.");
     } finally {
       setSubmitting(false);
     }
-  };
+  }, [attemptId, answerPayload, navigate]);
+
+  React.useEffect(() => {
+    // Submit at the deadline; the server's grace period absorbs the latency.
+    if (timeUp && questions.length > 0 && !autoSubmittedRef.current) {
+      autoSubmittedRef.current = true;
+      onSubmit();
+    }
+  }, [timeUp, questions.length, onSubmit]);
 
   const allAnswered = questions.length > 0 && questions.every((q) => answers[q.id]);
   const totalQuestions = questions.length;
@@ -120,10 +235,26 @@ const StudentExamPage: React.FC = () => {
               {attemptInfo?.exam_title ?? "Student Exam"}
             </h1>
           </div>
-          <div className="text-sm text-slate-300">
-            {totalQuestions > 0
-              ? `Question ${progressIndex} of ${totalQuestions}`
-              : "Preparing questions"}
+          <div className="flex items-center gap-4 text-sm text-slate-300">
+            {saveState === "saved" ? <span className="text-slate-500">Saved</span> : null}
+            {saveState === "failed" ? <span className="text-amber-300">Not saved</span> : null}
+            {remaining !== null ? (
+              <span
+                className={`rounded-md px-2 py-0.5 font-mono font-semibold ${
+                  remaining < 5 * 60 * 1000
+                    ? "bg-rose-500/15 text-rose-300"
+                    : "bg-slate-800 text-slate-200"
+                }`}
+                title={`Due ${new Date(deadline as number).toLocaleTimeString()}`}
+              >
+                {timeUp ? "Time is up" : `${formatRemaining(remaining)} left`}
+              </span>
+            ) : null}
+            <span>
+              {totalQuestions > 0
+                ? `Question ${progressIndex} of ${totalQuestions}`
+                : "Preparing questions"}
+            </span>
           </div>
         </div>
       </div>
@@ -190,7 +321,7 @@ const StudentExamPage: React.FC = () => {
           <button
             className="inline-flex items-center justify-center rounded-lg bg-indigo-600 px-4 py-2 text-sm font-semibold text-white hover:bg-indigo-500 focus:outline-none focus:ring-2 focus:ring-indigo-400 focus:ring-offset-2 focus:ring-offset-slate-950 disabled:cursor-not-allowed disabled:bg-slate-700"
             onClick={onSubmit}
-            disabled={loading || !allAnswered || submitting}
+            disabled={loading || submitting || (!allAnswered && !timeUp)}
           >
             {submitting ? "Submitting..." : "Submit Exam"}
           </button>
@@ -2,27 +2,79 @@ import React from "react";
 import { useNavigate } from "react-router-dom";
 
 import { api, ApiError } from "../api";
+import { useAuth } from "../AuthContext";
+import type { Attempt, WaitingRoomState } from "../types";
+
+const rememberAttempt = (attempt: Attempt) => {
+  try {
+    sessionStorage.setItem(`attempt-${attempt.id}`, JSON.stringify(attempt));
+  } catch {
+    // Ignore storage errors (private mode, quota, etc.).
+  }
+};
 
 const StudentJoinPage: React.FC = () => {
   const navigate = useNavigate();
+  const { takeBootstrap } = useAuth();
   const [examCode, setExamCode] = React.useState("");
   const [error, setError] = React.useState<string | null>(null);
   const [loading, setLoading] = React.useState(false);
+  const [activeAttempt, setActiveAttempt] = React.useState<Attempt | null>(null);
+  const [waiting, setWaiting] = React.useState<WaitingRoomState | null>(null);
+  const retryTimer = React.useRef<number | undefined>(undefined);
 
-  const onSubmit = async (event: React.FormEvent) => {
-    event.preventDefault();
-    setError(null);
-    setLoading(true);
-    try {
-      const attempt = await api.joinExam(examCode.toUpperCase());
+  const stopWaiting = React.useCallback(() => {
+    window.clearTimeout(retryTimer.current);
+    retryTimer.current = undefined;
+    setWaiting(null);
+  }, []);
+
+  React.useEffect(() => () => window.clearTimeout(retryTimer.current), []);
+
+  React.useEffect(() => {
+    const load = async () => {
       try {
-        sessionStorage.setItem(`attempt-${attempt.id}`, JSON.stringify(attempt));
+        const data = takeBootstrap() ?? (await api.bootstrap());
+        setActiveAttempt(data.active_attempt ?? null);
       } catch {
-        // Ignore storage errors (private mode, quota, etc.).
+        // Joining still works without the resume shortcut.
       }
-      navigate(`/student/exams/${attempt.id}`);
+    };
+    load();
+  }, [takeBootstrap]);
+
+  const resume = (attempt: Attempt) => {
+    rememberAttempt(attempt);
+    navigate(`/student/exams/${attempt.id}`);
+  };
+
+  // Before a scheduled exam opens, join answers 425 with the student's place
+  // in the waiting room; keep the ticket alive by retrying after retry_after.
+  const join = async (code: string) => {
+    try {
+      const attempt = await api.joinExam(code);
+      setWaiting(null);
+      resume(attempt);
     } catch (err) {
+      const state = err instanceof ApiError ? (err.data as WaitingRoomState | undefined) : undefined;
+      if (err instanceof ApiError && err.status === 425 && state?.status) {
+        setWaiting(state);
+        const delay = Math.min(Math.max(state.retry_after, 1), 30) * 1000;
+        retryTimer.current = window.setTimeout(() => join(code), delay);
+        return;
+      }
+      setWaiting(null);
       setError(err instanceof ApiError ? err.message : "Unable to join exam.");
+    }
+  };
+
+  const onSubmit = async (event: React.FormEvent) => {
+    event.preventDefault();
+    stopWaiting();
+    setError(null);
+    setLoading(true);
+    try {
+      await join(examCode.toUpperCase());
     } finally {
       setLoading(false);
     }
@@ -35,16 +87,44 @@ const StudentJoinPage: React.FC = () => {
           <h1 className="text-2xl font-semibold text-slate-100">Join Exam</h1>
           <p className="mt-2 text-sm text-slate-400">Enter your exam code to begin.</p>
         </div>
+        {activeAttempt ? (
+          <div className="mb-6 rounded-lg border border-indigo-500/40 bg-indigo-500/10 px-4 py-3 text-sm text-slate-200">
+            <p>
+              You have an exam in progress: <span className="font-semibold">{activeAttempt.exam_title}</span>
+            </p>
+            <button
+              className="mt-3 inline-flex items-center justify-center rounded-lg bg-indigo-600 px-3 py-1.5 text-sm font-semibold text-white hover:bg-indigo-500 focus:outline-none focus:ring-2 focus:ring-indigo-400 focus:ring-offset-2 focus:ring-offset-slate-950"
+              type="button"
+              onClick={() => resume(activeAttempt)}
+            >
+              Resume exam
+            </button>
+          </div>
+        ) : null}
         <form className="flex flex-col gap-4" onSubmit={onSubmit}>
           <label className="flex flex-col gap-2 text-sm font-medium text-slate-200">
             Exam Code
             <input
               className="h-12 w-full rounded-lg border border-slate-700 bg-slate-900 px-3 text-sm text-slate-100 uppercase placeholder:text-slate-500 focus:outline-none focus:ring-2 focus:ring-indigo-500"
               value={examCode}
-              onChange={(event) => setExamCode(event.target.value)}
+              onChange={(event) => {
+                stopWaiting();
+                setExamCode(event.target.value);
+              }}
               required
             />
           </label>
+          {waiting ? (
+            <div className="rounded-lg border border-slate-800 bg-slate-950/60 px-4 py-3 text-sm text-slate-300">
+              {waiting.status === "scheduled" && waiting.starts_at
+                ? `The exam opens at ${new Date(waiting.starts_at).toLocaleTimeString()}.`
+                : "You are in the waiting room."}{" "}
+              {waiting.status === "waiting" && waiting.position > 0
+                ? `${waiting.position} ahead of you. `
+                : ""}
+              You will be let in automatically; keep this page open.
+            </div>
+          ) : null}
           {error ? (
             error === "Already attempted." ? (
               <div className="rounded-lg border border-slate-800 bg-slate-950/60 px-4 py-3 text-sm text-slate-300">
@@ -57,9 +137,9 @@ const StudentJoinPage: React.FC = () => {
           <button
             className="mt-2 inline-flex w-full items-center justify-center rounded-lg bg-indigo-600 px-4 py-2 text-sm font-semibold text-white hover:bg-indigo-500 focus:outline-none focus:ring-2 focus:ring-indigo-400 focus:ring-offset-2 focus:ring-offset-slate-950 disabled:cursor-not-allowed disabled:bg-slate-700"
             type="submit"
-            disabled={loading}
+            disabled={loading || waiting !== null}
           >
-            {loading ? "Joining..." : "Join Exam"}
+            {loading ? "Joining..." : waiting ? "Waiting..." : "Join Exam"}
           </button>
         </form>
       </div>
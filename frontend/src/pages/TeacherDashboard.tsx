@@ -2,6 +2,7 @@ import React from "react";
 import { Link } from "react-router-dom";
 
 import { api, ApiError } from "../api";
+import { useAuth } from "../AuthContext";
 import type { Exam } from "../types";
 
 type ExamResult = {
@@ -31,6 +32,7 @@ const getExamStatus = (exam: Exam) => {
 };
 
 const TeacherDashboard: React.FC = () => {
+  const { takeBootstrap } = useAuth();
   const [exams, setExams] = React.useState<Exam[]>([]);
   const [error, setError] = React.useState<string | null>(null);
   const [loading, setLoading] = React.useState(true);
@@ -44,7 +46,7 @@ const TeacherDashboard: React.FC = () => {
   React.useEffect(() => {
     const load = async () => {
       try {
-        const data = await api.listExams();
+        const { exams: data = [] } = takeBootstrap() ?? (await api.bootstrap());
         setExams(data);
         const nextSettings: Record<number, { enabled: boolean; negativeMarks: number }> = {};
         data.forEach((exam) => {
@@ -61,7 +63,7 @@ const TeacherDashboard: React.FC = () => {
       }
     };
     load();
-  }, []);
+  }, [takeBootstrap]);
 
   const updateSetting = (
     examId: number,
@@ -2,7 +2,12 @@ import React from "react";
 import { useParams } from "react-router-dom";
 
 import { api, ApiError } from "../api";
-import type { Result } from "../types";
+import type { ExamEvent, Result } from "../types";
+
+// Used when the live stream is refused (503 once a worker's streams are all
+// taken) or unsupported; the stream is tried again after STREAM_RETRY_MS.
+const POLL_INTERVAL_MS = 15000;
+const STREAM_RETRY_MS = 60000;
 
 const TeacherResultsPage: React.FC = () => {
   const params = useParams();
@@ -10,6 +15,7 @@ const TeacherResultsPage: React.FC = () => {
   const [results, setResults] = React.useState<Result[]>([]);
   const [loading, setLoading] = React.useState(true);
   const [error, setError] = React.useState<string | null>(null);
+  const [feed, setFeed] = React.useState<"connecting" | "live" | "polling">("connecting");
   const firstResult = results[0] as (Result & { exam_code?: string }) | undefined;
   const examCode = firstResult?.exam_code ?? String(examId);
 
@@ -46,24 +52,94 @@ const TeacherResultsPage: React.FC = () => {
     URL.revokeObjectURL(url);
   };
 
+  const refresh = React.useCallback(async () => {
+    try {
+      const data = await api.getResults(examId);
+      setResults(data);
+      setError(null);
+    } catch (err) {
+      setError(err instanceof ApiError ? err.message : "Unable to load results.");
+    } finally {
+      setLoading(false);
+    }
+  }, [examId]);
+
+  React.useEffect(() => {
+    if (!examId) {
+      setError("Invalid exam id.");
+      setLoading(false);
+      return;
+    }
+    refresh();
+  }, [examId, refresh]);
+
+  // New submissions arrive over Server-Sent Events; polling takes over while
+  // the stream is unavailable.
   React.useEffect(() => {
-    const load = async () => {
-      if (!examId) {
-        setError("Invalid exam id.");
-        setLoading(false);
+    if (!examId) {
+      return;
+    }
+    let source: EventSource | null = null;
+    let pollTimer: number | undefined;
+    let retryTimer: number | undefined;
+    let opened = false;
+
+    const startPolling = () => {
+      setFeed("polling");
+      window.clearInterval(pollTimer);
+      pollTimer = window.setInterval(refresh, POLL_INTERVAL_MS);
+      retryTimer = window.setTimeout(connect, STREAM_RETRY_MS);
+    };
+
+    const onSubmitted = (message: MessageEvent<string>) => {
+      const event = JSON.parse(message.data) as Extract<ExamEvent, { type: "submitted" }>;
+      const result: Result = {
+        student_username: event.student_username,
+        total_marks: event.total_marks,
+        obtained_marks: event.obtained_marks,
+        graded_at: event.graded_at
+      };
+      setResults((previous) => [
+        ...previous.filter((item) => item.student_username !== result.student_username),
+        result
+      ]);
+    };
+
+    function connect() {
+      if (typeof EventSource === "undefined") {
+        startPolling();
         return;
       }
-      try {
-        const data = await api.getResults(examId);
-        setResults(data);
-      } catch (err) {
-        setError(err instanceof ApiError ? err.message : "Unable to load results.");
-      } finally {
-        setLoading(false);
-      }
+      window.clearInterval(pollTimer);
+      source = new EventSource(api.examEventsUrl(examId), { withCredentials: true });
+      source.addEventListener("open", () => {
+        setFeed("live");
+        // Catch up on anything submitted while disconnected.
+        if (opened) {
+          refresh();
+        }
+        opened = true;
+      });
+      source.addEventListener("submitted", onSubmitted as EventListener);
+      source.addEventListener("error", () => {
+        // A refused response (e.g. 503) closes the source for good; dropped
+        // connections reconnect on their own.
+        if (source?.readyState === EventSource.CLOSED) {
+          source = null;
+          startPolling();
+        } else {
+          setFeed("connecting");
+        }
+      });
+    }
+
+    connect();
+    return () => {
+      source?.close();
+      window.clearInterval(pollTimer);
+      window.clearTimeout(retryTimer);
     };
-    load();
-  }, [examId]);
+  }, [examId, refresh]);
 
   return (
     <div className="-mx-4 -my-6 min-h-[calc(100vh-4rem)] bg-slate-950 px-4 py-10 text-slate-100 sm:-mx-6 sm:px-6">
@@ -74,6 +150,13 @@ const TeacherResultsPage: React.FC = () => {
           <p className="mt-1 text-sm text-slate-300">
             Exam ID: {Number.isNaN(examId) ? "-" : examId}
           </p>
+          <p className="mt-1 text-xs text-slate-400">
+            {feed === "live"
+              ? "Live: new submissions appear automatically"
+              : feed === "polling"
+                ? "Refreshing every 15 seconds"
+                : "Connecting…"}
+          </p>
         </div>
         <button
           className="inline-flex items-center justify-center rounded-lg border border-slate-600 bg-slate-900/60 px-3 py-2 text-sm font-semibold text-slate-200 hover:border-slate-500 hover:text-slate-100 focus:outline-none focus:ring-2 focus:ring-slate-400 focus:ring-offset-2 focus:ring-offset-slate-950 disabled:cursor-not-allowed disabled:border-slate-700 disabled:text-slate-500"
@@ -13,10 +13,46 @@ export type Exam = {
   negative_marking_enabled: boolean;
   negative_marks: number;
   total_marks: number;
+  starts_at?: string | null;
+  duration_minutes?: number | null;
+  shuffle_questions?: boolean;
+  shuffle_options?: boolean;
   created_at: string;
+  archived_at?: string | null;
   question_count?: number;
 };
 
+export type ExamListItem = Pick<
+  Exam,
+  "id" | "title" | "exam_code" | "is_active" | "starts_at" | "created_at" | "archived_at"
+> & {
+  question_count: number;
+};
+
+export type ExamListParams = {
+  cursor?: string;
+  limit?: number;
+  search?: string;
+  active?: boolean;
+};
+
+export type CursorPage<T> = {
+  results: T[];
+  next: string | null;
+};
+
+export type ExamSummary = Exam & {
+  attempt_count: number;
+  submitted_count: number;
+  average_marks: string | null;
+};
+
+export type Bootstrap = {
+  profile: UserProfile;
+  exams?: ExamSummary[];
+  active_attempt?: Attempt | null;
+};
+
 export type Question = {
   id: number;
   exam?: number;
@@ -38,12 +74,31 @@ export type Attempt = {
   exam_negative_marking_enabled?: boolean;
   exam_negative_marks?: string;
   started_at: string;
+  deadline?: string | null;
   submitted_at: string | null;
 };
 
+export type ExamBundle = {
+  attempt: Attempt;
+  questions: Question[];
+  paper_digest: string;
+  token: string;
+};
+
 export type Result = {
   student_username?: string;
   total_marks: string;
   obtained_marks: string;
   graded_at: string;
 };
+
+export type ExamEvent =
+  | { id: number; type: "joined"; attempt: number; student_username: string; started_at: string }
+  | ({ id: number; type: "submitted"; attempt: number } & Result);
+
+export type WaitingRoomState = {
+  status: "scheduled" | "waiting" | "admitted";
+  position: number;
+  retry_after: number;
+  starts_at?: string | null;
+};